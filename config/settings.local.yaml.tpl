@@ -70,6 +70,9 @@
 #        api_url: "https://api.kubernetes3.com"
 #        token: "KUADRANT_RULEZ"
 #        kubeconfig_path: "~/.kube/config3"
+#    transport: "oc"                               # How to talk to the clusters: 'oc' forks oc binary for each operation, 'api' uses pooled HTTP/2 connection to the API server
+#    informer_cache: false                         # Serve Policies, Gateways and Routes from a watch-based cache shared by the whole session, requires 'api' transport
+#    gateway_pool_size: 0                          # Number of Gateways provisioned in the background at the start of the session and leased to test modules
 #    slow_loadbalancers: false                     # For use in Openshift on AWS: If true, causes all Gateways and LoadBalancer Services to wait longer to become ready
 #    provider_secret: "aws-credentials"            # Name of the Secret resource that contains DNS provider credentials
 #    issuer:                                       # Issuer object for testing TLSPolicy
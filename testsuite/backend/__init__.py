@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Optional
 
 from testsuite.gateway import Referencable, Exposable
 from testsuite.lifecycle import LifecycleObject
+from testsuite.kubernetes import delete_all
 from testsuite.kubernetes.client import KubernetesClient
 from testsuite.utils.constants import HTTP_API_PORT
 
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 class Backend(LifecycleObject, Referencable, Exposable):
     """Backend (workload) deployed in Kubernetes"""
 
+    teardown_tier = 3
+
     def __init__(self, cluster: KubernetesClient, name: str, label: str):
         self._cluster = cluster
 
@@ -81,10 +84,6 @@ class Backend(LifecycleObject, Referencable, Exposable):
 
     def delete(self):
         """Clean-up the backend"""
-        with self.cluster.context:
-            if self.service:
-                self.service.delete()
-                self.service = None
-            if self.deployment:
-                self.deployment.delete()
-                self.deployment = None
+        delete_all([obj for obj in (self.service, self.deployment) if obj])
+        self.service = None
+        self.deployment = None
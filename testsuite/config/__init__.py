@@ -59,6 +59,9 @@ settings = Dynaconf(
             messages={"condition": "{value} is not valid exposer"},
         ),
         Validator("control_plane.provider_secret", must_exist=True, ne=None),
+        Validator("control_plane.transport", is_in=["oc", "api"]),
+        Validator("control_plane.informer_cache", is_type_of=bool),
+        Validator("control_plane.gateway_pool_size", is_type_of=int, gte=0),
         (
             Validator("control_plane.issuer.name", must_exist=True, ne=None)
             & Validator("control_plane.issuer.kind", must_exist=True, is_in={"Issuer", "ClusterIssuer"})
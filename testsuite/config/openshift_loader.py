@@ -16,10 +16,17 @@ def inject_client(obj, base_client, path):
 def load(obj, env=None, silent=True, key=None, filename=None):
     """Creates all KubernetesClients"""
     control_plane = obj.setdefault("control_plane", {})
+    transport = control_plane.get("transport", "oc")
+    use_cache = control_plane.get("informer_cache", False)
 
     cluster = control_plane.setdefault("cluster", {})
     client = KubernetesClient(
-        cluster.get("project"), cluster.get("api_url"), cluster.get("token"), cluster.get("kubeconfig_path")
+        cluster.get("project"),
+        cluster.get("api_url"),
+        cluster.get("token"),
+        cluster.get("kubeconfig_path"),
+        transport,
+        use_cache,
     )
     obj["control_plane"]["cluster"] = client
 
@@ -33,7 +40,12 @@ def load(obj, env=None, silent=True, key=None, filename=None):
     for value in clusters:
         clients.append(
             KubernetesClient(
-                value.get("project"), value.get("api_url"), value.get("token"), value.get("kubeconfig_path")
+                value.get("project"),
+                value.get("api_url"),
+                value.get("token"),
+                value.get("kubeconfig_path"),
+                transport,
+                use_cache,
             )
         )
     if len(clients) > 0:
@@ -41,10 +53,20 @@ def load(obj, env=None, silent=True, key=None, filename=None):
 
     if cluster2 := control_plane.setdefault("cluster2", {}):
         obj["control_plane"]["cluster2"] = KubernetesClient(
-            cluster2.get("project"), cluster2.get("api_url"), cluster2.get("token"), cluster2.get("kubeconfig_path")
+            cluster2.get("project"),
+            cluster2.get("api_url"),
+            cluster2.get("token"),
+            cluster2.get("kubeconfig_path"),
+            transport,
+            use_cache,
         )
 
     if cluster3 := control_plane.setdefault("cluster3", {}):
         obj["control_plane"]["cluster3"] = KubernetesClient(
-            cluster3.get("project"), cluster3.get("api_url"), cluster3.get("token"), cluster3.get("kubeconfig_path")
+            cluster3.get("project"),
+            cluster3.get("api_url"),
+            cluster3.get("token"),
+            cluster3.get("kubeconfig_path"),
+            transport,
+            use_cache,
         )
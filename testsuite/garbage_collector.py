@@ -0,0 +1,189 @@
+"""
+Bulk garbage collector of objects leaked by previous runs of the testsuite (e.g. after a crash).
+All objects created by the testsuite are labeled with `testRun` or `app` label derived from the `label` fixture,
+which contains the name of the user, so they can be found by the label and deleted with a single
+deletecollection request per label value.
+Label values with any object younger than the minimal age are skipped, as they may belong to a concurrent run
+of the same user (e.g. in another terminal or CI job).
+
+Usage: python -m testsuite.garbage_collector [--user USER] [--namespace NAMESPACE ...]
+"""
+
+import argparse
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import product
+
+from openshift_client import OpenShiftPythonException
+
+from testsuite.config import settings
+from testsuite.kubernetes.api import KubernetesAPI
+from testsuite.utils import whoami
+from testsuite.utils.constants import GARBAGE_COLLECTOR_MIN_AGE
+
+logger = logging.getLogger(__name__)
+
+# Labels used by the testsuite to mark objects of a test run
+LABELS = ("testRun", "app")
+
+# Kinds created by the testsuite in the order in which they should be deleted, kinds within a tier are processed
+# in parallel. Kinds that are not installed on the cluster are skipped.
+TIERS: list[list[tuple[str, str]]] = [
+    [
+        ("kuadrant.io/v1", "AuthPolicy"),
+        ("kuadrant.io/v1", "RateLimitPolicy"),
+        ("kuadrant.io/v1", "DNSPolicy"),
+        ("kuadrant.io/v1", "TLSPolicy"),
+        ("kuadrant.io/v1alpha1", "TokenRateLimitPolicy"),
+        ("kuadrant.io/v1alpha1", "DNSRecord"),
+        ("extensions.kuadrant.io/v1alpha1", "OIDCPolicy"),
+        ("extensions.kuadrant.io/v1alpha1", "PlanPolicy"),
+        ("extensions.kuadrant.io/v1alpha1", "TelemetryPolicy"),
+        ("authorino.kuadrant.io/v1beta3", "AuthConfig"),
+    ],
+    [
+        ("gateway.networking.k8s.io/v1", "HTTPRoute"),
+        ("gateway.networking.k8s.io/v1", "GRPCRoute"),
+        ("networking.istio.io/v1", "ServiceEntry"),
+        ("networking.istio.io/v1", "DestinationRule"),
+        ("networking.istio.io/v1alpha3", "EnvoyFilter"),
+    ],
+    [
+        ("gateway.networking.k8s.io/v1", "Gateway"),
+        ("operator.authorino.kuadrant.io/v1beta1", "Authorino"),
+    ],
+    [
+        ("apps/v1", "Deployment"),
+        ("autoscaling/v2", "HorizontalPodAutoscaler"),
+        ("monitoring.coreos.com/v1", "ServiceMonitor"),
+        ("monitoring.coreos.com/v1", "PodMonitor"),
+        ("v1", "Service"),
+        ("v1", "ServiceAccount"),
+        ("v1", "Secret"),
+        ("v1", "ConfigMap"),
+    ],
+]
+
+
+@dataclass
+class GarbageReport:
+    """Number of reclaimed objects per kind and the duration of the collection"""
+
+    deleted: Counter[str] = field(default_factory=Counter)
+    duration: float = 0.0
+
+    def __str__(self):
+        kinds = ", ".join(f"{kind}: {count}" for kind, count in self.deleted.most_common())
+        return f"Reclaimed {self.deleted.total()} leftover objects in {self.duration:.2f}s ({kinds or 'nothing'})"
+
+
+class GarbageCollector:
+    """Deletes all objects labeled with a label value starting with the prefix, except of the excluded values"""
+
+    def __init__(
+        self,
+        api: KubernetesAPI,
+        namespaces: list[str],
+        prefix: str,
+        exclude: tuple[str, ...] = (),
+        min_age: float = GARBAGE_COLLECTOR_MIN_AGE,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.api = api
+        self.namespaces = namespaces
+        self.prefix = prefix
+        self.exclude = exclude
+        self.min_age = min_age
+
+    def _is_young(self, obj: dict) -> bool:
+        created = datetime.fromisoformat(obj["metadata"]["creationTimestamp"].replace("Z", "+00:00"))
+        return (datetime.now(timezone.utc) - created).total_seconds() < self.min_age
+
+    def _is_garbage(self, value: str) -> bool:
+        return value.startswith(self.prefix) and not any(value.startswith(excluded) for excluded in self.exclude)
+
+    def _collect(self, api_version: str, kind: str, namespace: str) -> int:
+        """Deletes all garbage of the kind in the namespace and returns the number of deleted objects"""
+        try:
+            garbage: dict[str, set[str]] = {}
+            young = set()
+            for label in LABELS:
+                for obj in self.api.list(api_version, kind, namespace, label_selector=label):
+                    selector = f"{label}={obj['metadata']['labels'][label]}"
+                    if not self._is_garbage(obj["metadata"]["labels"][label]):
+                        continue
+                    if self._is_young(obj):
+                        young.add(selector)
+                    # Objects that are already being deleted are skipped
+                    elif "deletionTimestamp" not in obj["metadata"]:
+                        garbage.setdefault(selector, set()).add(obj["metadata"]["name"])
+
+            selectors = set(garbage) - young
+            names = set().union(*(garbage[selector] for selector in selectors))
+
+            if self.api.supports(api_version, kind, "deletecollection"):
+                for selector in selectors:
+                    self.api.delete_collection(api_version, kind, namespace, selector)
+            else:
+                for name in names:
+                    self.api.delete(api_version, kind, name, namespace, wait=False)
+        except OpenShiftPythonException as e:
+            if "NotFound" not in str(e):
+                logger.warning("Unable to collect %s in %s: %s", kind, namespace, e)
+            return 0
+        return len(names)
+
+    def collect(self) -> GarbageReport:
+        """Deletes all the garbage, tier by tier"""
+        report = GarbageReport()
+        start = time.monotonic()
+        with ThreadPoolExecutor() as executor:
+            for tier in TIERS:
+                jobs = [(api_version, kind, ns) for (api_version, kind), ns in product(tier, self.namespaces)]
+                for (_, kind, _), count in zip(jobs, executor.map(lambda job: self._collect(*job), jobs)):
+                    if count:
+                        report.deleted[kind] += count
+        report.duration = time.monotonic() - start
+        return report
+
+
+def collect_garbage(
+    user: str = None,
+    namespaces: list[str] = None,
+    exclude: tuple[str, ...] = (),
+    min_age: float = GARBAGE_COLLECTOR_MIN_AGE,
+) -> GarbageReport:
+    """Deletes objects leaked by previous runs of the user in the testsuite namespaces, older than min_age seconds"""
+    user = user or settings.get("tester") or whoami()
+    if not namespaces:
+        namespaces = [settings["service_protection"]["project"]]
+        if settings["service_protection"].get("project2"):
+            namespaces.append(settings["service_protection"]["project2"])
+    # See `blame` and `label` fixtures
+    prefix = f"testrun-{user[:8]}-"
+    return GarbageCollector(settings["control_plane"]["cluster"].api, namespaces, prefix, exclude, min_age).collect()
+
+
+def main():
+    """Command line interface of the garbage collector"""
+    parser = argparse.ArgumentParser(description="Deletes objects leaked by previous runs of the testsuite")
+    parser.add_argument("--user", help="Delete objects created by this user (default: current user)")
+    parser.add_argument(
+        "--namespace", action="append", help="Namespace to clean, can be repeated (default: testsuite namespaces)"
+    )
+    parser.add_argument(
+        "--min-age",
+        type=float,
+        default=GARBAGE_COLLECTOR_MIN_AGE,
+        help="Delete only objects of runs without any object younger than this many seconds (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    print(collect_garbage(args.user, args.namespace, min_age=args.min_age))
+
+
+if __name__ == "__main__":
+    main()
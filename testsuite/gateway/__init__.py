@@ -175,6 +175,8 @@ class Gateway(LifecycleObject, Referencable, Exposable):
     Simplified: Equals to Gateway Kubernetes object
     """
 
+    teardown_tier = 2
+
     @abstractmethod
     def external_ip(self) -> str:
         """Returns LoadBalanced IP and port to access this Gateway"""
@@ -194,6 +196,8 @@ class GatewayRoute(LifecycleObject, Referencable):
     Simplified: Equals to HTTPRoute Kubernetes object
     """
 
+    teardown_tier = 1
+
     @classmethod
     @abstractmethod
     def create_instance(
@@ -9,9 +9,11 @@ from testsuite.config import settings
 from testsuite.certificates import Certificate
 from testsuite.gateway import Gateway, GatewayListener
 from testsuite.kubernetes.client import KubernetesClient
-from testsuite.kubernetes import KubernetesObject, modify
+from testsuite.kubernetes import KubernetesObject, modify, delete_all
 from testsuite.kuadrant.policy import Policy
 from testsuite.kubernetes.deployment import Deployment
+from testsuite.kubernetes.secret import Secret
+from testsuite.kubernetes.service_account import ServiceAccount
 from testsuite.utils import check_condition, asdict, domain_match
 from testsuite.utils.constants import GATEWAY_READY_TIMEOUT, SLOW_LOADBALANCER_WAIT
 
@@ -22,6 +24,9 @@ class KuadrantGateway(KubernetesObject, Gateway):
     # Name of the GatewayClass that is to be used for all the instances
     cached_gw_class_name = None
 
+    # Gateway controllers are constantly updating status of the gateways
+    modify_strategy = "patch"
+
     @classmethod
     def create_instance(cls, cluster: KubernetesClient, name, labels, annotations: dict = None):
         """Creates new instance of Gateway"""
@@ -159,16 +164,22 @@ class KuadrantGateway(KubernetesObject, Gateway):
             if "tls" in listener:
                 yield listener
 
-    def delete(self, ignore_not_found=True, cmd_args=None):
-        res = super().delete(ignore_not_found, cmd_args)
+    def tls_secrets(self) -> list[Secret]:
+        """Returns TLS secrets created for the listeners of this Gateway"""
         with self.cluster.context:
-            # TLSPolicy does not delete certificates it creates
-            for secret in oc.selector("secret").objects():
-                if "tls" in secret.name() and self.name() in secret.name():
-                    secret.delete()
+            return [
+                secret
+                for secret in oc.selector("secret").objects(cls=Secret)
+                if "tls" in secret.name() and self.name() in secret.name()
+            ]
 
-            # Istio does not delete ServiceAccount
-            oc.selector(f"sa/{self.service_name}").delete(ignore_not_found=True)
+    def delete(self, ignore_not_found=True, cmd_args=None):
+        res = super().delete(ignore_not_found, cmd_args)
+        # TLSPolicy does not delete certificates it creates
+        leftovers: list[KubernetesObject] = list(self.tls_secrets())
+        # Istio does not delete ServiceAccount
+        leftovers.append(ServiceAccount.create_instance(self.cluster, self.service_name))
+        delete_all(leftovers)
         return res
 
     @property
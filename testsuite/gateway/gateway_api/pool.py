@@ -0,0 +1,187 @@
+"""Pool of pre-provisioned Gateways which are leased to test modules instead of creating new ones"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Union
+
+import openshift_client as oc
+
+from testsuite.gateway import GatewayListener
+from testsuite.gateway.gateway_api.gateway import KuadrantGateway
+from testsuite.kubernetes import KubernetesObject, delete_all
+from testsuite.kubernetes.client import KubernetesClient
+from testsuite.lifecycle import LifecycleObject
+from testsuite.utils import asdict
+from testsuite.utils.constants import GATEWAY_READY_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Policies that can target a Gateway, they are removed before the Gateway is recycled
+POLICY_KINDS = "authpolicies.kuadrant.io,ratelimitpolicies.kuadrant.io,dnspolicies.kuadrant.io,tlspolicies.kuadrant.io"
+
+
+def _is_programmed(obj, listeners: list[GatewayListener]) -> bool:
+    """
+    True, if the current generation of the Gateway is programmed, including all the listeners.
+    Programmed condition alone is not enough, it is still True from before the listeners were changed.
+    """
+    generation = obj.model.metadata.generation
+    if not any(
+        condition.type == "Programmed" and condition.status == "True" and condition.observedGeneration == generation
+        for condition in obj.model.status.conditions
+    ):
+        return False
+    statuses = {status.name: status for status in obj.model.status.get("listeners") or []}
+    return all(
+        listener.name in statuses
+        and any(c.type == "Programmed" and c.status == "True" for c in statuses[listener.name].conditions)
+        for listener in listeners
+    )
+
+
+def _targets(policy: KubernetesObject, gateway: KuadrantGateway) -> bool:
+    """True, if the policy targets the Gateway either by targetRef or by any of its targetRefs"""
+    spec = policy.model.spec
+    refs = spec.targetRefs or ([spec.targetRef] if spec.targetRef else [])
+    return any(ref.kind == "Gateway" and ref.name == gateway.name() for ref in refs)
+
+
+class GatewayPool(LifecycleObject):
+    """
+    Provisions programmed KuadrantGateways with a single wildcard listener in the background and leases them.
+    Programming a new Gateway (load balancer, DNS) takes minutes, while changing listeners of a programmed one
+    takes seconds. Returned Gateways are reset (policies and listeners removed) and recycled for the next lease.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    teardown_tier = 2
+
+    def __init__(
+        self,
+        cluster: KubernetesClient,
+        name_factory: Callable[[str], str],
+        labels: dict[str, str],
+        wildcard_domain: str,
+        size: int,
+    ):
+        self.cluster = cluster
+        self.name_factory = name_factory
+        self.labels = labels
+        self.wildcard_domain = wildcard_domain
+        self.size = size
+        self._ready: queue.Queue[Union[KuadrantGateway, Exception]] = queue.Queue()
+        self._gateways: list[KuadrantGateway] = []
+        # Number of gateways which are being provisioned or recycled
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(size, 1), thread_name_prefix="gateway-pool")
+
+    def default_listeners(self) -> list[GatewayListener]:
+        """Listeners of the Gateways in the pool"""
+        return [GatewayListener(hostname=self.wildcard_domain)]
+
+    def _submit(self, func, *args):
+        with self._lock:
+            self._pending += 1
+
+        def _run():
+            try:
+                self._ready.put(func(*args))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Unable to prepare pooled Gateway", exc_info=True)
+                self._ready.put(e)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+        self._executor.submit(_run)
+
+    def _provision(self) -> KuadrantGateway:
+        gateway = KuadrantGateway.create_instance(self.cluster, self.name_factory("gw"), self.labels)
+        for listener in self.default_listeners():
+            gateway.add_listener(listener)
+        with self._lock:
+            self._gateways.append(gateway)
+        gateway.commit()
+        gateway.wait_for_ready()
+        return gateway
+
+    @staticmethod
+    def _set_listeners(gateway: KuadrantGateway, listeners: list[GatewayListener]):
+        """Replaces all listeners and removes all other customizations of the Gateway"""
+
+        def _modify(obj):
+            obj.model.spec.listeners = [asdict(listener) for listener in listeners]
+            for key in ("tls", "infrastructure"):
+                if key in obj.model.spec:
+                    del obj.model.spec[key]
+
+        gateway.modify_and_patch(_modify)
+        assert gateway.wait_until(
+            lambda obj: _is_programmed(obj, listeners), timelimit=GATEWAY_READY_TIMEOUT
+        ), "Pooled Gateway was not programmed"
+
+    def _recycle(self, gateway: KuadrantGateway) -> KuadrantGateway:
+        if not gateway.exists()[0]:
+            # Gateway was deleted by the test, replace it
+            with self._lock:
+                self._gateways.remove(gateway)
+            return self._provision()
+        with self.cluster.context:
+            policies = oc.selector(POLICY_KINDS).objects(cls=KubernetesObject)
+        leftovers: list[KubernetesObject] = [policy for policy in policies if _targets(policy, gateway)]
+        delete_all(leftovers)
+        delete_all(gateway.tls_secrets())
+        gateway.refresh()
+        self._set_listeners(gateway, self.default_listeners())
+        return gateway
+
+    def commit(self):
+        """Starts provisioning of the Gateways in the background"""
+        for _ in range(self.size):
+            self._submit(self._provision)
+
+    def lease(self, *listeners: GatewayListener, timeout=GATEWAY_READY_TIMEOUT) -> KuadrantGateway:
+        """
+        Returns programmed Gateway with the listeners (wildcard listener by default).
+        If there is no Gateway available and none is being prepared, a new one is provisioned synchronously.
+        """
+        with self._lock:
+            provision = self._ready.empty() and self._pending == 0
+        if provision:
+            self._submit(self._provision)
+        item = self._ready.get(timeout=timeout)
+        if isinstance(item, Exception):
+            raise item
+        if listeners:
+            self._set_listeners(item, list(listeners))
+        return item
+
+    def release(self, gateway: KuadrantGateway):
+        """Returns the Gateway to the pool, it is reset and recycled in the background"""
+        self._submit(self._recycle, gateway)
+
+    def delete(self):
+        """Waits for all background operations and deletes all the Gateways"""
+        self._executor.shutdown(wait=True)
+        delete_all(self._gateways)
+
+
+class GatewayLease(LifecycleObject):
+    """Leased Gateway, which is returned to the pool when deleted, so it is torn down in the same tier as Gateways"""
+
+    teardown_tier = 2
+
+    def __init__(self, pool: GatewayPool, gateway: KuadrantGateway):
+        self.pool = pool
+        self.gateway = gateway
+
+    def commit(self):
+        """Gateway is already committed and programmed by the pool"""
+
+    def delete(self):
+        """Returns the Gateway to the pool"""
+        self.pool.release(self.gateway)
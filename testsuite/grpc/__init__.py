@@ -1,24 +1,66 @@
 """gRPC client for Kuadrant testsuite"""
 
+import asyncio
+import threading
+import time
+import typing
+from functools import cache, partial
+from typing import Iterable, Optional, Union
+
 import grpc
 from grpc import StatusCode
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.message_factory import GetMessageClass
 
-from testsuite.httpx import ResultList
+from testsuite.certificates import Certificate
+from testsuite.httpx import ResultList, TransportRegistry
 from testsuite.backend.grpc import grpcbin_pb2
-from testsuite.utils.constants import GRPC_CALL_TIMEOUT
+from testsuite.utils.constants import GRPC_CALL_TIMEOUT, GRPC_KEEPALIVE_TIME_MS, GRPC_KEEPALIVE_TIMEOUT_MS
 
 SERVICE_DESCRIPTOR = grpcbin_pb2.DESCRIPTOR.services_by_name["GRPCBin"]
 
 
+@cache
+def request_class(method):
+    """Returns message class of the requests of the grpcbin method"""
+    return GetMessageClass(SERVICE_DESCRIPTOR.methods_by_name[method].input_type)
+
+
+def _multicallable(channel, service, method):
+    """Creates callable of the method, with the cardinality (unary or streaming) given by its descriptor"""
+    descriptor = SERVICE_DESCRIPTOR.methods_by_name[method]
+    factory = {
+        (False, False): channel.unary_unary,
+        (False, True): channel.unary_stream,
+        (True, False): channel.stream_unary,
+        (True, True): channel.stream_stream,
+    }[(descriptor.client_streaming, descriptor.server_streaming)]
+    return factory(
+        service + "/" + method,
+        request_serializer=request_class(method).SerializeToString,
+        response_deserializer=GetMessageClass(descriptor.output_type).FromString,
+    )
+
+
+def build_metadata(auth, headers) -> Optional[list[tuple[str, str]]]:
+    """Returns metadata of a call with the auth token and headers"""
+    metadata = []
+    if auth:
+        metadata.append(("authorization", f"Bearer {auth.token.access_token}"))
+    if headers:
+        metadata.extend((k.lower(), v) for k, v in headers.items())
+    return metadata or None
+
+
 class GRPCResult:
     """Result from a gRPC request"""
 
-    def __init__(self, code, error=None, response=None):
+    def __init__(self, code, error=None, response=None, latency: Optional[float] = None):
         self.code = code
         self.error = error
         self.response = response
+        # Duration of the call in seconds
+        self.latency = latency
 
     @property
     def status_code(self):
@@ -37,41 +79,291 @@ class GRPCResult:
         return f"GRPCResult[code={self.code}, error={self.error.details()}]"
 
 
+class GRPCStreamResult(GRPCResult):
+    """Result from a gRPC call with streamed responses, status code is the final status of the stream"""
+
+    def __init__(self, code, error=None, messages=None, message_times=None, latency: Optional[float] = None):
+        super().__init__(code, error=error, response=messages[-1] if messages else None, latency=latency)
+        self.messages = messages or []
+        # Seconds since the start of the call at which each message was received
+        self.message_times: list[float] = message_times or []
+
+    def json(self):
+        """Returns all the received messages as dictionaries"""
+        return [MessageToDict(message, preserving_proto_field_name=True) for message in self.messages]
+
+    def __str__(self):
+        if self.error is None:
+            return f"GRPCStreamResult[code={self.code}, messages={len(self.messages)}]"
+        return f"GRPCStreamResult[code={self.code}, messages={len(self.messages)}, error={self.error.details()}]"
+
+
+def _options(hostname, secure: bool) -> list[tuple[str, typing.Any]]:
+    options: list[tuple[str, typing.Any]] = [
+        ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+    ]
+    if hostname:
+        options.append(("grpc.default_authority", hostname))
+        if secure:
+            # Server certificate is verified against (and SNI set to) the hostname instead of the target IP
+            options.append(("grpc.ssl_target_name_override", hostname))
+    return options
+
+
+def channel_credentials(
+    verify: Union[Certificate, bool, None], cert: Optional[Certificate]
+) -> Optional[grpc.ChannelCredentials]:
+    """
+    Returns credentials of a secure channel, None for an insecure channel.
+    Verify is the CA certificate of the server (True for the system CAs), cert is the client certificate for mTLS.
+    """
+    if not verify and not cert:
+        return None
+    return grpc.ssl_channel_credentials(
+        root_certificates=verify.chain.encode("utf-8") if isinstance(verify, Certificate) else None,
+        private_key=cert.key.encode("utf-8") if cert else None,
+        certificate_chain=cert.chain.encode("utf-8") if cert else None,
+    )
+
+
+class ChannelPool:
+    """
+    gRPC channels shared by all clients in the session.
+    Clients with the same target, authority and certificates reuse a single channel (and its HTTP/2 connection)
+    instead of doing a new TLS handshake for every test module.
+    """
+
+    _channels: dict[tuple, grpc.Channel] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def channel(
+        cls, target: str, hostname: Optional[str], verify: Union[Certificate, bool, None], cert: Optional[Certificate]
+    ) -> grpc.Channel:
+        """Returns channel shared by all clients with the same arguments"""
+        key = (target, hostname, TransportRegistry.fingerprint(verify or False, cert))
+        with cls._lock:
+            if key not in cls._channels:
+                cls._channels[key] = create_channel(target, hostname, verify, cert)
+            return cls._channels[key]
+
+    @classmethod
+    def close(cls):
+        """Closes all the channels"""
+        with cls._lock:
+            for channel in cls._channels.values():
+                channel.close()
+            cls._channels.clear()
+
+
+def create_channel(
+    target: str, hostname: Optional[str], verify: Union[Certificate, bool, None], cert: Optional[Certificate]
+) -> grpc.Channel:
+    """Creates new channel, secure if there are any certificates"""
+    credentials = channel_credentials(verify, cert)
+    options = _options(hostname, credentials is not None)
+    if credentials is None:
+        return grpc.insecure_channel(target, options=options)
+    return grpc.secure_channel(target, credentials, options=options)
+
+
 class GRPCClient:
-    """gRPC client for making unary calls"""
+    """gRPC client for making unary and streaming calls"""
 
-    def __init__(self, host, *, hostname=None):
-        options = []
-        if hostname:
-            options.append(("grpc.default_authority", hostname))
-        self.channel = grpc.insecure_channel(host, options=options)
+    def __init__(
+        self,
+        host,
+        *,
+        hostname=None,
+        verify: Union[Certificate, bool, None] = None,
+        cert: Optional[Certificate] = None,
+        pooled: bool = True,
+    ):
+        self.pooled = pooled
+        if pooled:
+            self.channel = ChannelPool.channel(host, hostname, verify, cert)
+        else:
+            self.channel = create_channel(host, hostname, verify, cert)
+        self._stubs: dict[tuple[str, str], typing.Any] = {}
+
+    def stub(self, method, service="/grpcbin.GRPCBin"):
+        """Returns cached callable of the method on the service"""
+        method = method.lstrip("/")
+        if (service, method) not in self._stubs:
+            self._stubs[(service, method)] = _multicallable(self.channel, service, method)
+        return self._stubs[(service, method)]
 
     def call(self, method, *, service="/grpcbin.GRPCBin", auth=None, headers=None):
         """Makes a unary gRPC call to the given method on the service."""
-        metadata = []
-        if auth:
-            metadata.append(("authorization", f"Bearer {auth.token.access_token}"))
-        if headers:
-            metadata.extend((k.lower(), v) for k, v in headers.items())
+        make_call = self.stub(method, service)
+        start = time.perf_counter()
+        try:
+            response = make_call(
+                request_class(method.lstrip("/"))(), metadata=build_metadata(auth, headers), timeout=GRPC_CALL_TIMEOUT
+            )
+            return GRPCResult(StatusCode.OK, response=response, latency=time.perf_counter() - start)
+        except grpc.RpcError as e:
+            return GRPCResult(e.code(), error=e, latency=time.perf_counter() - start)  # pylint: disable=no-member
+
+    def call_many(
+        self, method, count, *, service="/grpcbin.GRPCBin", auth=None, headers=None, concurrency=1
+    ) -> ResultList:
+        """
+        Send multiple gRPC requests.
+        With concurrency higher than 1, up to that many calls are in flight at once over the channel,
+        results are still returned in the order in which the calls were started.
+        """
+        if concurrency <= 1:
+            return ResultList(self.call(method, service=service, auth=auth, headers=headers) for _ in range(count))
+
+        make_call = self.stub(method, service)
+        metadata = build_metadata(auth, headers)
+        results: list[Optional[GRPCResult]] = [None] * count
+        in_flight = threading.BoundedSemaphore(concurrency)
+
+        def _done(index, start, future):
+            latency = time.perf_counter() - start
+            try:
+                results[index] = GRPCResult(StatusCode.OK, response=future.result(), latency=latency)
+            except grpc.RpcError as e:
+                results[index] = GRPCResult(e.code(), error=e, latency=latency)  # pylint: disable=no-member
+            finally:
+                in_flight.release()
+
+        for index in range(count):
+            in_flight.acquire()  # pylint: disable=consider-using-with
+            start = time.perf_counter()
+            future = make_call.future(request_class(method.lstrip("/"))(), metadata=metadata, timeout=GRPC_CALL_TIMEOUT)
+            future.add_done_callback(partial(_done, index, start))
+        # All calls are finished once all the slots are free again
+        for _ in range(concurrency):
+            in_flight.acquire()  # pylint: disable=consider-using-with
+        return ResultList(results)
+
+    @staticmethod
+    def _collect(responses, start: float) -> GRPCStreamResult:
+        """Reads all the streamed responses and records when each of them arrived"""
+        messages = []
+        message_times = []
+        try:
+            for message in responses:
+                messages.append(message)
+                message_times.append(time.perf_counter() - start)
+            code, error = StatusCode.OK, None
+        except grpc.RpcError as e:
+            code, error = e.code(), e  # pylint: disable=no-member
+        return GRPCStreamResult(code, error, messages, message_times, latency=time.perf_counter() - start)
+
+    def server_stream(
+        self, method, request=None, *, service="/grpcbin.GRPCBin", auth=None, headers=None, timeout=GRPC_CALL_TIMEOUT
+    ) -> GRPCStreamResult:
+        """Makes a call with single request (empty by default) and streamed responses, e.g. DummyServerStream"""
         method = method.lstrip("/")
-        make_call = self.channel.unary_unary(
-            service + "/" + method,
-            request_serializer=grpcbin_pb2.EmptyMessage.SerializeToString,
-            response_deserializer=GetMessageClass(SERVICE_DESCRIPTOR.methods_by_name[method].output_type).FromString,
-        )
+        request = request if request is not None else request_class(method)()
+        start = time.perf_counter()
+        responses = self.stub(method, service)(request, metadata=build_metadata(auth, headers), timeout=timeout)
+        return self._collect(responses, start)
+
+    def client_stream(
+        self,
+        method,
+        requests: Iterable,
+        *,
+        service="/grpcbin.GRPCBin",
+        auth=None,
+        headers=None,
+        timeout=GRPC_CALL_TIMEOUT,
+    ) -> GRPCResult:
+        """Makes a call with streamed requests and single response, e.g. DummyClientStream"""
+        make_call = self.stub(method, service)
+        start = time.perf_counter()
         try:
-            response = make_call(grpcbin_pb2.EmptyMessage(), metadata=metadata or None, timeout=GRPC_CALL_TIMEOUT)
-            return GRPCResult(StatusCode.OK, response=response)
+            response = make_call(iter(requests), metadata=build_metadata(auth, headers), timeout=timeout)
+            return GRPCResult(StatusCode.OK, response=response, latency=time.perf_counter() - start)
         except grpc.RpcError as e:
-            return GRPCResult(e.code(), error=e)  # pylint: disable=no-member
+            return GRPCResult(e.code(), error=e, latency=time.perf_counter() - start)  # pylint: disable=no-member
 
-    def call_many(self, method, count, *, auth=None, **kwargs) -> ResultList:
-        """Send multiple gRPC requests."""
-        responses = ResultList()
-        for _ in range(count):
-            responses.append(self.call(method, auth=auth, **kwargs))
-        return responses
+    def bidi_stream(
+        self,
+        method,
+        requests: Iterable,
+        *,
+        service="/grpcbin.GRPCBin",
+        auth=None,
+        headers=None,
+        timeout=GRPC_CALL_TIMEOUT,
+    ) -> GRPCStreamResult:
+        """
+        Makes a call with streamed requests and streamed responses, e.g. DummyBidirectionalStreamStream.
+        Requests can be a generator, which is consumed while the responses are being received.
+        """
+        start = time.perf_counter()
+        responses = self.stub(method, service)(iter(requests), metadata=build_metadata(auth, headers), timeout=timeout)
+        return self._collect(responses, start)
 
     def close(self):
+        """Close the gRPC channel, pooled channels are closed by the ChannelPool at the end of the session"""
+        if not self.pooled:
+            self.channel.close()
+
+
+class AsyncGRPCClient:
+    """Asyncio variant of the GRPCClient, which allows making many calls at once from a single thread"""
+
+    def __init__(
+        self,
+        host,
+        *,
+        hostname=None,
+        verify: Union[Certificate, bool, None] = None,
+        cert: Optional[Certificate] = None,
+    ):
+        # Channels of asyncio clients are bound to the event loop, so they are not pooled
+        credentials = channel_credentials(verify, cert)
+        options = _options(hostname, credentials is not None)
+        if credentials is None:
+            self.channel = grpc.aio.insecure_channel(host, options=options)
+        else:
+            self.channel = grpc.aio.secure_channel(host, credentials, options=options)
+        self._stubs: dict[tuple[str, str], typing.Any] = {}
+
+    def stub(self, method, service="/grpcbin.GRPCBin"):
+        """Returns cached callable of the method on the service"""
+        method = method.lstrip("/")
+        if (service, method) not in self._stubs:
+            self._stubs[(service, method)] = _multicallable(self.channel, service, method)
+        return self._stubs[(service, method)]
+
+    async def call(self, method, *, service="/grpcbin.GRPCBin", auth=None, headers=None) -> GRPCResult:
+        """Makes a unary gRPC call to the given method on the service."""
+        make_call = self.stub(method, service)
+        start = time.perf_counter()
+        try:
+            response = await make_call(
+                request_class(method.lstrip("/"))(), metadata=build_metadata(auth, headers), timeout=GRPC_CALL_TIMEOUT
+            )
+            return GRPCResult(StatusCode.OK, response=response, latency=time.perf_counter() - start)
+        except grpc.aio.AioRpcError as e:
+            return GRPCResult(e.code(), error=e, latency=time.perf_counter() - start)
+
+    async def call_many(
+        self, method, count, *, service="/grpcbin.GRPCBin", auth=None, headers=None, concurrency=None
+    ) -> ResultList:
+        """
+        Send multiple gRPC requests concurrently, by default all of them at once.
+        Results are returned in the order in which the calls were started.
+        """
+        semaphore = asyncio.Semaphore(concurrency or count or 1)
+
+        async def _call():
+            async with semaphore:
+                return await self.call(method, service=service, auth=auth, headers=headers)
+
+        return ResultList(await asyncio.gather(*(_call() for _ in range(count))))
+
+    async def close(self):
         """Close the gRPC channel"""
-        self.channel.close()
+        await self.channel.close()
@@ -0,0 +1,70 @@
+"""
+Open-loop load generation of gRPC calls, either as separate unary calls or as messages of a single long-lived stream.
+Timelines are the same as of the HTTP load, statuses are gRPC status codes.
+"""
+
+import time
+
+import grpc
+from grpc import StatusCode
+
+from testsuite.grpc import GRPCClient, GRPCResult, build_metadata, request_class
+from testsuite.httpx.load import Sample, Schedule, Timeline, run_schedule, send_times
+from testsuite.utils.constants import GRPC_CALL_TIMEOUT, LOAD_MAX_IN_FLIGHT
+
+
+def generate_grpc_load(
+    client: GRPCClient, method, schedule: Schedule, duration: float, *, max_in_flight=LOAD_MAX_IN_FLIGHT, **kwargs
+) -> Timeline:
+    """
+    Makes unary calls according to the schedule for the duration (in seconds) and returns the timeline of them.
+    Additional arguments are passed to the client.call().
+    """
+    return run_schedule(lambda: client.call(method, **kwargs), schedule, duration, max_in_flight)
+
+
+def generate_stream_load(  # pylint: disable=too-many-locals
+    client: GRPCClient,
+    method,
+    schedule: Schedule,
+    duration: float,
+    *,
+    message=None,
+    service="/grpcbin.GRPCBin",
+    auth=None,
+    headers=None,
+) -> Timeline:
+    """
+    Sends messages (empty by default) over a single bidirectional stream according to the schedule and returns
+    the timeline of them, latency of each message is the time until its echo was received.
+    If the stream fails, the last sample contains the final status code and all the later messages are missing.
+    """
+    method = method.lstrip("/")
+    message = message if message is not None else request_class(method)()
+    start = time.perf_counter()
+    sent: list[tuple[float, float]] = []
+
+    def _messages():
+        for scheduled in send_times(schedule, duration):
+            time.sleep(max(scheduled - (time.perf_counter() - start), 0))
+            sent.append((scheduled, time.perf_counter() - start))
+            yield message
+
+    timeline = Timeline()
+
+    def _sample(code, response=None, error=None) -> Sample:
+        now = time.perf_counter() - start
+        # Responses are echoed in order, so the n-th response belongs to the n-th sent message
+        scheduled, sent_at = sent[len(timeline)] if len(timeline) < len(sent) else (now, now)
+        result = GRPCResult(code, error=error, response=response, latency=now - sent_at)
+        return Sample(scheduled, sent_at, now - sent_at, result)
+
+    responses = client.stub(method, service)(
+        _messages(), metadata=build_metadata(auth, headers), timeout=duration + GRPC_CALL_TIMEOUT
+    )
+    try:
+        for response in responses:
+            timeline.append(_sample(StatusCode.OK, response=response))
+    except grpc.RpcError as e:
+        timeline.append(_sample(e.code(), error=e))  # pylint: disable=no-member
+    return timeline
@@ -1,16 +1,33 @@
 """Common classes for Httpx"""
 
+import asyncio
+import hashlib
+import math
 import ssl
+import threading
 import typing
 import uuid
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # I change return type of HTTPX client to Kuadrant Result
 # mypy: disable-error-code="override, return-value"
 from tempfile import NamedTemporaryFile
-from typing import Union, Iterable, MutableMapping
-
-import backoff
-from httpx import Client, RequestError, USE_CLIENT_DEFAULT, Request
+from typing import TYPE_CHECKING, Literal, Optional, Union, Iterable, MutableMapping, overload
+
+from httpx import (
+    AsyncClient,
+    BaseTransport,
+    Client,
+    HTTPTransport,
+    RequestError,
+    Response,
+    URL,
+    USE_CLIENT_DEFAULT,
+    Request,
+    create_ssl_context,
+)
 from httpx._client import UseClientDefault
 from httpx._types import (
     URLTypes,
@@ -24,7 +41,21 @@ from httpx._types import (
 )
 
 from testsuite.certificates import Certificate
-from testsuite.utils.constants import HTTP_BACKOFF_MAX_RETRIES
+from testsuite.httpx.body import BodySummary, DiscardBody
+from testsuite.httpx.latency import LatencyRecorder, RequestTimer, RequestTimings
+from testsuite.httpx.retry import (
+    DEFAULT_RETRY_POLICY,
+    RETRYABLE_ERRORS,
+    TLS_ERRORS,
+    CircuitOpenError,
+    ErrorKind,
+    RetryPolicy,
+    classify,
+)
+from testsuite.utils.constants import LOAD_MAX_IN_FLIGHT
+
+if TYPE_CHECKING:
+    from testsuite.grpc import GRPCResult
 
 
 def create_tmp_file(content: str):
@@ -37,23 +68,141 @@ def create_tmp_file(content: str):
     return file
 
 
+def _tls_options(verify: Union[Certificate, ssl.SSLContext, bool], cert: Certificate = None, files: list = None):
+    """Converts Certificates to verify and cert arguments of httpx clients, created files are appended to files"""
+    files = [] if files is None else files
+    _verify = None
+    if isinstance(verify, Certificate):
+        verify_file = create_tmp_file(verify.chain)
+        files.append(verify_file)
+        _verify = ssl.create_default_context(cafile=verify_file.name)
+    _cert = None
+    if cert:
+        cert_file = create_tmp_file(cert.chain)
+        files.append(cert_file)
+        key_file = create_tmp_file(cert.key)
+        files.append(key_file)
+        _cert = (cert_file.name, key_file.name)
+    return _verify or verify, _cert or cert
+
+
+class SharedTransport(BaseTransport):
+    """Transport of a single client, which uses a connection pool shared with other clients"""
+
+    def __init__(self, transport: HTTPTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self):
+        """Shared connection pool is closed by the TransportRegistry at the end of the session"""
+
+
+class TransportRegistry:
+    """
+    SSL contexts and connection pools shared by all clients in the session.
+    Clients talking to the same target with the same SNI and certificates reuse keep-alive connections
+    instead of creating new connections, TLS contexts and temporary certificate files.
+    """
+
+    _contexts: dict[tuple, ssl.SSLContext] = {}
+    _transports: dict[tuple, HTTPTransport] = {}
+    _files: list[typing.IO[bytes]] = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(verify: Union[Certificate, bool], cert: Optional[Certificate]) -> tuple:
+        """Returns key identifying the certificates"""
+
+        def _digest(certificate: Certificate):
+            return hashlib.sha256(f"{certificate.chain}{certificate.key}".encode("utf-8")).hexdigest()
+
+        verify_key = _digest(verify) if isinstance(verify, Certificate) else verify
+        return verify_key, _digest(cert) if cert else None
+
+    @classmethod
+    def ssl_context(
+        cls, verify: Union[Certificate, bool], cert: Optional[Certificate], http2: bool = False
+    ) -> ssl.SSLContext:
+        """
+        Returns SSL context verifying the server with the verify certificate and presenting the cert.
+        HTTP/1.1 and HTTP/2 clients get separate contexts, because httpcore sets ALPN protocols on the context itself.
+        SSL contexts passed in by callers are never shared, clients using them get their own transport.
+        """
+        key = (*cls.fingerprint(verify, cert), http2)
+        with cls._lock:
+            if key not in cls._contexts:
+                files: list[typing.IO[bytes]] = []
+                _verify, _cert = _tls_options(verify, cert, files)
+                context = create_ssl_context(verify=_verify)
+                if _cert:
+                    context.load_cert_chain(*_cert)
+                context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+                cls._files.extend(files)
+                cls._contexts[key] = context
+            return cls._contexts[key]
+
+    @classmethod
+    def transport(
+        cls,
+        target: str,
+        sni_hostname: Optional[str],
+        verify: Union[Certificate, bool],
+        cert: Optional[Certificate],
+        http2: bool = False,
+    ) -> SharedTransport:
+        """Returns transport using connection pool shared by all clients with the same arguments"""
+        context = cls.ssl_context(verify, cert, http2)
+        key = (target, sni_hostname, cls.fingerprint(verify, cert), http2)
+        with cls._lock:
+            if key not in cls._transports:
+                cls._transports[key] = HTTPTransport(verify=context, http2=http2)
+            return SharedTransport(cls._transports[key])
+
+    @classmethod
+    def close(cls):
+        """Closes all the connection pools and removes the certificate files"""
+        with cls._lock:
+            for transport in cls._transports.values():
+                transport.close()
+            for file in cls._files:
+                file.close()
+            cls._transports.clear()
+            cls._contexts.clear()
+            cls._files.clear()
+
+
 class Result:
     """Result from HTTP request"""
 
-    def __init__(self, retry_codes, response=None, error=None):
+    def __init__(
+        self,
+        retry_codes,
+        response=None,
+        error=None,
+        timings: RequestTimings = None,
+        body: BodySummary = None,
+        circuit_open: bool = False,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
         self.response = response
         self.error = error
         self.retry_codes = retry_codes
+        self.timings = timings
+        # Summary of the response body, if it was discarded instead of being kept in the response
+        self.body = body
+        # Error messages are classified only once, instead of scanning them in every check
+        self.error_kind = classify(error)
+        # Request was not sent, because the host failed repeatedly, error is the last one the host failed with
+        if circuit_open:
+            self.error_kind |= ErrorKind.CIRCUIT_OPEN
 
     def should_backoff(self):
         """True, if the Result can be considered an instability and should be retried"""
-        return (
-            self.has_dns_error()
-            or (self.error is None and self.status_code in self.retry_codes)
-            or self.has_error("Server disconnected without sending a response.")
-            or self.has_error("timed out")
-            or self.has_error("SSL: UNEXPECTED_EOF_WHILE_READING")
-        )
+        if self.error is None:
+            return self.response.status_code in self.retry_codes
+        return bool(self.error_kind & RETRYABLE_ERRORS)
 
     def has_error(self, error_msg: str) -> bool:
         """True, if the request failed and an error with message was returned"""
@@ -61,32 +210,23 @@ class Result:
 
     def has_dns_error(self):
         """True, if the result failed due to DNS failure"""
-        return (
-            self.has_error("nodename nor servname provided, or not known")
-            or self.has_error("Name or service not known")
-            or self.has_error("No address associated with hostname")
-        )
+        return ErrorKind.DNS in self.error_kind
 
     def has_tls_error(self):
         """True, if the result failed due to TLS failure"""
-        return (
-            self.has_error("SSL: UNEXPECTED_EOF_WHILE_READING")
-            or self.has_error("Connection refused")
-            or self.has_error("Connection reset by peer")
-            or self.has_error("The handshake operation timed out")
-        )
+        return bool(self.error_kind & TLS_ERRORS)
 
     def has_cert_verify_error(self):
         """True, if the result failed due to TLS certificate verification failure"""
-        return self.has_error("SSL: CERTIFICATE_VERIFY_FAILED")
+        return ErrorKind.CERT_VERIFY in self.error_kind
 
     def has_unknown_ca_error(self):
         """True, if the result failed due to TLS unknown certificate authority failure"""
-        return self.has_error("SSL: TLSV1_ALERT_UNKNOWN_CA")
+        return ErrorKind.UNKNOWN_CA in self.error_kind
 
     def has_cert_required_error(self):
         """True, if the result failed due to TLS certificate absense failure"""
-        return self.has_error("SSL: TLSV13_ALERT_CERTIFICATE_REQUIRED")
+        return ErrorKind.CERT_REQUIRED in self.error_kind
 
     def __getattr__(self, item):
         """For backwards compatibility"""
@@ -100,51 +240,199 @@ class Result:
         return f"Result[error={self.error}]"
 
 
+def _status_code(status) -> int:
+    """Returns status code as an int, gRPC StatusCode is mapped to its numeric value"""
+    value = getattr(status, "value", status)
+    return value[0] if isinstance(value, tuple) else value
+
+
+def _expand_pattern(pattern: str, length: int) -> list[int]:
+    """
+    Expands status code pattern to the list of status codes, e.g. "200*5,429" is 5 times 200 and once 429.
+    Count `*` without a number means all the remaining results, there can be only one such part.
+    """
+    parts = [part.strip().split("*") for part in pattern.split(",")]
+    fixed = sum(int(part[1]) if len(part) > 1 and part[1] else 1 for part in parts if part[-1] != "" or len(part) == 1)
+    expanded = []
+    for part in parts:
+        if len(part) == 1:
+            expanded.append(int(part[0]))
+        elif part[1]:
+            expanded.extend([int(part[0])] * int(part[1]))
+        else:
+            expanded.extend([int(part[0])] * max(length - fixed, 0))
+    return expanded
+
+
+class ResultColumns:
+    """
+    Compact storage of Results for large number of requests.
+    Only status codes (0 for failed requests), latencies, error kinds and tracking IDs are kept in parallel arrays,
+    the responses themselves are dropped.
+    gRPC results are stored with the numeric value of their status code, which they have even if the call failed.
+    """
+
+    def __init__(self, results: Iterable[Union[Result, "GRPCResult"]] = ()):
+        self.status_codes = array("H")
+        self.latencies = array("d")
+        self.errors: list[Optional[str]] = []
+        self.tracking_ids: list[Optional[str]] = []
+        for result in results:
+            self.append(result)
+
+    def append(self, result: Union[Result, "GRPCResult"]):
+        """Adds columns of the result"""
+        if isinstance(result, Result):
+            response = result.response
+            self.status_codes.append(response.status_code if response is not None else 0)
+            self.latencies.append(result.timings.total if result.timings else 0.0)
+            self.tracking_ids.append(
+                response.request.headers.get(KuadrantClient.TRACKING_HEADER) if response is not None else None
+            )
+        else:
+            self.status_codes.append(_status_code(result.status_code))
+            self.latencies.append(result.latency or 0.0)
+            self.tracking_ids.append(None)
+        self.errors.append(type(result.error).__name__ if result.error is not None else None)
+
+    def __len__(self):
+        return len(self.status_codes)
+
+    def count(self, status_code: int) -> int:
+        """Returns number of results with the status code"""
+        return self.status_codes.count(_status_code(status_code))
+
+    def first_index(self, status_code: int) -> Optional[int]:
+        """Returns index of the first result with the status code, None if there is none"""
+        try:
+            return self.status_codes.index(_status_code(status_code))
+        except ValueError:
+            return None
+
+    def histogram(self) -> dict[int, int]:
+        """Returns number of results per status code"""
+        return dict(sorted(Counter(self.status_codes).items()))
+
+    def percentile(self, percentile: float) -> float:
+        """Returns latency in seconds under which the percentile (0-100) of the requests finished"""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[max(math.ceil(percentile / 100 * len(latencies)) - 1, 0)]
+
+    def assert_all(self, status_code):
+        """Assert all responses that contain certain status code"""
+        status_code = _status_code(status_code)
+        index = next((i for i, code in enumerate(self.status_codes) if code != status_code), None)
+        assert index is None, (
+            f"Status code assertion failed for request {index + 1} out of {len(self)} requests: "
+            f"{self.status_codes[index] or self.errors[index]} != {status_code}"
+        )
+
+    def assert_pattern(self, pattern: str):
+        """Asserts the status codes of the results in order, e.g. "200*5,429" or "200*5,429*" """
+        expected = _expand_pattern(pattern, len(self))
+        actual = list(self.status_codes)
+        mismatch = next((i for i, (a, e) in enumerate(zip(actual, expected)) if a != e), None)
+        if mismatch is None and len(actual) != len(expected):
+            mismatch = min(len(actual), len(expected))
+        assert mismatch is None, (
+            f"Status codes do not match pattern {pattern} at request {mismatch + 1}, "
+            f"expected {expected[mismatch:mismatch + 3]}, got {actual[mismatch:mismatch + 3]} "
+            f"(histogram: {self.histogram()})"
+        )
+
+
 class ResultList(list):
     """List-like object for Result"""
 
+    def columns(self) -> ResultColumns:
+        """Returns compact columns of the results, which offer the statistics"""
+        return ResultColumns(self)
+
+    def count_status(self, status_code: int) -> int:
+        """Returns number of results with the status code, unlike list.count() which compares whole results"""
+        return self.columns().count(status_code)
+
+    def first_index(self, status_code: int) -> Optional[int]:
+        """Returns index of the first result with the status code, None if there is none"""
+        return self.columns().first_index(status_code)
+
+    def histogram(self) -> dict[int, int]:
+        """Returns number of results per status code"""
+        return self.columns().histogram()
+
+    def percentile(self, percentile: float) -> float:
+        """Returns latency in seconds under which the percentile (0-100) of the requests finished"""
+        return self.columns().percentile(percentile)
+
     def assert_all(self, status_code):
         """Assert all responses that contain certain status code"""
-        for request in self:
+        for index, request in enumerate(self):
             assert request.status_code == status_code, (
-                f"Status code assertion failed for request {self.index(request)+1} out of {len(self)} requests: "
+                f"Status code assertion failed for request {index + 1} out of {len(self)} requests: "
                 f"{request} != {status_code}"
             )
 
+    def assert_pattern(self, pattern: str):
+        """Asserts the status codes of the results in order, e.g. "200*5,429" or "200*5,429*" """
+        self.columns().assert_pattern(pattern)
+
 
-class KuadrantClient(Client):
-    """Httpx client which retries unstable requests"""
+class DenialTracking:
+    """
+    Base of the clients which mark every request with a tracking ID and remember IDs of the requests
+    denied by the gateway, so it can be verified that they did not leak to the upstream
+    """
 
     TRACKING_HEADER = "X-Testsuite-Tracking"
     GATEWAY_DENIED_CODES = {401, 403, 429}
 
+    denied_request_ids: list[str]
+
+
+class KuadrantClient(DenialTracking, Client):
+    """
+    Httpx client which retries unstable requests.
+    With http2 the requests in flight are multiplexed over a single connection instead of opening one for each.
+    """
+
+    # Arguments which configure the transport, clients using them get their own connection pool
+    UNPOOLED_ARGS = {"transport", "mounts", "limits", "proxy", "app"}
+
+    # SNI sent in every request, None to use the hostname from the URL
+    sni_hostname: Optional[str] = None
+
     def __init__(
         self,
         *,
         verify: Union[Certificate, bool] = True,
         cert: Certificate = None,
         retry_codes: Iterable[int] = None,
+        pooled: bool = True,
+        http2: bool = False,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
         **kwargs,
     ):
-        self.files = []
+        self.files: list[typing.IO[bytes]] = []
         self.denied_request_ids: list[str] = []
+        self.latency = LatencyRecorder()
         self.retry_codes = {503} if retry_codes is None else set(retry_codes)
-        _verify = None
-        if isinstance(verify, Certificate):
-            verify_file = create_tmp_file(verify.chain)
-            self.files.append(verify_file)
-            _verify = ssl.create_default_context(cafile=verify_file.name)
-        _cert = None
-        if cert:
-            cert_file = create_tmp_file(cert.chain)
-            self.files.append(cert_file)
-            key_file = create_tmp_file(cert.key)
-            self.files.append(key_file)
-            _cert = (cert_file.name, key_file.name)
-
+        self.retry_policy = retry_policy
+        self.http2 = http2
+
+        # SSL context of the caller would be modified and shared with other clients, so it gets its own transport
+        pooled = pooled and not isinstance(verify, ssl.SSLContext)
+        if pooled and "base_url" in kwargs and not self.UNPOOLED_ARGS & kwargs.keys():
+            target = URL(kwargs["base_url"]).host
+            self.verify = TransportRegistry.ssl_context(verify, cert, http2)
+            kwargs["transport"] = TransportRegistry.transport(target, self.sni_hostname, verify, cert, http2)
+            super().__init__(**kwargs)
+            return
+
+        self.verify, _cert = _tls_options(verify, cert, self.files)
         # Mypy does not understand the typing magic I have done
-        self.verify = _verify or verify
-        super().__init__(verify=self.verify, cert=_cert or cert, **kwargs)  # type: ignore
+        super().__init__(verify=self.verify, cert=_cert, http2=http2, **kwargs)  # type: ignore
 
     def close(self) -> None:
         super().close()
@@ -157,10 +445,7 @@ class KuadrantClient(Client):
         self.retry_codes.add(code)
 
     # pylint: disable=too-many-locals
-    @backoff.on_predicate(
-        backoff.fibo, lambda result: result.should_backoff(), max_tries=HTTP_BACKOFF_MAX_RETRIES, jitter=None
-    )
-    def request(
+    def request_once(
         self,
         method: str,
         url,
@@ -176,12 +461,18 @@ class KuadrantClient(Client):
         follow_redirects=None,
         timeout=None,
         extensions=None,
+        discard_body: Union[bool, DiscardBody] = False,
     ) -> Result:
+        """Sends the request without retrying unstable results, e.g. when the timing of the requests matters
+        With discard_body the response body is read in chunks and only its size, digest and beginning are kept.
+        """
         headers = dict(headers) if headers else {}
         tracking_id = headers.setdefault(self.TRACKING_HEADER, str(uuid.uuid4()))
+        timer = RequestTimer()
+        body_reader = DiscardBody() if discard_body is True else discard_body or None
 
         try:
-            response = super().request(
+            request = self.build_request(
                 method,
                 url,
                 content=content,
@@ -191,29 +482,229 @@ class KuadrantClient(Client):
                 params=params,
                 headers=headers,
                 cookies=cookies,
-                auth=auth,
-                follow_redirects=follow_redirects,
                 timeout=timeout,
-                extensions=extensions,
+                extensions={"trace": timer, **(extensions or {})},
             )
-            result = Result(self.retry_codes, response=response)
+            response = self.send(request, auth=auth, follow_redirects=follow_redirects, stream=body_reader is not None)
+            body = None
+            if body_reader is not None:
+                try:
+                    body = body_reader.read(response.iter_bytes())
+                finally:
+                    response.close()
+            timings = timer.timings()
+            self.latency.record(response.request.url.host, timings)
+            result = Result(self.retry_codes, response=response, timings=timings, body=body)
             if result.status_code in self.GATEWAY_DENIED_CODES:
                 self.denied_request_ids.append(tracking_id)
             return result
         except RequestError as e:
             return Result(self.retry_codes, error=e)
 
-    def get(self, *args, **kwargs) -> Result:
-        return super().get(*args, **kwargs)
+    def request(self, method: str, url, **kwargs) -> Result:
+        host = self._merge_url(url).host
+        try:
+            return self.retry_policy.execute(host, lambda: self.request_once(method, url, **kwargs))
+        except CircuitOpenError as e:
+            return Result(self.retry_codes, error=e.last_error, circuit_open=True)
 
-    def get_many(self, url, count, *, params=None, headers=None, auth=None) -> ResultList:
-        """Send multiple `GET` requests."""
-        responses = ResultList()
-        for _ in range(count):
-            responses.append(self.get(url, params=params, headers=headers, auth=auth))
+    def get(self, url, **kwargs) -> Result:
+        return self.request("GET", url, **kwargs)
 
+    @overload
+    def get_many(
+        self,
+        url,
+        count,
+        *,
+        params=None,
+        headers=None,
+        auth=None,
+        concurrency=1,
+        keep_responses: Literal[True] = True,
+        discard_body=False,
+    ) -> ResultList: ...
+
+    @overload
+    def get_many(
+        self,
+        url,
+        count,
+        *,
+        params=None,
+        headers=None,
+        auth=None,
+        concurrency=1,
+        keep_responses: Literal[False],
+        discard_body=False,
+    ) -> ResultColumns: ...
+
+    def get_many(
+        self,
+        url,
+        count,
+        *,
+        params=None,
+        headers=None,
+        auth=None,
+        concurrency=1,
+        keep_responses=True,
+        discard_body=False,
+    ) -> Union[ResultList, ResultColumns]:
+        """
+        Send multiple `GET` requests.
+        With concurrency higher than 1, up to that many requests are in flight at once,
+        results are still returned in the order in which the requests were started.
+        Without keep_responses only compact ResultColumns are returned, which keeps memory flat for many requests.
+        With discard_body the response bodies are not kept either, see request_once().
+        """
+        responses: Union[ResultList, ResultColumns] = ResultList() if keep_responses else ResultColumns()
+        if concurrency <= 1:
+            for _ in range(count):
+                responses.append(self.get(url, params=params, headers=headers, auth=auth, discard_body=discard_body))
+            return responses
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, count) or 1) as executor:
+            for result in executor.map(
+                lambda _: self.get(url, params=params, headers=headers, auth=auth, discard_body=discard_body),
+                range(count),
+            ):
+                responses.append(result)
         return responses
 
+    def burst(self, method: str, url, count: int, *, max_in_flight=LOAD_MAX_IN_FLIGHT, **kwargs) -> ResultList:
+        """
+        Sends count requests at once without retrying them and returns results in the order in which they were started.
+        With http2 all requests in flight share a single connection (as long as the server allows enough streams),
+        otherwise every request in flight needs its own connection.
+        """
+        with ThreadPoolExecutor(max_workers=min(count, max_in_flight) or 1, thread_name_prefix="burst") as executor:
+            return ResultList(executor.map(lambda _: self.request_once(method, url, **kwargs), range(count)))
+
+
+class AsyncKuadrantClient(DenialTracking, AsyncClient):
+    """Asyncio variant of the KuadrantClient, which allows sending many requests at once from a single thread"""
+
+    def __init__(
+        self,
+        *,
+        verify: Union[Certificate, bool] = True,
+        cert: Certificate = None,
+        retry_codes: Iterable[int] = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        **kwargs,
+    ):
+        self.files: list[typing.IO[bytes]] = []
+        self.denied_request_ids: list[str] = []
+        self.latency = LatencyRecorder()
+        self.retry_codes = {503} if retry_codes is None else set(retry_codes)
+        self.retry_policy = retry_policy
+        if isinstance(verify, ssl.SSLContext):
+            # SSL context of the caller is used as it is, same as in the unpooled KuadrantClient
+            self.verify, _cert = _tls_options(verify, cert, self.files)
+        else:
+            # Connections of asyncio clients are bound to the event loop, so only SSL contexts are shared
+            self.verify, _cert = TransportRegistry.ssl_context(verify, cert, http2), None
+
+        # Mypy does not understand the typing magic I have done
+        super().__init__(verify=self.verify, cert=_cert, http2=http2, **kwargs)  # type: ignore
+
+    async def aclose(self) -> None:
+        await super().aclose()
+        for file in self.files:
+            file.close()
+        self.files = []
+
+    def add_retry_code(self, code):
+        """Add a new retry code to"""
+        self.retry_codes.add(code)
+
+    # pylint: disable=too-many-locals
+    async def request_once(
+        self,
+        method: str,
+        url,
+        *,
+        content=None,
+        data=None,
+        files=None,
+        json=None,
+        params=None,
+        headers=None,
+        cookies=None,
+        auth=None,
+        follow_redirects=None,
+        timeout=None,
+        extensions=None,
+        discard_body: Union[bool, DiscardBody] = False,
+    ) -> Result:
+        """Sends the request without retrying unstable results
+        With discard_body the response body is read in chunks and only its size, digest and beginning are kept.
+        """
+        headers = dict(headers) if headers else {}
+        tracking_id = headers.setdefault(self.TRACKING_HEADER, str(uuid.uuid4()))
+        timer = RequestTimer()
+        body_reader = DiscardBody() if discard_body is True else discard_body or None
+
+        try:
+            request = self.build_request(
+                method,
+                url,
+                content=content,
+                data=data,
+                files=files,
+                json=json,
+                params=params,
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+                extensions={"trace": timer.atrace, **(extensions or {})},
+            )
+            response = await self.send(
+                request, auth=auth, follow_redirects=follow_redirects, stream=body_reader is not None
+            )
+            body = None
+            if body_reader is not None:
+                try:
+                    body = await body_reader.aread(response.aiter_bytes())
+                finally:
+                    await response.aclose()
+            timings = timer.timings()
+            self.latency.record(response.request.url.host, timings)
+            result = Result(self.retry_codes, response=response, timings=timings, body=body)
+            if result.status_code in self.GATEWAY_DENIED_CODES:
+                self.denied_request_ids.append(tracking_id)
+            return result
+        except RequestError as e:
+            return Result(self.retry_codes, error=e)
+
+    async def request(self, method: str, url, **kwargs) -> Result:
+        host = self._merge_url(url).host
+        try:
+            return await self.retry_policy.aexecute(host, lambda: self.request_once(method, url, **kwargs))
+        except CircuitOpenError as e:
+            return Result(self.retry_codes, error=e.last_error, circuit_open=True)
+
+    async def get(self, url, **kwargs) -> Result:
+        return await self.request("GET", url, **kwargs)
+
+    async def get_many(
+        self, url, count, *, params=None, headers=None, auth=None, concurrency=None, discard_body=False
+    ) -> ResultList:
+        """
+        Send multiple `GET` requests concurrently, by default all of them at once.
+        Results are returned in the order in which the requests were started.
+        With discard_body the response bodies are not kept, see request_once().
+        """
+        semaphore = asyncio.Semaphore(concurrency or count or 1)
+
+        async def _get():
+            async with semaphore:
+                return await self.get(url, params=params, headers=headers, auth=auth, discard_body=discard_body)
+
+        return ResultList(await asyncio.gather(*(_get() for _ in range(count))))
+
 
 class ForceSNIClient(KuadrantClient):
     """Kuadrant client that forces SNI for each request"""
@@ -227,8 +718,9 @@ class ForceSNIClient(KuadrantClient):
         sni_hostname: str = None,
         **kwargs,
     ):
-        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
+        # SNI has to be known before the connection pool is selected
         self.sni_hostname = sni_hostname
+        super().__init__(verify=verify, cert=cert, retry_codes=retry_codes, **kwargs)
 
     def build_request(
         self,
@@ -0,0 +1,54 @@
+"""Incremental reading of response bodies which are too large to be kept in memory"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import AsyncIterable, Iterable, Optional
+
+
+@dataclass
+class BodySummary:
+    """Size, digest and beginning of a response body which was discarded while reading"""
+
+    size: int
+    digest: Optional[str]
+    head: bytes
+
+
+@dataclass
+class DiscardBody:
+    """
+    Reads the response body in chunks without keeping it.
+    Digest is the name of the hashlib algorithm (None disables hashing),
+    capture is the number of the first bytes kept for debugging.
+    """
+
+    digest: Optional[str] = "sha256"
+    capture: int = 0
+
+    def _reader(self):
+        size = 0
+        head = b""
+        hasher = hashlib.new(self.digest) if self.digest else None
+        while (chunk := (yield)) is not None:
+            size += len(chunk)
+            if len(head) < self.capture:
+                head += chunk[: self.capture - len(head)]
+            if hasher:
+                hasher.update(chunk)
+        yield BodySummary(size, hasher.hexdigest() if hasher else None, head)
+
+    def read(self, chunks: Iterable[bytes]) -> BodySummary:
+        """Consumes all the chunks and returns summary of them"""
+        reader = self._reader()
+        next(reader)
+        for chunk in chunks:
+            reader.send(chunk)
+        return reader.send(None)
+
+    async def aread(self, chunks: AsyncIterable[bytes]) -> BodySummary:
+        """Asyncio variant of the read"""
+        reader = self._reader()
+        next(reader)
+        async for chunk in chunks:
+            reader.send(chunk)
+        return reader.send(None)
@@ -0,0 +1,183 @@
+"""Latency recording of the requests sent by KuadrantClient"""
+
+import contextlib
+import json
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, fields
+from typing import Iterator, Optional
+
+# Phases of a request, connect and tls are zero if an already open connection was reused
+PHASES = ("connect", "tls", "ttfb", "total")
+
+
+@dataclass
+class RequestTimings:
+    """Durations of the phases of a single request in seconds"""
+
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: float = 0.0
+    total: float = 0.0
+
+
+class RequestTimer:
+    """Callback for the httpx `trace` extension which measures the phases of a request"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: dict[str, float] = {}
+
+    def __call__(self, event: str, info: dict):  # pylint: disable=unused-argument
+        # Events are named e.g. `connection.connect_tcp.started` or `http11.receive_response_headers.complete`
+        _, name, stage = event.split(".")
+        self.marks[f"{name}.{stage}"] = time.perf_counter()
+
+    async def atrace(self, event: str, info: dict):
+        """Callback for the `trace` extension of the asyncio clients"""
+        self(event, info)
+
+    def _duration(self, name: str) -> float:
+        if f"{name}.started" in self.marks and f"{name}.complete" in self.marks:
+            return self.marks[f"{name}.complete"] - self.marks[f"{name}.started"]
+        return 0.0
+
+    def timings(self) -> RequestTimings:
+        """Returns timings of the finished request"""
+        end = time.perf_counter()
+        headers = self.marks.get("receive_response_headers.complete", end)
+        return RequestTimings(
+            connect=self._duration("connect_tcp"),
+            tls=self._duration("start_tls"),
+            ttfb=headers - self.start,
+            total=end - self.start,
+        )
+
+
+class Histogram:
+    """
+    Histogram of durations with logarithmic buckets (similar to HdrHistogram), which keeps relative error of
+    the percentiles under the precision while using only a handful of buckets for thousands of values
+    """
+
+    # Smallest distinguishable duration (1 microsecond)
+    UNIT = 1e-6
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.buckets: Counter[int] = Counter()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float):
+        """Records duration in seconds"""
+        self.buckets[int(math.log(max(value, self.UNIT) / self.UNIT) / self._log_base)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram"):
+        """Adds all values of the other histogram with the same precision into this one"""
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the duration under which the percentile (0-100) of the values are"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(percentile / 100 * self.count)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                value = self.UNIT * math.exp((bucket + 0.5) * self._log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean duration"""
+        return self.sum / self.count if self.count else 0.0
+
+    def summary(self) -> dict:
+        """Returns count and the most interesting statistics in milliseconds"""
+        return {
+            "count": self.count,
+            "min_ms": round(self.min * 1000, 3) if self.count else 0.0,
+            "mean_ms": round(self.mean * 1000, 3),
+            **{f"p{p}_ms".replace(".", "_"): round(self.percentile(p) * 1000, 3) for p in (50, 90, 99, 99.9)},
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+    def to_dict(self) -> dict:
+        """Returns the summary together with the raw buckets, which allows merging the histograms later"""
+        return {**self.summary(), "precision": self.precision, "buckets": dict(sorted(self.buckets.items()))}
+
+
+class LatencyRecorder:
+    """Latency histograms of every request phase per hostname"""
+
+    # Recorders capturing all requests sent by any client, see capture()
+    _active: list["LatencyRecorder"] = []
+    _active_lock = threading.Lock()
+
+    def __init__(self):
+        self.histograms: dict[str, dict[str, Histogram]] = defaultdict(lambda: {phase: Histogram() for phase in PHASES})
+        self._lock = threading.Lock()
+
+    def record(self, hostname: str, timings: RequestTimings, propagate: bool = True):
+        """Records timings of a request to the hostname, by default also to all the capturing recorders"""
+        with self._lock:
+            histograms = self.histograms[hostname]
+            for phase in fields(timings):
+                histograms[phase.name].record(getattr(timings, phase.name))
+        if propagate:
+            with self._active_lock:
+                active = list(self._active)
+            for recorder in active:
+                recorder.record(hostname, timings, propagate=False)
+
+    @classmethod
+    @contextlib.contextmanager
+    def capture(cls) -> Iterator["LatencyRecorder"]:
+        """Records latencies of all requests sent by any KuadrantClient inside the block"""
+        recorder = cls()
+        with cls._active_lock:
+            cls._active.append(recorder)
+        try:
+            yield recorder
+        finally:
+            with cls._active_lock:
+                cls._active.remove(recorder)
+
+    def summary(self, hostname: Optional[str] = None) -> dict:
+        """Returns summary of all phases per hostname, or only of the single hostname"""
+        with self._lock:
+            if hostname is not None:
+                return {phase: hist.summary() for phase, hist in self.histograms[hostname].items()}
+            return {
+                host: {phase: hist.summary() for phase, hist in hists.items()}
+                for host, hists in self.histograms.items()
+            }
+
+    def to_json(self) -> str:
+        """Returns all histograms including their buckets as JSON"""
+        with self._lock:
+            return json.dumps(
+                {
+                    host: {phase: hist.to_dict() for phase, hist in hists.items()}
+                    for host, hists in self.histograms.items()
+                }
+            )
+
+    def __bool__(self):
+        return bool(self.histograms)
@@ -0,0 +1,148 @@
+"""
+Open-loop load generation on top of KuadrantClient.
+Requests are sent at times given by the schedule, regardless of when the responses arrive,
+so the results do not depend on the latency between the testsuite and the gateway.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from testsuite.httpx import KuadrantClient, Result, ResultList
+from testsuite.utils.constants import LOAD_MAX_IN_FLIGHT
+
+# Target requests per second at the given number of seconds since the start of the load
+Schedule = Callable[[float], float]
+
+
+def constant(rps: float) -> Schedule:
+    """Sends requests at the same rate for the whole duration"""
+    return lambda _: rps
+
+
+def ramp(start_rps: float, end_rps: float, duration: float) -> Schedule:
+    """Linearly changes the rate from start_rps to end_rps during the duration, then keeps end_rps"""
+    return lambda elapsed: start_rps + (end_rps - start_rps) * min(elapsed / duration, 1.0)
+
+
+def steps(*stages: tuple[float, float]) -> Schedule:
+    """Sends requests at the rate of each (duration, rps) stage one after another, then keeps the last rate"""
+
+    def _schedule(elapsed):
+        for duration, rps in stages:
+            if elapsed < duration:
+                return rps
+            elapsed -= duration
+        return stages[-1][1]
+
+    return _schedule
+
+
+@dataclass
+class Sample:
+    """Single request of the load, times are in seconds since the start of the load"""
+
+    scheduled: float
+    sent: float
+    latency: float
+    # Result of the request, either httpx Result or GRPCResult
+    result: Any
+
+    @property
+    def status(self) -> Optional[Any]:
+        """Status code of the response (gRPC status code for gRPC calls), None if the request failed"""
+        if isinstance(self.result, Result):
+            return self.result.response.status_code if self.result.response is not None else None
+        return self.result.status_code
+
+
+class Timeline(list[Sample]):
+    """List of samples ordered by the time they were scheduled"""
+
+    def window(self, start: float, end: float) -> "Timeline":
+        """Returns samples sent in the [start, end) window"""
+        return Timeline(sample for sample in self if start <= sample.sent < end)
+
+    def count_status(self, status: Optional[Any]) -> int:
+        """Returns number of samples with the status code, unlike list.count() which compares whole samples"""
+        return sum(1 for sample in self if sample.status == status)
+
+    def first(self, status: Optional[Any]) -> Optional[Sample]:
+        """Returns the first sample with the status code, None if there is none"""
+        return next((sample for sample in self if sample.status == status), None)
+
+    def statuses(self) -> list[Optional[Any]]:
+        """Returns status codes of all samples"""
+        return [sample.status for sample in self]
+
+    def results(self) -> ResultList:
+        """Returns results of all samples"""
+        return ResultList(sample.result for sample in self)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between sending the first request and receiving the last response"""
+        if not self:
+            return 0.0
+        return max(sample.sent + sample.latency for sample in self) - self[0].sent
+
+    @property
+    def throughput(self) -> float:
+        """Achieved number of responses per second"""
+        return len(self) / self.duration if self.duration else 0.0
+
+    @property
+    def max_lag(self) -> float:
+        """Maximal delay of sending a request after its scheduled time, high lag means the rate was not achieved"""
+        return max((sample.sent - sample.scheduled for sample in self), default=0.0)
+
+
+def send_times(schedule: Schedule, duration: float, resolution: float = 0.001) -> list[float]:
+    """Returns times (seconds since the start) at which the requests should be sent"""
+    times = []
+    # The schedule is integrated in small steps, a request is sent every time the integral reaches a whole number
+    credit = 1.0
+    for step in range(int(duration / resolution)):
+        elapsed = step * resolution
+        if credit >= 1.0:
+            times.append(elapsed)
+            credit -= 1.0
+        credit += schedule(elapsed) * resolution
+    return times
+
+
+def run_schedule(
+    send: Callable[[], Any], schedule: Schedule, duration: float, max_in_flight=LOAD_MAX_IN_FLIGHT
+) -> Timeline:
+    """Calls send according to the schedule for the duration (in seconds) and returns the timeline of the results"""
+    start = time.perf_counter()
+
+    def _send(scheduled: float) -> Sample:
+        sent = time.perf_counter() - start
+        result = send()
+        return Sample(scheduled, sent, time.perf_counter() - start - sent, result)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="load") as executor:
+        futures = []
+        for scheduled in send_times(schedule, duration):
+            time.sleep(max(scheduled - (time.perf_counter() - start), 0))
+            futures.append(executor.submit(_send, scheduled))
+    return Timeline(future.result() for future in futures)
+
+
+def generate_load(
+    client: KuadrantClient,
+    url,
+    schedule: Schedule,
+    duration: float,
+    *,
+    method="GET",
+    max_in_flight=LOAD_MAX_IN_FLIGHT,
+    **kwargs,
+) -> Timeline:
+    """
+    Sends requests according to the schedule for the duration (in seconds) and returns the timeline of them.
+    Requests are not retried, additional arguments are passed to the client.request_once().
+    """
+    return run_schedule(lambda: client.request_once(method, url, **kwargs), schedule, duration, max_in_flight)
@@ -0,0 +1,242 @@
+"""Retry policy of the KuadrantClients, with optional retry budget and per-host circuit breakers"""
+
+import asyncio
+import threading
+import time
+from enum import Flag, auto
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import backoff
+from httpx import TransportError
+
+from testsuite.utils.constants import (
+    HTTP_BACKOFF_MAX_RETRIES,
+    HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT,
+    HTTP_CIRCUIT_BREAKER_THRESHOLD,
+    HTTP_RETRY_BUDGET_MIN_RETRIES,
+    HTTP_RETRY_BUDGET_RATIO,
+)
+
+T = TypeVar("T")
+
+
+class ErrorKind(Flag):
+    """Kinds of errors of a failed request, single error can be of multiple kinds"""
+
+    NONE = 0
+    DNS = auto()
+    DISCONNECTED = auto()
+    TIMEOUT = auto()
+    UNEXPECTED_EOF = auto()
+    CONNECTION_REFUSED = auto()
+    CONNECTION_RESET = auto()
+    HANDSHAKE_TIMEOUT = auto()
+    CERT_VERIFY = auto()
+    UNKNOWN_CA = auto()
+    CERT_REQUIRED = auto()
+    CIRCUIT_OPEN = auto()
+    OTHER = auto()
+
+
+ERROR_MESSAGES = (
+    ("nodename nor servname provided, or not known", ErrorKind.DNS),
+    ("Name or service not known", ErrorKind.DNS),
+    ("No address associated with hostname", ErrorKind.DNS),
+    ("Server disconnected without sending a response.", ErrorKind.DISCONNECTED),
+    ("timed out", ErrorKind.TIMEOUT),
+    ("SSL: UNEXPECTED_EOF_WHILE_READING", ErrorKind.UNEXPECTED_EOF),
+    ("Connection refused", ErrorKind.CONNECTION_REFUSED),
+    ("Connection reset by peer", ErrorKind.CONNECTION_RESET),
+    ("The handshake operation timed out", ErrorKind.HANDSHAKE_TIMEOUT),
+    ("SSL: CERTIFICATE_VERIFY_FAILED", ErrorKind.CERT_VERIFY),
+    ("SSL: TLSV1_ALERT_UNKNOWN_CA", ErrorKind.UNKNOWN_CA),
+    ("SSL: TLSV13_ALERT_CERTIFICATE_REQUIRED", ErrorKind.CERT_REQUIRED),
+)
+
+# Errors which are considered an instability, requests failing with them are retried
+RETRYABLE_ERRORS = ErrorKind.DNS | ErrorKind.DISCONNECTED | ErrorKind.TIMEOUT | ErrorKind.UNEXPECTED_EOF
+
+# Errors which mean the host itself is unreachable, only those are counted by the circuit breakers
+CONNECTIVITY_ERRORS = (
+    ErrorKind.DISCONNECTED | ErrorKind.TIMEOUT | ErrorKind.CONNECTION_REFUSED | ErrorKind.CONNECTION_RESET
+)
+
+TLS_ERRORS = (
+    ErrorKind.UNEXPECTED_EOF | ErrorKind.CONNECTION_REFUSED | ErrorKind.CONNECTION_RESET | ErrorKind.HANDSHAKE_TIMEOUT
+)
+
+
+class CircuitOpenError(TransportError):
+    """Request was not sent, because the host is known to be unhealthy, last_error is the error it failed with"""
+
+    def __init__(self, message: str, last_error: Optional[Exception]):
+        super().__init__(message)
+        self.last_error = last_error
+
+
+def classify(error: Optional[Exception]) -> ErrorKind:
+    """Returns all kinds of the error, based on its messages"""
+    if error is None:
+        return ErrorKind.NONE
+    if isinstance(error, CircuitOpenError):
+        return ErrorKind.CIRCUIT_OPEN
+    kind = ErrorKind.NONE
+    for arg in error.args:
+        if isinstance(arg, str):
+            for message, message_kind in ERROR_MESSAGES:
+                if message in arg:
+                    kind |= message_kind
+    return kind or ErrorKind.OTHER
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single host.
+    After threshold consecutive connectivity failures the circuit opens and new requests fail fast,
+    after reset_timeout single trial request is let through, which either closes the circuit or opens it again.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True, if new requests are rejected"""
+        with self._lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """Returns True, if a new request can be sent to the host"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record(self, error: Optional[Exception]):
+        """Records the outcome of a request to the host, errors other than connectivity ones are not failures"""
+        with self._lock:
+            self._trial = False
+            if not classify(error) & CONNECTIVITY_ERRORS:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            self.last_error = error
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    Decides which requests are retried and how long to wait between the attempts.
+    Optionally, retries are limited by a budget (ratio of retries to all sent requests) and by per-host circuit
+    breakers shared by all clients using the same policy, so once a host is known to be down new requests to it
+    fail fast instead of each of them going through the whole backoff. Both are disabled by default,
+    as tests often provoke the errors on purpose, see guarded().
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        max_tries: int = HTTP_BACKOFF_MAX_RETRIES,
+        budget_ratio: Optional[float] = None,
+        budget_min_retries: int = HTTP_RETRY_BUDGET_MIN_RETRIES,
+        breaker_threshold: Optional[int] = None,
+        breaker_reset_timeout: float = HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT,
+        wait_gen: Callable = backoff.fibo,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.max_tries = max_tries
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.wait_gen = wait_gen
+        self.requests = 0
+        self.retries = 0
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def guarded(cls, max_tries: int = HTTP_BACKOFF_MAX_RETRIES) -> "RetryPolicy":
+        """Returns policy with the default retry budget and circuit breakers, for modules opting in to them"""
+        return cls(
+            max_tries,
+            budget_ratio=HTTP_RETRY_BUDGET_RATIO,
+            breaker_threshold=HTTP_CIRCUIT_BREAKER_THRESHOLD,
+        )
+
+    def breaker(self, host: str) -> Optional[CircuitBreaker]:
+        """Returns circuit breaker of the host, None if the circuit breakers are disabled"""
+        if self.breaker_threshold is None:
+            return None
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_reset_timeout)
+            return self.breakers[host]
+
+    def _waits(self):
+        waits = self.wait_gen()
+        next(waits)
+        return waits
+
+    def _should_retry(self, host: str, result, attempt: int) -> bool:
+        """Records the result of an attempt and returns True, if the request should be sent again"""
+        if breaker := self.breaker(host):
+            breaker.record(result.error)
+        with self._lock:
+            self.requests += 1
+            if not result.should_backoff() or attempt >= self.max_tries:
+                return False
+            if (
+                self.budget_ratio is not None
+                and self.retries >= self.budget_min_retries + self.budget_ratio * self.requests
+            ):
+                return False
+            self.retries += 1
+            return True
+
+    def _check_breaker(self, host: str):
+        breaker = self.breaker(host)
+        if breaker and not breaker.allow():
+            raise CircuitOpenError(
+                f"Circuit breaker for {host} is open, the host failed repeatedly with: {breaker.last_error}",
+                breaker.last_error,
+            )
+
+    def execute(self, host: str, send: Callable[[], T]) -> T:
+        """Sends the request to the host and retries it, raises CircuitOpenError if the host is known to be down"""
+        self._check_breaker(host)
+        waits = self._waits()
+        attempt = 1
+        while True:
+            result = send()
+            if not self._should_retry(host, result, attempt):
+                return result
+            time.sleep(next(waits))
+            attempt += 1
+
+    async def aexecute(self, host: str, send: Callable[[], Awaitable[T]]) -> T:
+        """Asyncio variant of the execute"""
+        self._check_breaker(host)
+        waits = self._waits()
+        attempt = 1
+        while True:
+            result = await send()
+            if not self._should_retry(host, result, attempt):
+                return result
+            await asyncio.sleep(next(waits))
+            attempt += 1
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
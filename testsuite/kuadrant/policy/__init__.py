@@ -72,6 +72,9 @@ def is_affected_by(policy: "Policy"):
 class Policy(KubernetesObject):
     """Base class with common functionality for all policies"""
 
+    # Operator is constantly updating status of the policies
+    modify_strategy = "patch"
+
     def wait_for_ready(self):
         """Wait for a Policy to be ready"""
         self.refresh()
@@ -62,6 +62,19 @@ class Section:
 
         return self.obj.modify_and_apply(_new_modifier, retries, cmd_args)
 
+    def modify_and_patch(self, modifier_func):
+        """Reimplementation of modify_and_patch from KubernetesObject"""
+
+        def _new_modifier(obj):
+            modifier_func(self.__class__(obj, self.section_name))
+
+        return self.obj.modify_and_patch(_new_modifier)
+
+    @property
+    def modify_strategy(self):
+        """Sections are modified in the same way as the object they belong to"""
+        return self.obj.modify_strategy
+
     @property
     def committed(self):
         """Reimplementation of commit from OpenshiftObject"""
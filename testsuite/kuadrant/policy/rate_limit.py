@@ -1,15 +1,42 @@
 """RateLimitPolicy related objects"""
 
+import math
+import re
 import time
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Optional, Union
 
 from testsuite.gateway import Referencable
 from testsuite.kubernetes import modify
 from testsuite.kubernetes.client import KubernetesClient
 from testsuite.kuadrant.policy import Policy, CelPredicate, CelExpression, Strategy
 from testsuite.utils import asdict
-from testsuite.utils.constants import RLP_POST_ENFORCEMENT_WAIT
+from testsuite.utils.constants import RLP_POST_ENFORCEMENT_WAIT, RLP_WINDOW_JITTER_GUARD
+
+WINDOW_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+# Resolution of the reset values in the rate limit headers, in seconds
+RATE_LIMIT_HEADER_GRANULARITY = 1
+
+
+def parse_window(window: str) -> float:
+    """Returns duration of the window (e.g. "10s", "1m" or "1h30m") in seconds"""
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)", window)
+    if not parts or "".join(number + unit for number, unit in parts) != window:
+        raise ValueError(f"Invalid rate limit window: {window}")
+    return sum(float(number) * WINDOW_UNITS[unit] for number, unit in parts)
+
+
+def reset_from_headers(headers) -> Optional[float]:
+    """
+    Returns seconds until the rate limit resets, if the response has rate limit headers,
+    either X-RateLimit-Reset (draft 03) or RateLimit-Reset/RateLimit with reset parameter (IETF draft)
+    """
+    for name in ("x-ratelimit-reset", "ratelimit-reset"):
+        if name in headers:
+            return float(headers[name].split(",")[0])
+    if match := re.search(r"\breset=(\d+(?:\.\d+)?)", headers.get("ratelimit", "")):
+        return float(match.group(1))
+    return None
 
 
 @dataclass
@@ -19,6 +46,59 @@ class Limit:
     limit: int
     window: str
 
+    @property
+    def seconds(self) -> float:
+        """Duration of the window in seconds"""
+        return parse_window(self.window)
+
+
+class RateLimitWindow:
+    """
+    Tracks the boundary of a fixed Limitador window, so tests wait only until the counters actually reset
+    instead of sleeping for a fixed amount of time.
+    Limitador starts the window with the first hit of the counter, so the boundary is learned from
+    the rate limit headers of the first 429 response if present, otherwise from the first observed response.
+    """
+
+    def __init__(self, window: Union[Limit, str, float], guard: float = RLP_WINDOW_JITTER_GUARD):
+        if isinstance(window, Limit):
+            window = window.seconds
+        self.duration = parse_window(window) if isinstance(window, str) else float(window)
+        self.guard = guard
+        self.first_seen: Optional[float] = None
+        self.reset_at: Optional[float] = None
+
+    def observe(self, response) -> None:
+        """Records the response (or Result) sent in the current window"""
+        now = time.monotonic()
+        if self.first_seen is None:
+            # The counter was created at latest when the first response arrived
+            self.first_seen = now
+        if response.status_code == 429 and self.reset_at is None:
+            reset = reset_from_headers(response.headers)
+            if reset is not None:
+                # Headers are usually truncated to whole seconds, so the window can end up to a second later
+                self.reset_at = now + math.floor(reset) + RATE_LIMIT_HEADER_GRANULARITY
+
+    def observe_all(self, responses: Iterable) -> None:
+        """Records all responses (or Results) sent in the current window"""
+        for response in responses:
+            self.observe(response)
+
+    @property
+    def remaining(self) -> float:
+        """Seconds until the window resets including the guard"""
+        reset_at = self.reset_at
+        if reset_at is None:
+            reset_at = (self.first_seen or time.monotonic()) + self.duration
+        return max(reset_at + self.guard - time.monotonic(), 0.0)
+
+    def wait(self) -> None:
+        """Sleeps until the window resets and starts tracking the next one"""
+        time.sleep(self.remaining)
+        self.first_seen = None
+        self.reset_at = None
+
 
 class RateLimitPolicy(Policy):
     """RateLimitPolicy (or RLP for short) object, used for applying rate limiting rules to a Gateway/HTTPRoute"""
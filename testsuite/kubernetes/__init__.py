@@ -1,14 +1,22 @@
 """Kubernetes common objects"""
 
+import contextlib
 import dataclasses
 import functools
+import json
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Literal
+from typing import Iterator, Optional, Literal, Sequence, TypeGuard
 
-from openshift_client import APIObject, timeout, OpenShiftPythonException
+import openshift_client as oc
+from openshift_client import APIObject, timeout, OpenShiftPythonException, Model, Result
 
-from testsuite.utils.constants import K8S_DELETE_TIMEOUT, K8S_WAIT_UNTIL_TIMEOUT
+from testsuite.utils.constants import K8S_DELETE_POLL_INTERVAL, K8S_DELETE_TIMEOUT, K8S_WAIT_UNTIL_TIMEOUT
 
+from testsuite.kubernetes.api import PATCH_FIELD_MANAGER, KubernetesAPI, api_for_context
+from testsuite.kubernetes.informer import InformerCache, cache_for_context
 from testsuite.lifecycle import LifecycleObject
 from testsuite.utils import asdict
 
@@ -16,10 +24,120 @@ from testsuite.utils import asdict
 class KubernetesObject(APIObject, LifecycleObject):
     """Custom APIObjects which tracks if the object was already committed to the server or not"""
 
+    # Timeout for the delete() operation, some objects might need more time for clean-up
+    delete_timeout = K8S_DELETE_TIMEOUT
+
+    # How @modify decorated methods update committed objects: "replace" sends the whole modified object,
+    # "patch" sends only the changed fields, which is preferable for objects whose status is frequently updated
+    modify_strategy: Literal["replace", "patch"] = "replace"
+
     def __init__(self, dict_to_model=None, string_to_model=None, context=None):
         super().__init__(dict_to_model, string_to_model, context)
         self._committed = None
 
+    @property
+    def api(self) -> Optional[KubernetesAPI]:
+        """Native Kubernetes API transport used for this object, None if `oc` binary should be used instead"""
+        return api_for_context(self.context)
+
+    @property
+    def cache(self) -> Optional[InformerCache]:
+        """Informer cache serving reads of this object, None if the object is always read from the server"""
+        cache = cache_for_context(self.context)
+        if cache is None or not cache.handles(self.model.apiVersion):
+            return None
+        return cache
+
+    def _set_model(self, model: dict):
+        """Sets model returned by the server and writes it through to the informer cache"""
+        self.model = Model(model)
+        if cache := self.cache:
+            cache.update(model, self._api_namespace)
+
+    @property
+    def _api_namespace(self):
+        """Namespace used for native API requests"""
+        return self.namespace(if_missing=None) or self.context.get_project() or self.api.namespace
+
+    def exists(self, *args, **kwargs):
+        """Returns whether the object exists on the server, see APIObject.exists()"""
+        api = self.api
+        if api is None or args or kwargs:
+            return super().exists(*args, **kwargs)
+        return api.exists(self.model.apiVersion, self.kind(lowercase=False), self.name(), self._api_namespace), None
+
+    def create(self, cmd_args=None):
+        """Creates the modeled object on the server"""
+        api = self.api
+        if api is None:
+            return super().create(cmd_args)
+        self._set_model(api.create(self.as_dict(), self._api_namespace))
+        return Result("create")
+
+    def refresh(self):
+        """Refreshes the model of this object from the server"""
+        api = self.api
+        if api is None:
+            return super().refresh()
+        kind = self.kind(lowercase=False)
+        if cache := self.cache:
+            if (model := cache.get(self.model.apiVersion, kind, self._api_namespace, self.name())) is not None:
+                self.model = Model(model)
+                return self
+        self.model = Model(api.get(self.model.apiVersion, kind, self.name(), self._api_namespace))
+        return self
+
+    def modify_and_apply(self, modifier_func, retries=2, cmd_args=None, **kwargs):
+        """
+        Calls modifier_func with self and applies the modified model to the server, retrying on conflicts.
+        With the native API transport the model is replaced on the server and updated with the server response.
+        """
+        api = self.api
+        if api is None:
+            return super().modify_and_apply(modifier_func, retries=retries, cmd_args=cmd_args, **kwargs)
+
+        result = Result("apply")
+        if not self.model.metadata.get("resourceVersion"):
+            # Without resourceVersion the replace would silently overwrite concurrent changes,
+            # start from the current server state instead, so the modifier is applied on top of it
+            self.refresh()
+        for attempt in reversed(range(retries + 1)):
+            if modifier_func(self, **kwargs) is False:
+                break
+
+            manifest = self.as_dict()
+            manifest["metadata"].pop("managedFields", None)
+            try:
+                self._set_model(api.replace(manifest, self._api_namespace))
+                return result, True
+            except OpenShiftPythonException as e:
+                if e.result is not None:
+                    result.add_result(e.result)
+                if attempt != 0:
+                    self.refresh()
+        return result, False
+
+    def modify_and_patch(self, modifier_func):
+        """
+        Calls modifier_func with self and sends only the changed fields to the server as a JSON merge patch.
+        Unlike modify_and_apply, it does not need the up-to-date resourceVersion, so it never conflicts.
+        """
+        before = self.as_dict()
+        result = Result("patch")
+        if modifier_func(self) is False:
+            return result, False
+        patch = _merge_patch(before, self.as_dict())
+        if not patch:
+            return result, True
+
+        api = self.api
+        if api is None:
+            result = self.patch(patch, strategy="merge", cmd_args=[f"--field-manager={PATCH_FIELD_MANAGER}", "-o=json"])
+            self.model = Model(json.loads(result.out()))
+        else:
+            self._set_model(api.patch(self.model.apiVersion, self.kind(False), self.name(), patch, self._api_namespace))
+        return result, True
+
     @property
     def committed(self):
         """Returns True, if the objects is already committed to the server"""
@@ -43,25 +161,54 @@ class KubernetesObject(APIObject, LifecycleObject):
         self._committed = True
         return self.refresh()
 
+    def server_side_apply(self):
+        """Creates or updates the object with server-side apply, only available with the native API transport"""
+        self._set_model(self.api.apply(self.as_dict(), self._api_namespace))
+        self._committed = True
+        return self
+
     def apply(self, modifier_func=None, retries=2, **kwargs):  # pylint: disable=arguments-renamed
         """
         Wrapper for modify_and_apply method, which applies the changes to the already commited object.
         openshift_client library .apply() method is literally .modify_and_apply(), but with no modifier_func and
         retries set to 0.
         """
-        res, success = super().modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
+        res, success = self.modify_and_apply(modifier_func or (lambda _: True), retries=retries, **kwargs)
         assert success, f"Modify and apply returned non-zero exit code for {self.kind()}/{self.name()}: {res.err()}"
         return res
 
     def delete(self, ignore_not_found=True, cmd_args=None):
         """Deletes the resource, by default ignored not found"""
-        with timeout(K8S_DELETE_TIMEOUT):
-            deleted = super().delete(ignore_not_found, cmd_args)
+        with timeout(self.delete_timeout):
+            api = self.api
+            if api is None:
+                deleted = super().delete(ignore_not_found, cmd_args)
+            else:
+                api.delete(
+                    self.model.apiVersion,
+                    self.kind(lowercase=False),
+                    self.name(),
+                    self._api_namespace,
+                    ignore_not_found=ignore_not_found,
+                )
+                deleted = Result("delete")
+            if cache := self.cache:
+                cache.remove(self.model.apiVersion, self.kind(lowercase=False), self._api_namespace, self.name())
             self._committed = False
             return deleted
 
     def wait_until(self, test_function, timelimit=K8S_WAIT_UNTIL_TIMEOUT):
         """Waits until the test function succeeds for this object"""
+        if cache := self.cache:
+            informer = cache.informer(self.model.apiVersion, self.kind(lowercase=False), self._api_namespace)
+            if informer is not None:
+                model = informer.wait_until(self.name(), lambda obj: test_function(self.__class__(obj)), timelimit)
+                if model is None:
+                    return False
+                self.model = Model(model)
+                return True
+        if self.api is not None:
+            return self._watch_until(test_function, timelimit)
         try:
             with timeout(timelimit):
                 success, _, _ = self.self_selector().until_all(
@@ -74,6 +221,131 @@ class KubernetesObject(APIObject, LifecycleObject):
                 return False
             raise e
 
+    def _watch_until(self, test_function, timelimit):
+        """
+        Opens a watch on this object and evaluates the test function on every change,
+        returns as soon as it succeeds instead of polling the object in intervals
+        """
+        api = self.api
+        deadline = time.monotonic() + timelimit
+        kind = self.kind(lowercase=False)
+        while (remaining := deadline - time.monotonic()) > 0:
+            # (Re)list the object, the watch is then resumed from its resourceVersion
+            model = api.get(self.model.apiVersion, kind, self.name(), self._api_namespace, ignore_not_found=True)
+            resource_version = None
+            if model is not None:
+                if test_function(self.__class__(model)):
+                    self.model = Model(model)
+                    return True
+                resource_version = model["metadata"]["resourceVersion"]
+
+            for event, obj in api.watch(
+                self.model.apiVersion, kind, self._api_namespace, self.name(), resource_version, remaining
+            ):
+                if event == "ERROR":
+                    # Usually 410 Gone, resourceVersion is too old and the object has to be listed again
+                    break
+                if event in ("ADDED", "MODIFIED") and test_function(self.__class__(obj)):
+                    self.model = Model(obj)
+                    return True
+        return False
+
+
+def _has_default_commit(obj) -> TypeGuard[KubernetesObject]:
+    """Returns True if the object is committed just by creating it on the server"""
+    return isinstance(obj, KubernetesObject) and type(obj).commit is KubernetesObject.commit
+
+
+def _batch_key(obj: KubernetesObject):
+    """Objects with the same key can be committed in a single request"""
+    context = obj.context
+    namespace = obj.namespace(if_missing=None) or context.get_project()
+    return context.get_api_url(), context.get_token(), context.get_kubeconfig_path(), namespace
+
+
+def _commit_batch(objects: list[KubernetesObject]):
+    """Creates or updates all objects on the same cluster and namespace with a single multi-document apply"""
+    with objects[0].context:
+        selector = oc.apply([obj.as_dict() for obj in objects])
+        applied = {(result.kind(), result.name()): result.model for result in selector.objects()}
+    for obj in objects:
+        obj.model = applied[(obj.kind(), obj.name())]
+        obj._committed = True  # pylint: disable=protected-access
+
+
+def commit_all(objects: Sequence[LifecycleObject], wait=True) -> list[LifecycleObject]:
+    """
+    Commits all the objects at once and then waits for all of them to get ready concurrently.
+    Plain KubernetesObjects are sent in a single multi-document apply per namespace (with the native API transport
+    they are server-side applied in parallel instead), objects with custom commit() are committed concurrently.
+    Returns the refreshed objects in the same order.
+    """
+    batches: dict[tuple, list[KubernetesObject]] = defaultdict(list)
+    for obj in objects:
+        if _has_default_commit(obj) and obj.api is None:
+            batches[_batch_key(obj)].append(obj)
+    for batch in batches.values():
+        _commit_batch(batch)
+    batched = {id(obj) for batch in batches.values() for obj in batch}
+
+    def _finish(obj):
+        if _has_default_commit(obj) and obj.api is not None:
+            obj.server_side_apply()
+        elif id(obj) not in batched:
+            obj.commit()
+        if wait and hasattr(obj, "wait_for_ready"):
+            obj.wait_for_ready()
+        return obj
+
+    if not objects:
+        return []
+    with ThreadPoolExecutor(max_workers=len(objects)) as executor:
+        return list(executor.map(_finish, objects))
+
+
+@contextlib.contextmanager
+def commit_batch(wait=True) -> Iterator[list[LifecycleObject]]:
+    """Collects objects appended to the yielded list and commits all of them at once on exit, see commit_all()"""
+    objects: list[LifecycleObject] = []
+    yield objects
+    commit_all(objects, wait)
+
+
+def _delete_batch(objects: list[KubernetesObject]):
+    """Deletes all objects on the same cluster and namespace with a single `oc delete --wait=false` and then
+    confirms the deletion of all of them at once"""
+    names = [obj.qname() for obj in objects]
+    with objects[0].context, timeout(max(obj.delete_timeout for obj in objects)):
+        oc.invoke("delete", [*names, "--ignore-not-found", "--wait=false"])
+        while oc.invoke("get", [*names, "--ignore-not-found", "-o=name"]).out().strip():
+            time.sleep(K8S_DELETE_POLL_INTERVAL)
+    for obj in objects:
+        obj._committed = False  # pylint: disable=protected-access
+
+
+def delete_all(objects: Sequence[LifecycleObject]):
+    """
+    Deletes all the objects concurrently and waits until all of them are gone.
+    Plain KubernetesObjects are deleted in bulk per namespace, objects with custom delete() are deleted concurrently.
+    All deletions are attempted, the first error is raised afterwards.
+    """
+    batches: dict[tuple, list[KubernetesObject]] = defaultdict(list)
+    others = []
+    for obj in objects:
+        if isinstance(obj, KubernetesObject) and type(obj).delete is KubernetesObject.delete and obj.api is None:
+            batches[_batch_key(obj)].append(obj)
+        else:
+            others.append(obj)
+
+    if not objects:
+        return
+    with ThreadPoolExecutor(max_workers=len(batches) + len(others)) as executor:
+        futures = [executor.submit(_delete_batch, batch) for batch in batches.values()]
+        futures.extend(executor.submit(obj.delete) for obj in others)
+    for future in futures:
+        if (error := future.exception()) is not None:
+            raise error
+
 
 class CustomResource(KubernetesObject):
     """Custom APIObjects that implements methods that improves manipulation with CR objects"""
@@ -96,6 +368,20 @@ class CustomResource(KubernetesObject):
             self.model.spec[name] = value
 
 
+def _merge_patch(old: dict, new: dict) -> dict:
+    """Returns JSON merge patch (RFC 7386), which transforms the old dict into the new one"""
+    patch: dict = {key: None for key in old.keys() - new.keys()}
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            if nested := _merge_patch(old[key], value):
+                patch[key] = nested
+        elif value != old[key]:
+            patch[key] = value
+    return patch
+
+
 def modify(func):
     """Wraps method of a subclass of KubernetesObject to use modify_and_apply when the object
     is already committed to the server, or run it normally if it isn't.
@@ -112,7 +398,10 @@ def modify(func):
     @functools.wraps(func)
     def _wrap(self, *args, **kwargs):
         if self.committed:
-            result, _ = self.modify_and_apply(_custom_partial(func, *args, **kwargs))
+            if self.modify_strategy == "patch":
+                result, _ = self.modify_and_patch(_custom_partial(func, *args, **kwargs))
+            else:
+                result, _ = self.modify_and_apply(_custom_partial(func, *args, **kwargs))
             assert result.status
         else:
             func(self, *args, **kwargs)
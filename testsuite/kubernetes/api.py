@@ -0,0 +1,348 @@
+"""
+Native Kubernetes API transport.
+Talks to the API server over a single pooled HTTP/2 connection instead of forking `oc` binary for every operation.
+All operations return/raise openshift_client Result and OpenShiftPythonException, so callers can't tell the difference.
+"""
+
+import base64
+import json
+import ssl
+import threading
+import time
+from typing import Any, Iterator, NoReturn, Optional
+
+import httpx
+from openshift_client import OpenShiftPythonException, Result, cur_context
+from openshift_client.action import Action
+
+from testsuite.httpx import create_tmp_file
+from testsuite.utils.constants import K8S_API_REQUEST_TIMEOUT, K8S_API_POLL_INTERVAL, K8S_DELETE_TIMEOUT
+
+FIELD_MANAGER = "kuadrant-testsuite"
+# Field manager of the changes done by patching single fields, so they are distinguishable from the applied ones
+PATCH_FIELD_MANAGER = "kuadrant-testsuite-modify"
+
+
+def api_for_context(context) -> Optional["KubernetesAPI"]:
+    """Returns API transport bound to the context (or any of its parents), None if `oc` binary should be used"""
+    while context is not None:
+        api = getattr(context, "kubernetes_api", None)
+        if api is not None:
+            return api
+        context = context.parent
+    return None
+
+
+class KubernetesAPI:
+    """Minimal Kubernetes REST client, which shares one HTTP/2 connection for all the requests"""
+
+    def __init__(self, api_url: str, token: str = None, verify: ssl.SSLContext | bool = True, cert=None):
+        headers = {"Accept": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self.api_url = api_url
+        self.namespace = "default"
+        self.files: list = []
+        self.client = httpx.Client(
+            base_url=api_url,
+            headers=headers,
+            verify=verify,
+            cert=cert,
+            http2=True,
+            timeout=K8S_API_REQUEST_TIMEOUT,
+        )
+        self._resources: dict[str, dict[str, tuple[str, bool]]] = {}
+        self._verbs: dict[tuple[str, str], list[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_kubeconfig(cls, config: dict, api_url: str = None, token: str = None) -> "KubernetesAPI":
+        """
+        Creates API transport from the minified raw kubeconfig (`oc config view --minify --raw`)
+        Explicitly configured API URL and token take precedence over the ones stored in kubeconfig
+        """
+        cluster = config["clusters"][0]["cluster"] if config.get("clusters") else {}
+        user = config["users"][0]["user"] if config.get("users") else {}
+        api_url = api_url or cluster["server"]
+
+        files = []
+        verify: ssl.SSLContext | bool = True
+        if cluster.get("insecure-skip-tls-verify"):
+            verify = False
+        elif "certificate-authority-data" in cluster:
+            verify = ssl.create_default_context(
+                cadata=base64.b64decode(cluster["certificate-authority-data"]).decode("utf-8")
+            )
+        elif "certificate-authority" in cluster:
+            verify = ssl.create_default_context(cafile=cluster["certificate-authority"])
+
+        cert = None
+        if not token:
+            token = user.get("token")
+            if "client-certificate-data" in user:
+                files.append(create_tmp_file(base64.b64decode(user["client-certificate-data"]).decode("utf-8")))
+                files.append(create_tmp_file(base64.b64decode(user["client-key-data"]).decode("utf-8")))
+                cert = (files[0].name, files[1].name)
+            elif "client-certificate" in user:
+                cert = (user["client-certificate"], user["client-key"])
+
+        api = cls(api_url, token, verify, cert)
+        api.files = files
+        if config.get("contexts"):
+            api.namespace = config["contexts"][0]["context"].get("namespace", api.namespace)
+        return api
+
+    def close(self):
+        """Closes the underlying connection"""
+        self.client.close()
+        for file in self.files:
+            file.close()
+        self.files = []
+
+    def _resource(self, api_version: str, kind: str) -> tuple[str, bool]:
+        """Returns plural name and whether the resource is namespaced, discovery is done once per API group"""
+        with self._lock:
+            if api_version not in self._resources:
+                prefix = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+                discovery = self._request("discovery", "GET", prefix).json()
+                resources = [res for res in discovery["resources"] if "/" not in res["name"]]
+                self._resources[api_version] = {res["kind"]: (res["name"], res["namespaced"]) for res in resources}
+                self._verbs.update({(api_version, res["kind"]): res.get("verbs", []) for res in resources})
+        try:
+            return self._resources[api_version][kind]
+        except KeyError:
+            raise OpenShiftPythonException(
+                f"Error from server (NotFound): the server doesn't have a resource type {kind} in {api_version}"
+            ) from None
+
+    def supports(self, api_version: str, kind: str, verb: str) -> bool:
+        """Returns True if the resource supports the verb (e.g. deletecollection)"""
+        self._resource(api_version, kind)
+        return verb in self._verbs[(api_version, kind)]
+
+    def path(self, api_version: str, kind: str, namespace: str = None, name: str = None) -> str:
+        """Returns REST path of a resource collection or of a specific resource if name is specified"""
+        plural, namespaced = self._resource(api_version, kind)
+        path = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+        if namespaced and namespace:
+            path += f"/namespaces/{namespace}"
+        path += f"/{plural}"
+        if name:
+            path += f"/{name}"
+        return path
+
+    def _request(
+        self, verb: str, method: str, path: str, *, auto_raise=True, ignore_not_found=False, **kwargs
+    ) -> httpx.Response:
+        """
+        Sends the request and records it as an openshift_client Action for tracking and error reporting.
+        Honors the remaining time of the surrounding openshift_client `timeout()` contexts.
+        """
+        remaining, _ = cur_context().get_min_remaining_seconds()
+        timeout = K8S_API_REQUEST_TIMEOUT if remaining is None else min(remaining, K8S_API_REQUEST_TIMEOUT)
+
+        start = time.monotonic()
+        try:
+            response = self.client.request(method, path, timeout=timeout, **kwargs)
+        except httpx.TimeoutException as e:
+            result = Result(verb)
+            result.add_action(Action(verb, [method, path], "", str(e), None, 1, timeout=True))
+            raise OpenShiftPythonException(f"Timeout during {method} {path}", result) from e
+
+        if not (response.is_success or not auto_raise or (ignore_not_found and response.status_code == 404)):
+            self._raise_error(verb, method, path, response, time.monotonic() - start)
+        return response
+
+    def _raise_error(self, verb: str, method: str, path: str, response: httpx.Response, elapsed: float) -> NoReturn:
+        """Raises OpenShiftPythonException with the failed request recorded as an openshift_client Action"""
+        result = Result(verb)
+        result.add_action(
+            Action(
+                verb,
+                [method, path],
+                "",
+                self._error_message(response),
+                None,
+                response.status_code,
+                elapsed_time=elapsed,
+            )
+        )
+        raise OpenShiftPythonException(f"Error during object {verb}: {self._error_message(response)}", result)
+
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Formats API Status error in the same way as kubectl/oc does"""
+        try:
+            status = response.json()
+            return f"Error from server ({status.get('reason', response.status_code)}): {status.get('message', '')}"
+        except ValueError:
+            return f"Error from server ({response.status_code}): {response.text}"
+
+    def get(self, api_version: str, kind: str, name: str, namespace: str = None, ignore_not_found=False):
+        """Returns the resource as a dict, or None if it does not exist and ignore_not_found is set"""
+        response = self._request(
+            "get", "GET", self.path(api_version, kind, namespace, name), ignore_not_found=ignore_not_found
+        )
+        if response.status_code == 404:
+            return None
+        return response.json()
+
+    def get_raw(self, path: str) -> str:
+        """Returns plain text response of the path, e.g. of a pod or service proxy (`oc get --raw`)"""
+        return self._request("get", "GET", path, headers={"Accept": "text/plain, */*"}).text
+
+    def exists(self, api_version: str, kind: str, name: str, namespace: str = None) -> bool:
+        """Returns True if the resource exists"""
+        return self.get(api_version, kind, name, namespace, ignore_not_found=True) is not None
+
+    def list_with_version(
+        self, api_version: str, kind: str, namespace: str = None, label_selector: str = None, field_selector=None
+    ) -> tuple[list[dict], str]:
+        """Lists all resources of the kind together with the resourceVersion of the list, which can be watched from"""
+        params = {}
+        if label_selector:
+            params["labelSelector"] = label_selector
+        if field_selector:
+            params["fieldSelector"] = field_selector
+        response = self._request("get", "GET", self.path(api_version, kind, namespace), params=params).json()
+        items = response["items"]
+        for item in items:
+            # List items do not contain apiVersion and kind
+            item.setdefault("apiVersion", api_version)
+            item.setdefault("kind", kind)
+        return items, response["metadata"].get("resourceVersion")
+
+    def list(
+        self, api_version: str, kind: str, namespace: str = None, label_selector: str = None, field_selector=None
+    ) -> list[dict]:
+        """Lists all resources of the kind, optionally filtered by label and field selectors"""
+        return self.list_with_version(api_version, kind, namespace, label_selector, field_selector)[0]
+
+    def watch(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str = None,
+        name: str = None,
+        resource_version: str = None,
+        timeout: float = 60,
+    ) -> Iterator[tuple[str, dict]]:
+        """
+        Watches resources of the kind (or a single one, if name is set) and yields (event type, object)
+        for every change after the resource_version.
+        Iteration ends when the server closes the stream after timeout seconds or when the connection breaks.
+        """
+        params = {
+            "watch": "true",
+            "timeoutSeconds": str(max(int(timeout), 1)),
+            "allowWatchBookmarks": "true",
+        }
+        if name:
+            params["fieldSelector"] = f"metadata.name={name}"
+        if resource_version:
+            params["resourceVersion"] = resource_version
+        path = self.path(api_version, kind, namespace)
+
+        start = time.monotonic()
+        try:
+            with self.client.stream(
+                "GET", path, params=params, timeout=httpx.Timeout(K8S_API_REQUEST_TIMEOUT, read=timeout + 5)
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    self._raise_error("watch", "GET", path, response, time.monotonic() - start)
+                for line in response.iter_lines():
+                    if line:
+                        event = json.loads(line)
+                        yield event["type"], event["object"]
+        except httpx.TransportError:
+            # Broken or timed out stream is not an error, caller is expected to resume the watch
+            pass
+
+    def create(self, manifest: dict[str, Any], namespace: str = None) -> dict:
+        """Creates the resource and returns it as it was stored by the server"""
+        path = self.path(manifest["apiVersion"], manifest["kind"], manifest["metadata"].get("namespace") or namespace)
+        return self._request("create", "POST", path, json=manifest).json()
+
+    def replace(self, manifest: dict[str, Any], namespace: str = None) -> dict:
+        """Replaces the resource, resourceVersion in the manifest is used for optimistic locking"""
+        path = self.path(
+            manifest["apiVersion"],
+            manifest["kind"],
+            manifest["metadata"].get("namespace") or namespace,
+            manifest["metadata"]["name"],
+        )
+        return self._request("apply", "PUT", path, json=manifest).json()
+
+    def apply(self, manifest: dict[str, Any], namespace: str = None, field_manager=FIELD_MANAGER, force=True) -> dict:
+        """Server-side applies the manifest, creating the resource if it does not exist"""
+        path = self.path(
+            manifest["apiVersion"],
+            manifest["kind"],
+            manifest["metadata"].get("namespace") or namespace,
+            manifest["metadata"]["name"],
+        )
+        return self._request(
+            "apply",
+            "PATCH",
+            path,
+            params={"fieldManager": field_manager, "force": str(force).lower()},
+            headers={"Content-Type": "application/apply-patch+yaml"},
+            content=json.dumps(manifest),
+        ).json()
+
+    def patch(
+        self,
+        api_version: str,
+        kind: str,
+        name: str,
+        patch: dict[str, Any],
+        namespace: str = None,
+        field_manager=PATCH_FIELD_MANAGER,
+    ) -> dict:
+        """Applies JSON merge patch to the resource and returns the patched resource"""
+        return self._request(
+            "patch",
+            "PATCH",
+            self.path(api_version, kind, namespace, name),
+            params={"fieldManager": field_manager},
+            headers={"Content-Type": "application/merge-patch+json"},
+            content=json.dumps(patch),
+        ).json()
+
+    def delete_collection(self, api_version: str, kind: str, namespace: str = None, label_selector: str = None) -> int:
+        """Deletes all resources of the kind matching the label selector in a single request, returns their count"""
+        response = self._request(
+            "delete",
+            "DELETE",
+            self.path(api_version, kind, namespace),
+            params={"labelSelector": label_selector} if label_selector else {},
+        ).json()
+        return len(response.get("items") or [])
+
+    def delete(
+        self,
+        api_version: str,
+        kind: str,
+        name: str,
+        namespace: str = None,
+        ignore_not_found=True,
+        wait=True,
+        timeout: float = K8S_DELETE_TIMEOUT,
+    ) -> bool:
+        """
+        Deletes the resource, returns False if it did not exist.
+        If wait is set, blocks until the resource (and its finalizers) is gone, the same way `oc delete` does,
+        but at most timeout seconds (or less, if the surrounding openshift_client `timeout()` ends sooner).
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        path = self.path(api_version, kind, namespace, name)
+        response = self._request("delete", "DELETE", path, ignore_not_found=ignore_not_found)
+        if response.status_code == 404:
+            return False
+        deadline = time.monotonic() + timeout
+        while wait and self._request("delete", "GET", path, ignore_not_found=True).status_code != 404:
+            if time.monotonic() >= deadline or cur_context().get_out_of_time()[0]:
+                raise OpenShiftPythonException(f"Timeout waiting for deletion of {kind}/{name}")
+            time.sleep(K8S_API_POLL_INTERVAL)
+        return True
@@ -0,0 +1,114 @@
+"""Asyncio interface of the KubernetesClient, which allows running independent cluster operations concurrently"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import openshift_client as oc
+from openshift_client import Context
+
+from testsuite.utils.constants import K8S_WAIT_UNTIL_TIMEOUT
+from . import KubernetesObject
+from .client import KubernetesClient
+
+T = TypeVar("T")
+KubernetesObjectT = TypeVar("KubernetesObjectT", bound=KubernetesObject)
+
+
+class AsyncKubernetesClient:
+    """
+    Awaitable counterpart of the KubernetesClient.
+    Objects passed to it are bound to the cluster, project and transport of the client.
+    Both `oc` binary and the native API transport are blocking, so the operations are run in worker threads
+    and only the waiting is done by the event loop.
+    """
+
+    def __init__(self, client: KubernetesClient):
+        self.client = client
+
+    @classmethod
+    def from_context(cls, context: Context) -> "AsyncKubernetesClient":
+        """Creates self from the context"""
+        return cls(KubernetesClient.from_context(context))
+
+    @staticmethod
+    async def _run(func: Callable[..., T], *args, **kwargs) -> T:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    def _get(self, api_version: str, kind: str, name: str, cls: type[KubernetesObject]) -> Optional[KubernetesObject]:
+        if self.client.transport == "api":
+            model = self.client.api.get(api_version, kind, name, self.client.project, ignore_not_found=True)
+            return None if model is None else cls(model, context=self.client.context)
+        group, _, version = api_version.rpartition("/")
+        resource = f"{kind}.{version}.{group}/{name}" if group else f"{kind}/{name}"
+        with self.client.context:
+            objects = oc.selector(resource).objects(cls=cls, ignore_not_found=True)
+        return objects[0] if objects else None
+
+    async def get(
+        self, api_version: str, kind: str, name: str, cls: type[KubernetesObject] = KubernetesObject
+    ) -> Optional[KubernetesObject]:
+        """Returns the object from the project of this client wrapped in the class, None if it does not exist"""
+        return await self._run(self._get, api_version, kind, name, cls)
+
+    def _bind(self, obj: KubernetesObjectT) -> KubernetesObjectT:
+        """Makes the object use the cluster, project and transport of this client for all its operations"""
+        obj.context = self.client.context
+        return obj
+
+    async def apply(self, obj: KubernetesObjectT) -> KubernetesObjectT:
+        """Creates the object on the server or updates it, if it already exists, see KubernetesObject.commit()"""
+        await self._run(self._bind(obj).commit)
+        return obj
+
+    async def delete(self, obj: KubernetesObject):
+        """Deletes the object from the server, see KubernetesObject.delete()"""
+        await self._run(self._bind(obj).delete)
+
+    async def wait_until(self, obj: KubernetesObject, test_function, timelimit=K8S_WAIT_UNTIL_TIMEOUT) -> bool:
+        """Waits until the object satisfies the test function, see KubernetesObject.wait_until()"""
+        return await self._run(self._bind(obj).wait_until, test_function, timelimit)
+
+    async def wait_for_ready(self, obj):
+        """Waits until the object is ready, the object has to implement wait_for_ready()"""
+        await self._run(self._bind(obj).wait_for_ready)
+
+    async def watch(
+        self, api_version: str, kind: str, name: str = None, timeout: float = 60
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Yields (event type, object) tuples of objects of the kind in the project of this client.
+        Always uses the native API, the watch ends after the timeout, even if the iteration is stopped sooner.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        done = object()
+
+        def _produce():
+            try:
+                for event in self.client.api.watch(api_version, kind, self.client.project, name, timeout=timeout):
+                    loop.call_soon_threadsafe(queue.put_nowait, event)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = loop.run_in_executor(None, _produce)
+        while (event := await queue.get()) is not done:
+            yield event
+        await producer
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Runs the awaitable from synchronous code (e.g. fixtures) and returns its result"""
+
+    async def _await():
+        return await awaitable
+
+    return asyncio.run(_await())
+
+
+def gather_sync(*awaitables: Awaitable[Any]) -> list[Any]:
+    """Runs all the awaitables concurrently from synchronous code and returns their results in the same order"""
+
+    async def _gather():
+        return await asyncio.gather(*awaitables)
+
+    return run_sync(_gather())
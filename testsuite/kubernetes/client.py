@@ -1,8 +1,12 @@
 """This module implements an KubernetesCLI interface using oc/kubectl binary commands."""
 
+import json
 import logging
+import threading
+import time
+from collections import Counter
 from functools import cached_property
-from typing import Optional
+from typing import Callable, Literal, Optional
 from urllib.parse import urlparse
 import tempfile
 import yaml
@@ -12,6 +16,9 @@ from openshift_client import Context, OpenShiftPythonException
 
 from testsuite.kubernetes.openshift.route import OpenshiftRoute
 from testsuite.kubernetes.service import Service
+from testsuite.utils.constants import K8S_IDENTITY_CACHE_TTL
+from .api import KubernetesAPI, api_for_context
+from .informer import InformerCache, cache_for_context
 from .service_account import ServiceAccount
 from .deployment import Deployment
 from .secret import Secret
@@ -24,31 +31,120 @@ class KubernetesClient:
 
     # pylint: disable=too-many-public-methods
 
-    def __init__(self, project: str = None, api_url: str = None, token: str = None, kubeconfig_path: str = None):
+    # Native API transports shared by all clients of the same cluster, regardless of their project
+    _apis: dict[tuple, KubernetesAPI] = {}
+    _caches: dict[tuple, InformerCache] = {}
+    _apis_lock = threading.Lock()
+
+    # Memoized identity lookups (project, API URL, token) shared by all clients, keyed by the connection details
+    # and expiring after K8S_IDENTITY_CACHE_TTL, so changes of the kubeconfig are picked up eventually
+    _identity: dict[tuple, tuple[float, str]] = {}
+    _identity_lock = threading.Lock()
+    # Number of `oc` invocations saved by the memoized lookups, per property
+    saved_calls: Counter[str] = Counter()
+
+    def __init__(
+        self,
+        project: str = None,
+        api_url: str = None,
+        token: str = None,
+        kubeconfig_path: str = None,
+        transport: Literal["oc", "api"] = "oc",
+        use_cache: bool = False,
+    ):
         self._project = project
         self._api_url = api_url
         self._token = token
         self._kubeconfig_path = kubeconfig_path
+        self.transport = transport
+        # Informer cache works only on top of the native API transport
+        self.use_cache = use_cache and transport == "api"
 
     @classmethod
     def from_context(cls, context: Context) -> "KubernetesClient":
         """Creates self from the context"""
-        return cls(context.get_project(), context.get_api_url(), context.get_token(), context.get_kubeconfig_path())
+        return cls(
+            context.get_project(),
+            context.get_api_url(),
+            context.get_token(),
+            context.get_kubeconfig_path(),
+            "api" if api_for_context(context) else "oc",
+            cache_for_context(context) is not None,
+        )
 
     def change_project(self, project) -> "KubernetesClient":
         """Return new self with a different project"""
-        return KubernetesClient(project, self._api_url, self._token, self._kubeconfig_path)
+        return KubernetesClient(
+            project, self._api_url, self._token, self._kubeconfig_path, self.transport, self.use_cache
+        )
+
+    def change_transport(self, transport: Literal["oc", "api"]) -> "KubernetesClient":
+        """Return new self which uses a different transport for talking to the cluster"""
+        return KubernetesClient(
+            self._project, self._api_url, self._token, self._kubeconfig_path, transport, self.use_cache
+        )
 
     @cached_property
     def context(self):
         """Prepare context for command execution"""
-        context = Context()
+        context = self._base_context()
+        # Objects created with this context will use native API transport instead of `oc` binary
+        context.kubernetes_api = self.api if self.transport == "api" else None
+        # Policies, Gateways and Routes will be read from the informer cache
+        context.kubernetes_cache = self.cache if self.use_cache else None
 
+        return context
+
+    @property
+    def api(self) -> KubernetesAPI:
+        """Native Kubernetes API transport, which reuses the credentials of this client"""
+        key = (self._api_url, self._token, self._kubeconfig_path)
+        with self._apis_lock:
+            if key not in self._apis:
+                with self._base_context():
+                    config = json.loads(
+                        oc.invoke("config", ["view", "--minify=true", "--raw=true", "--output=json"]).out()
+                    )
+                self._apis[key] = KubernetesAPI.from_kubeconfig(config, self._api_url, self._token)
+            return self._apis[key]
+
+    @property
+    def cache(self) -> InformerCache:
+        """Informer cache shared by all clients of the same cluster"""
+        api = self.api
+        key = (self._api_url, self._token, self._kubeconfig_path)
+        with self._apis_lock:
+            if key not in self._caches:
+                self._caches[key] = InformerCache(api)
+            return self._caches[key]
+
+    @classmethod
+    def informer_caches(cls) -> list[InformerCache]:
+        """Returns all informer caches that were created so far"""
+        with cls._apis_lock:
+            return list(cls._caches.values())
+
+    def _memoized(self, name: str, lookup: Callable[[], str]) -> str:
+        """Returns the value of the identity property from the cache, looks it up if it is missing or expired"""
+        # Only the project depends on the project of this client, clones by change_project() share the rest
+        project = self._project if name == "project" else None
+        key = (name, project, self._api_url, self._token, self._kubeconfig_path)
+        with self._identity_lock:
+            if (cached := self._identity.get(key)) and time.monotonic() - cached[0] < K8S_IDENTITY_CACHE_TTL:
+                self.saved_calls[name] += 1
+                return cached[1]
+        value = lookup()
+        with self._identity_lock:
+            self._identity[key] = (time.monotonic(), value)
+        return value
+
+    def _base_context(self):
+        """Creates context with the connection details of this client"""
+        context = Context()
         context.project_name = self._project
         context.api_server = self._api_url
         context.token = self._token
         context.kubeconfig_path = self._kubeconfig_path
-
         return context
 
     @property
@@ -66,15 +162,28 @@ class KubernetesClient:
     @property
     def api_url(self):
         """Returns real API url"""
-        return self._api_url or self.inspect_context(jsonpath="{.clusters[*].cluster.server}")
+        return self._api_url or self._memoized(
+            "api_url", lambda: self.inspect_context(jsonpath="{.clusters[*].cluster.server}")
+        )
 
     @property
     def token(self):
         """Returns real Kubernetes token"""
-        return self._token or self.inspect_context(jsonpath="{.users[*].user.token}", raw=True)
+        return self._token or self._memoized(
+            "token", lambda: self.inspect_context(jsonpath="{.users[*].user.token}", raw=True)
+        )
+
+    def _get_object(self, api_version: str, kind: str, name: str, cls):
+        """Returns object fetched through the native API transport wrapped in the testsuite class"""
+        model = self.api.get(api_version, kind, name, self.project, ignore_not_found=True)
+        if model is None:
+            raise OpenShiftPythonException(f"Expected a single object, but selected 0 ({kind}/{name})")
+        return cls(model, context=self.context)
 
     def get_service_account(self, name: str):
         """Select service account by the name and return testsuite ServiceAccount object wrapping it"""
+        if self.transport == "api":
+            return self._get_object("v1", "ServiceAccount", name, ServiceAccount)
         with self.context:
             return oc.selector(f"sa/{name}").object(cls=ServiceAccount)
 
@@ -92,6 +201,11 @@ class KubernetesClient:
     @property
     def project(self):
         """Returns real Kubernetes namespace name"""
+        if self.transport == "api":
+            return self._project or self.api.namespace
+        return self._memoized("project", self._get_project_name)
+
+    def _get_project_name(self):
         with self.context:
             return oc.get_project_name()
 
@@ -130,11 +244,15 @@ class KubernetesClient:
 
     def get_secret(self, name):
         """Returns dict-like structure for accessing secret data"""
+        if self.transport == "api":
+            return self._get_object("v1", "Secret", name, Secret)
         with self.context:
             return oc.selector(f"secret/{name}").object(cls=Secret)
 
     def service_exists(self, name) -> bool:
         """Returns True if service with the given name exists"""
+        if self.transport == "api":
+            return self.api.exists("v1", "Service", name, self.project)
         with self.context:
             return oc.selector(f"svc/{name}").count_existing() == 1
 
@@ -150,14 +268,24 @@ class KubernetesClient:
 
     def get_service(self, service_name: str):
         """Returns dict-like structure for accessing service data"""
+        if self.transport == "api":
+            return self._get_object("v1", "Service", service_name, Service)
         with self.context:
             return oc.selector(f"service/{service_name}").object(cls=Service)
 
     def get_deployment(self, name: str):
         """Returns dict-like structure for accessing deployment data"""
+        if self.transport == "api":
+            return self._get_object("apps/v1", "Deployment", name, Deployment)
         with self.context:
             return oc.selector(f"deployment/{name}").object(cls=Deployment)
 
+    def get_raw(self, path: str) -> str:
+        """Returns plain text response of the API server path, e.g. of a pod or service proxy"""
+        if self.transport == "api":
+            return self.api.get_raw(path)
+        return self.do_action("get", "--raw", path).out()
+
     def do_action(self, verb: str, *args, stdin_str=None, auto_raise: bool = True, parse_output: bool = False):
         """Run an oc command."""
         with self.context:
@@ -184,6 +312,8 @@ class KubernetesClient:
 
     def apply_from_string(self, string, cls, cmd_args=None):
         """Applies new object from the string to the server and returns it wrapped in the class"""
+        if self.transport == "api":
+            return cls(self.api.apply(yaml.safe_load(string), self.project), context=self.context)
         with self.context:
             selector = oc.apply(string, cmd_args=cmd_args)
             obj = selector.object(cls=cls)
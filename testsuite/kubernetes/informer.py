@@ -0,0 +1,310 @@
+"""
+Shared informer cache for frequently read objects (Kuadrant policies, Gateways, Routes).
+Every kind is listed once per namespace and then kept up to date by a watch running in the background,
+so reading or waiting on an object does not need to contact the API server at all.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from openshift_client import OpenShiftPythonException
+
+from testsuite.kubernetes.api import KubernetesAPI
+from testsuite.utils.constants import K8S_INFORMER_RESYNC_PERIOD, K8S_INFORMER_RETRY_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# API groups whose objects are served from the cache
+CACHED_GROUPS = ("kuadrant.io", "gateway.networking.k8s.io")
+
+
+def cache_for_context(context) -> Optional["InformerCache"]:
+    """Returns informer cache bound to the context (or any of its parents), None if caching is disabled"""
+    while context is not None:
+        cache = getattr(context, "kubernetes_cache", None)
+        if cache is not None:
+            return cache
+        context = context.parent
+    return None
+
+
+def _target_refs(obj: dict) -> list[str]:
+    """Returns 'Kind/name' of all objects targeted by a policy"""
+    spec = obj.get("spec") or {}
+    refs = spec.get("targetRefs") or ([spec["targetRef"]] if spec.get("targetRef") else [])
+    return [f"{ref.get('kind')}/{ref.get('name')}" for ref in refs]
+
+
+# Secondary indexes of the store, index name -> function returning index keys of an object
+INDEXERS: dict[str, Callable[[dict], list[str]]] = {
+    "testRun": lambda obj: [value] if (value := (obj["metadata"].get("labels") or {}).get("testRun")) else [],
+    "targetRef": _target_refs,
+}
+
+
+def _is_newer(obj: dict, old: Optional[dict]) -> bool:
+    """Returns True if the object is newer than the old one, resourceVersions are compared as integers if possible"""
+    if old is None:
+        return True
+    try:
+        return int(obj["metadata"]["resourceVersion"]) >= int(old["metadata"]["resourceVersion"])
+    except (KeyError, ValueError):
+        return True
+
+
+@dataclass
+class CacheStats:
+    """Hit rate and staleness statistics of the informer cache"""
+
+    hits: int = 0
+    misses: int = 0
+    staleness: list[float] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of reads served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def max_staleness(self) -> float:
+        """Maximal time (in seconds) since the informer last heard from the server when serving a cache hit"""
+        return max(self.staleness, default=0.0)
+
+    @property
+    def mean_staleness(self) -> float:
+        """Mean time (in seconds) since the informer last heard from the server when serving a cache hit"""
+        return sum(self.staleness) / len(self.staleness) if self.staleness else 0.0
+
+    def __str__(self):
+        return (
+            f"hits={self.hits} misses={self.misses} hit_rate={self.hit_rate:.1%} "
+            f"staleness_mean={self.mean_staleness:.3f}s staleness_max={self.max_staleness:.3f}s"
+        )
+
+
+class Informer:  # pylint: disable=too-many-instance-attributes
+    """Keeps an up-to-date indexed store of all objects of a single kind in a single namespace"""
+
+    def __init__(self, api: KubernetesAPI, api_version: str, kind: str, namespace: str):
+        self.api = api
+        self.api_version = api_version
+        self.kind = kind
+        self.namespace = namespace
+        self.store: dict[str, dict] = {}
+        self.indexes: dict[str, dict[str, set[str]]] = {name: defaultdict(set) for name in INDEXERS}
+        self.resource_version: Optional[str] = None
+        # Monotonic time when the informer last received anything from the server
+        self.last_sync = 0.0
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"informer-{kind}-{namespace}", daemon=True)
+
+    def start(self):
+        """Lists all the objects and starts watching for changes in the background"""
+        self._list()
+        self._thread.start()
+
+    def stop(self):
+        """Stops the background watch after the current watch request ends"""
+        self._stopped.set()
+
+    def _list(self):
+        items, resource_version = self.api.list_with_version(self.api_version, self.kind, self.namespace)
+        with self._condition:
+            for name in list(self.store):
+                self._remove(name)
+            for item in items:
+                self._add(item)
+            self.resource_version = resource_version
+            self._touch()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._watch()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Informer for %s in %s failed, relisting: %s", self.kind, self.namespace, e)
+                time.sleep(K8S_INFORMER_RETRY_INTERVAL)
+                self.resource_version = None
+            if self.resource_version is None and not self._stopped.is_set():
+                try:
+                    self._list()
+                except OpenShiftPythonException as e:
+                    logger.warning("Informer for %s in %s failed to list: %s", self.kind, self.namespace, e)
+
+    def _watch(self):
+        for event, obj in self.api.watch(
+            self.api_version,
+            self.kind,
+            self.namespace,
+            resource_version=self.resource_version,
+            timeout=K8S_INFORMER_RESYNC_PERIOD,
+        ):
+            if event == "ERROR":
+                # resourceVersion is too old (410 Gone), everything has to be listed again
+                self.resource_version = None
+                return
+            obj.setdefault("apiVersion", self.api_version)
+            obj.setdefault("kind", self.kind)
+            with self._condition:
+                # Own writes might have been stored already, do not overwrite them with older versions
+                if event != "BOOKMARK" and _is_newer(obj, self.store.get(obj["metadata"]["name"])):
+                    if event == "DELETED":
+                        self._remove(obj["metadata"]["name"])
+                    else:
+                        self._add(obj)
+                self.resource_version = obj["metadata"]["resourceVersion"]
+                self._touch()
+
+    def _touch(self):
+        """Marks store as synced with the server and wakes up all waiters, must be called with the lock held"""
+        self.last_sync = time.monotonic()
+        self._generation += 1
+        self._condition.notify_all()
+
+    def _add(self, obj: dict):
+        name = obj["metadata"]["name"]
+        self._remove(name)
+        self.store[name] = obj
+        for index, indexer in INDEXERS.items():
+            for key in indexer(obj):
+                self.indexes[index][key].add(name)
+
+    def _remove(self, name: str):
+        obj = self.store.pop(name, None)
+        if obj is None:
+            return
+        for index, indexer in INDEXERS.items():
+            for key in indexer(obj):
+                self.indexes[index][key].discard(name)
+
+    def update(self, obj: dict):
+        """Writes the object returned by the server into the store, unless the store already has a newer version"""
+        with self._condition:
+            if _is_newer(obj, self.store.get(obj["metadata"]["name"])):
+                self._add(copy.deepcopy(obj))
+                self._generation += 1
+                self._condition.notify_all()
+
+    def remove(self, name: str):
+        """Removes the object deleted by the testsuite from the store"""
+        with self._condition:
+            self._remove(name)
+            self._generation += 1
+            self._condition.notify_all()
+
+    def get(self, name: str) -> Optional[dict]:
+        """Returns copy of the stored object"""
+        with self._condition:
+            obj = self.store.get(name)
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def by_index(self, index: str, key: str) -> list[dict]:
+        """Returns copies of all objects with the key in the index"""
+        with self._condition:
+            return [copy.deepcopy(self.store[name]) for name in self.indexes[index].get(key, ())]
+
+    def wait_until(self, name: str, test_function: Callable[[dict], bool], timelimit: float) -> Optional[dict]:
+        """Waits until the stored object satisfies the test function, returns the object or None on timeout"""
+        deadline = time.monotonic() + timelimit
+        generation = -1
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._generation != generation, timeout=max(deadline - time.monotonic(), 0)
+                )
+                generation = self._generation
+                obj = copy.deepcopy(self.store.get(name))
+            if obj is not None and test_function(obj):
+                return obj
+            if time.monotonic() >= deadline:
+                return None
+
+
+class InformerCache:
+    """Informers of all the cached kinds for a single cluster, started lazily on the first access"""
+
+    def __init__(self, api: KubernetesAPI):
+        self.api = api
+        self.stats = CacheStats()
+        self._informers: dict[tuple[str, str, str], Optional[Informer]] = {}
+        self._start_locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def handles(api_version: str) -> bool:
+        """Returns True if objects of the API version are served from the cache"""
+        return "/" in api_version and api_version.split("/", 1)[0] in CACHED_GROUPS
+
+    def informer(self, api_version: str, kind: str, namespace: str) -> Optional[Informer]:
+        """Returns running informer for the kind, None if the kind can't be cached (e.g. missing CRD or RBAC)"""
+        if not self.handles(api_version):
+            return None
+        key = (api_version, kind, namespace)
+        with self._lock:
+            if key in self._informers:
+                return self._informers[key]
+            key_lock = self._start_locks.setdefault(key, threading.Lock())
+        # Initial list goes over the network, only the lookups of the same kind wait for it
+        with key_lock:
+            with self._lock:
+                if key in self._informers:
+                    return self._informers[key]
+            informer = Informer(self.api, api_version, kind, namespace)
+            try:
+                informer.start()
+            except OpenShiftPythonException as e:
+                logger.info("Unable to cache %s in %s, falling back to direct reads: %s", kind, namespace, e)
+            with self._lock:
+                self._informers[key] = informer if informer.last_sync else None
+                return self._informers[key]
+
+    def get(self, api_version: str, kind: str, namespace: str, name: str) -> Optional[dict]:
+        """Returns the object from the cache, None on cache miss"""
+        informer = self.informer(api_version, kind, namespace)
+        if informer is None:
+            return None
+        obj = informer.get(name)
+        with self._lock:
+            if obj is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.stats.staleness.append(time.monotonic() - informer.last_sync)
+        return obj
+
+    def update(self, obj: dict, namespace: str):
+        """Writes the object returned by the server to the cache, so the own writes are visible immediately"""
+        informer = self.informer(obj["apiVersion"], obj["kind"], obj["metadata"].get("namespace") or namespace)
+        if informer:
+            informer.update(obj)
+
+    def remove(self, api_version: str, kind: str, namespace: str, name: str):
+        """Evicts the deleted object from the cache, so it is not served until the watch reports the deletion"""
+        informer = self.informer(api_version, kind, namespace)
+        if informer:
+            informer.remove(name)
+
+    def by_label(self, api_version: str, kind: str, namespace: str, test_run: str) -> list[dict]:
+        """Returns all objects of the kind labeled with the testRun label"""
+        informer = self.informer(api_version, kind, namespace)
+        return informer.by_index("testRun", test_run) if informer else []
+
+    def by_target_ref(self, api_version: str, kind: str, namespace: str, target) -> list[dict]:
+        """Returns all policies of the kind targeting the object"""
+        informer = self.informer(api_version, kind, namespace)
+        return informer.by_index("targetRef", f"{target.kind(lowercase=False)}/{target.name()}") if informer else []
+
+    def stop(self):
+        """Stops all the informers"""
+        with self._lock:
+            for informer in self._informers.values():
+                if informer:
+                    informer.stop()
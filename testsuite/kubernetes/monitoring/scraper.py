@@ -0,0 +1,79 @@
+"""Direct scraping of the metrics endpoints of the pods, without waiting for Prometheus to scrape them"""
+
+import openshift_client as oc
+
+from testsuite.kubernetes.client import KubernetesClient
+from testsuite.prometheus import Metrics, parse_metrics
+
+# Port and path of the Envoy statistics of the Istio gateway pods
+GATEWAY_METRICS_PORT = 15090
+GATEWAY_METRICS_PATH = "/stats/prometheus"
+
+
+class MetricsScraper:
+    """
+    Reads metrics endpoint of all running pods matching the labels through the API server pod proxy.
+    Series are labeled with pod and namespace, same as if they were scraped by Prometheus through PodMonitor.
+    """
+
+    def __init__(
+        self,
+        cluster: KubernetesClient,
+        match_labels: dict[str, str],
+        port: int | str,
+        path: str = "/metrics",
+        scheme: str = "http",
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.cluster = cluster
+        self.match_labels = match_labels
+        self.port = port
+        self.path = path
+        self.scheme = scheme
+
+    @classmethod
+    def for_service(cls, service, port: str = "http", path: str = "/metrics") -> "MetricsScraper":
+        """Scrapes pods behind the Service (APIObject) on the target port of its named port"""
+        spec = service.model.spec
+        target = next(p.targetPort for p in spec.ports if p.name == port)
+        return cls(KubernetesClient.from_context(service.context), dict(spec.selector), target, path)
+
+    @classmethod
+    def for_gateway(cls, gateway) -> "MetricsScraper":
+        """Scrapes Envoy statistics of the pods of the Gateway (KuadrantGateway)"""
+        labels = {"gateway.networking.k8s.io/gateway-name": gateway.name()}
+        return cls(gateway.cluster, labels, GATEWAY_METRICS_PORT, GATEWAY_METRICS_PATH)
+
+    def pods(self) -> list[dict]:
+        """Returns all running pods matching the labels"""
+        if self.cluster.transport == "api":
+            selector = ",".join(f"{key}={value}" for key, value in self.match_labels.items())
+            pods = self.cluster.api.list("v1", "Pod", self.cluster.project, label_selector=selector)
+        else:
+            with self.cluster.context:
+                pods = [pod.as_dict() for pod in oc.selector("pod", labels=self.match_labels).objects()]
+        return [pod for pod in pods if pod.get("status", {}).get("phase") == "Running"]
+
+    def _port(self, pod: dict) -> int | str:
+        """Resolves named port to the container port number, pod proxy accepts only numbers"""
+        for container in pod["spec"]["containers"]:
+            for port in container.get("ports", []):
+                if port.get("name") == self.port:
+                    return port["containerPort"]
+        return self.port
+
+    def scrape(self) -> Metrics:
+        """Returns current metrics of all the pods"""
+        metrics = []
+        for pod in self.pods():
+            name = pod["metadata"]["name"]
+            namespace = pod["metadata"]["namespace"]
+            text = self.cluster.get_raw(
+                f"/api/v1/namespaces/{namespace}/pods/{self.scheme}:{name}:{self._port(pod)}/proxy{self.path}"
+            )
+            metrics.extend(parse_metrics(text, {"pod": name, "namespace": namespace}).metrics)
+        return Metrics(metrics)
+
+    def diff(self, before: Metrics) -> Metrics:
+        """Returns increase of every series since the before snapshot, see Metrics.diff()"""
+        return self.scrape().diff(before)
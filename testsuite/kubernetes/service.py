@@ -4,7 +4,7 @@ from time import sleep
 from dataclasses import dataclass, asdict
 from typing import Literal
 
-from openshift_client import timeout, Missing
+from openshift_client import Missing
 
 from testsuite.kubernetes import KubernetesObject
 from testsuite.utils.constants import SERVICE_DELETE_TIMEOUT, SERVICE_READY_TIMEOUT, SLOW_LOADBALANCER_WAIT
@@ -22,6 +22,9 @@ class ServicePort:
 class Service(KubernetesObject):
     """Kubernetes Service object"""
 
+    # LoadBalancer clean-up can be slow
+    delete_timeout = SERVICE_DELETE_TIMEOUT
+
     @classmethod
     def create_instance(
         cls,
@@ -72,12 +75,6 @@ class Service(KubernetesObject):
 
         return ip
 
-    def delete(self, ignore_not_found=True, cmd_args=None):
-        """Deletes Service, introduces bigger waiting times due to LoadBalancer type"""
-        with timeout(SERVICE_DELETE_TIMEOUT):
-            deleted = super(KubernetesObject, self).delete(ignore_not_found, cmd_args)
-            return deleted
-
     def wait_for_ready(self, timeout=SERVICE_READY_TIMEOUT, slow_loadbalancers=False):
         """Waits until LoadBalancer service gets ready."""
         if self.model.spec.type != "LoadBalancer":
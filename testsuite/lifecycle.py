@@ -6,6 +6,10 @@ import abc
 class LifecycleObject(abc.ABC):
     """Any objects which has its lifecycle controlled by create() and delete() methods"""
 
+    # Objects with lower tier are deleted first during teardown, tier of an object must be higher than
+    # the tiers of all the objects depending on it (policies -> routes -> gateways -> backends)
+    teardown_tier = 0
+
     @abc.abstractmethod
     def commit(self):
         """Commits resource.
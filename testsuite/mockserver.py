@@ -1,12 +1,20 @@
 """Module for Mockserver integration"""
 
-from typing import Union, Literal
+import re
+import threading
+from typing import TYPE_CHECKING, Iterable, Union, Literal
 
 from apyproxy import ApyProxy
 from httpx import Client
 
 from testsuite.utils import ContentType
 
+if TYPE_CHECKING:
+    from testsuite.gateway import Hostname
+
+# Maximal number of header values matched by a single retrieve request
+RETRIEVE_BATCH_SIZE = 200
+
 
 class Mockserver:
     """
@@ -82,3 +90,48 @@ class Mockserver:
             params={"type": "REQUESTS", "format": "JSON"},
             json={"headers": {header_name: [header_value]}},
         ).json()
+
+    def received_header_values(self, header_name, header_values: Iterable[str]) -> set[str]:
+        """
+        Returns which of the header values were received in any request.
+        Values are matched by a single retrieve request per batch (regex alternation) instead of one request per value.
+        """
+        values = list(header_values)
+        received = set()
+        for start in range(0, len(values), RETRIEVE_BATCH_SIZE):
+            batch = values[start : start + RETRIEVE_BATCH_SIZE]
+            requests = self.client.mockserver.retrieve.put(
+                params={"type": "REQUESTS", "format": "JSON"},
+                json={"headers": {header_name: ["|".join(re.escape(value) for value in batch)]}},
+            ).json()
+            for request in requests:
+                for name, request_values in request.get("headers", {}).items():
+                    if name.lower() == header_name.lower():
+                        received.update(request_values)
+        return received.intersection(values)
+
+
+class LeakVerifier:
+    """Checks whether requests denied by the gateway reached the MockServer anyway, reuses a client per MockServer"""
+
+    def __init__(self, header_name: str):
+        self.header_name = header_name
+        self._clients: dict[str, Client] = {}
+        self._lock = threading.Lock()
+
+    def _mockserver(self, hostname: "Hostname") -> Mockserver:
+        with self._lock:
+            if hostname.hostname not in self._clients:
+                self._clients[hostname.hostname] = hostname.client()
+            return Mockserver(self._clients[hostname.hostname])
+
+    def verify(self, hostname: "Hostname", tracking_ids: Iterable[str]) -> set[str]:
+        """Returns the tracking IDs which leaked to the MockServer"""
+        return self._mockserver(hostname).received_header_values(self.header_name, list(tracking_ids))
+
+    def close(self):
+        """Closes all clients"""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
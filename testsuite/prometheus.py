@@ -1,8 +1,9 @@
 """Simple client for the Prometheus metrics"""
 
 import operator
+import re
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
 import backoff
 from apyproxy import ApyProxy
@@ -17,15 +18,75 @@ from testsuite.utils.constants import (
     PROMETHEUS_METRIC_RETRIES,
     PROMETHEUS_FAST_INTERVAL,
     PROMETHEUS_VERIFY_NO_TARGETS_RETRIES,
+    PROMETHEUS_RANGE_STEP,
+    PROMETHEUS_SAMPLE_POLL_INTERVAL,
+    PROMETHEUS_SAMPLE_TIMEOUT,
 )
 
+# Label added to the series of the batch queries, so they can be told apart in the joined result
+BATCH_LABEL = "testsuite_batch_query"
 
-def _params(key: str = "", labels: dict[str, str] = None) -> dict[str, str]:
-    """Generate metrics query parameters based on key and labels"""
+
+def selector(key: str = "", labels: dict[str, str] = None) -> str:
+    """Returns PromQL selector of the metric with the labels"""
     if not labels:
-        return {"query": key}
+        return key
     # pylint: disable=consider-using-f-string
-    return {"query": "%s{%s}" % (key, ",".join(f"{k}='{v}'" for k, v in labels.items()))}
+    return "%s{%s}" % (key, ",".join(f"{k}='{v}'" for k, v in labels.items()))
+
+
+def _params(key: str = "", labels: dict[str, str] = None) -> dict[str, str]:
+    """Generate metrics query parameters based on key and labels"""
+    return {"query": selector(key, labels)}
+
+
+def _timestamp(time: datetime | float) -> float:
+    return time.timestamp() if isinstance(time, datetime) else time
+
+
+_SAMPLE = re.compile(
+    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)"
+    r'(?:\{(?P<labels>(?:[^"}]|"(?:[^"\\]|\\.)*")*)\})?'
+    r"\s+(?P<value>\S+)(?:\s+(?P<timestamp>[^\s#]\S*))?"
+)
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPE.sub(lambda match: "\n" if match[1] == "n" else match[1], value)
+
+
+def parse_metrics(text: str, labels: dict[str, str] = None, time: Optional[float] = None) -> "Metrics":
+    """
+    Parses Prometheus text (or OpenMetrics) exposition format into the same structure as the instant query returns.
+    Labels are added to every series (e.g. pod and namespace, as Prometheus does when scraping), the exposed labels
+    with the same name are renamed to exported_<name> the same way, time is used for samples without own timestamp.
+    """
+    labels = labels or {}
+    time = datetime.now(timezone.utc).timestamp() if time is None else time
+    # OpenMetrics timestamps are in seconds, the older text format uses milliseconds
+    scale = 1 if "# EOF" in text else 1000
+    metrics = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or not (match := _SAMPLE.match(line)):
+            continue
+        metric = {"__name__": match["name"], **labels}
+        for key, value in _LABEL.findall(match["labels"] or ""):
+            metric[f"exported_{key}" if key in labels else key] = _unescape(value)
+        timestamp = float(match["timestamp"]) / scale if match["timestamp"] else time
+        metrics.append({"metric": metric, "value": [timestamp, match["value"]]})
+    return Metrics(metrics)
+
+
+def fresh_samples(series: str, after: datetime | float) -> str:
+    """
+    Returns PromQL expression with only the values of the series scraped after the time.
+    Works only for selectors, timestamp() of any other expression is the time of the evaluation.
+    """
+    # `and` ignores the metric name, which timestamp() drops, so each series is matched with its own timestamp
+    return f"{series} and timestamp({series}) > {_timestamp(after)}"
 
 
 def has_label(label_name: str, label_value: str):
@@ -50,6 +111,10 @@ class Metrics:
         After the filtering, new Metrics object will be returned."""
         return Metrics([m for m in self.metrics if func(m)])
 
+    def with_labels(self, labels: dict[str, str]) -> "Metrics":
+        """Returns only the series which have all the labels with the values"""
+        return self.filter(lambda x: all(x["metric"].get(key) == value for key, value in labels.items()))
+
     def __len__(self):
         return len(self.metrics)
 
@@ -60,8 +125,30 @@ class Metrics:
 
     @property
     def values(self) -> list[float]:
-        """Return list of metrics values as floats"""
-        return [float(m["value"][1]) for m in self.metrics]
+        """Return list of metrics values as floats, the last value of each series for range queries"""
+        return [float(m["value"][1]) if "value" in m else float(m["values"][-1][1]) for m in self.metrics]
+
+    @property
+    def samples(self) -> list[list[tuple[float, float]]]:
+        """Return (timestamp, value) samples of each series, single sample for instant queries"""
+        return [
+            [(float(t), float(v)) for t, v in (m["values"] if "values" in m else [m["value"]])] for m in self.metrics
+        ]
+
+    def diff(self, before: "Metrics") -> "Metrics":
+        """
+        Returns increase of every series since the before snapshot, series missing in the snapshot count from 0.
+        Meant for counters, decreased value is considered a counter reset and the whole value is the increase.
+        """
+        previous = {frozenset(m["metric"].items()): float(m["value"][1]) for m in before.metrics}
+        result = []
+        for metric in self.metrics:
+            value = float(metric["value"][1])
+            old = previous.get(frozenset(metric["metric"].items()), 0.0)
+            result.append(
+                {"metric": metric["metric"], "value": [metric["value"][0], str(value - old if value >= old else value)]}
+            )
+        return Metrics(result)
 
 
 class Prometheus:
@@ -83,6 +170,70 @@ class Prometheus:
 
         return Metrics(response.json()["data"]["result"])
 
+    def query(self, query: str, time: Optional[datetime | float] = None) -> Metrics:
+        """Evaluates PromQL expression at the time (now by default)"""
+        params: dict = {"query": query}
+        if time is not None:
+            params["time"] = _timestamp(time)
+        return Metrics(self.client.query.post(data=params).json()["data"]["result"])
+
+    def query_range(
+        self,
+        query: str,
+        start: datetime | float,
+        end: Optional[datetime | float] = None,
+        step: float = PROMETHEUS_RANGE_STEP,
+    ) -> Metrics:
+        """Evaluates PromQL expression at every step between start and end (now by default)"""
+        params = {
+            "query": query,
+            "start": _timestamp(start),
+            "end": _timestamp(end) if end is not None else datetime.now(timezone.utc).timestamp(),
+            "step": step,
+        }
+        return Metrics(self.client.query_range.post(data=params).json()["data"]["result"])
+
+    def query_batch(self, queries: Iterable[str], time: Optional[datetime | float] = None) -> list[Metrics]:
+        """
+        Evaluates many PromQL expressions (returning instant vectors) in a single request, in the same order.
+        Series of each expression are tagged with an extra label and the tagged vectors are joined with `or`.
+        """
+        queries = list(queries)
+        joined = " or ".join(
+            f'label_replace({query}, "{BATCH_LABEL}", "{i}", "", "")' for i, query in enumerate(queries)
+        )
+        metrics = self.query(joined, time).metrics if queries else []
+        results: list[list[dict]] = [[] for _ in queries]
+        for metric in metrics:
+            results[int(metric["metric"].pop(BATCH_LABEL))].append(metric)
+        return [Metrics(result) for result in results]
+
+    def get_metrics_batch(self, *selectors: tuple[str, Optional[dict[str, str]]]) -> list[Metrics]:
+        """Get metrics of many (key, labels) pairs in a single request"""
+        return self.query_batch(selector(key, labels) for key, labels in selectors)
+
+    def wait_for_sample(
+        self,
+        query: str,
+        predicate: Callable[[float], bool],
+        after: datetime | float,
+        timeout: float = PROMETHEUS_SAMPLE_TIMEOUT,
+    ) -> bool:
+        """
+        Wait until any sample of the expression evaluated after the time satisfies the predicate.
+        All samples since the time are checked in every poll, so polling often does not miss short-lived values
+        and the wait finishes as soon as the scrape lands.
+        Evaluations shortly after the time still see the samples scraped before it (within the lookback),
+        use fresh_samples() for the selectors whose older values must not count.
+        """
+
+        @backoff.on_predicate(backoff.constant, interval=PROMETHEUS_SAMPLE_POLL_INTERVAL, jitter=None, max_time=timeout)
+        def _wait():
+            samples = self.query_range(query, after).samples
+            return any(predicate(value) for series in samples for _, value in series)
+
+        return _wait()
+
     @backoff.on_predicate(
         backoff.constant, interval=PROMETHEUS_POLL_INTERVAL, jitter=None, max_tries=PROMETHEUS_MAX_RETRIES
     )
@@ -126,10 +277,20 @@ class Prometheus:
         metric_value: float,
         labels: dict[str, str] = None,
         compare: Callable[[float, float], bool] = operator.eq,
+        after: Optional[datetime | float] = None,
     ) -> bool:
         """Wait for a metric to reach the expected value by polling with retries.
         Treats missing metrics as value 0.
-        Supports any comparison via operator module (e.g. operator.eq, operator.ge, operator.lt)."""
+        Supports any comparison via operator module (e.g. operator.eq, operator.ge, operator.lt).
+        With `after`, any sample scraped since that time reaching the value is enough, see wait_for_sample()."""
+        if after is not None:
+            series = selector(metric_name, labels)
+            query = fresh_samples(series, after)
+            if compare(0, metric_value):
+                # Missing metric counts as 0, vector(0) provides the sample at the times without any series.
+                # It has no labels, so it has to be matched with on() to be left out while the series exists.
+                query = f"({query}) or on() (vector(0) unless on() {series})"
+            return self.wait_for_sample(query, lambda value: compare(value, metric_value), after)
 
         @backoff.on_predicate(
             backoff.constant, interval=PROMETHEUS_POLL_INTERVAL, jitter=None, max_tries=PROMETHEUS_METRIC_RETRIES
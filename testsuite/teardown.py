@@ -0,0 +1,52 @@
+"""Parallel teardown of LifecycleObjects, which respects dependencies between them"""
+
+import logging
+import time
+from collections import defaultdict
+
+from testsuite.kubernetes import delete_all
+from testsuite.lifecycle import LifecycleObject
+
+logger = logging.getLogger(__name__)
+
+
+class TeardownScheduler:
+    """
+    Collects LifecycleObjects of a single scope (test, module or session) and deletes them when the scope ends.
+    Objects are deleted in tiers (see LifecycleObject.teardown_tier), all objects within a tier concurrently.
+    """
+
+    # Durations of all teardowns per scope
+    durations: dict[str, list[float]] = defaultdict(list)
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.objects: list[LifecycleObject] = []
+
+    def register(self, obj: LifecycleObject) -> LifecycleObject:
+        """Registers object for deletion at the end of the scope"""
+        self.objects.append(obj)
+        return obj
+
+    def teardown(self):
+        """Deletes all registered objects, all tiers are attempted even if some deletion fails"""
+        tiers = defaultdict(list)
+        for obj in self.objects:
+            tiers[obj.teardown_tier].append(obj)
+        self.objects = []
+        if not tiers:
+            return
+
+        start = time.monotonic()
+        error = None
+        for tier in sorted(tiers):
+            try:
+                delete_all(tiers[tier])
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Teardown of %s failed: %s", tiers[tier], e)
+                error = error or e
+        duration = time.monotonic() - start
+        self.durations[self.scope].append(duration)
+        logger.info("Teardown of %s scope took %.2fs", self.scope, duration)
+        if error:
+            raise error
@@ -0,0 +1,36 @@
+"""Compares per-operation latency of the native Kubernetes API transport and the `oc` binary transport"""
+
+import time
+from collections import defaultdict
+from functools import partial
+
+import pytest
+
+from testsuite.kubernetes.config_map import ConfigMap
+from testsuite.utils.constants import BENCHMARK_ITERATIONS
+
+pytestmark = [pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize("transport", ["oc", "api"])
+def test_kubernetes_transport(request, cluster, blame, label, transport, report_latency):
+    """Measures latency of commit, refresh, exists, apply and delete operations of a ConfigMap"""
+    client = cluster.change_transport(transport)
+    samples = defaultdict(list)
+
+    def _timed(operation, func):
+        start = time.perf_counter()
+        func()
+        samples[operation].append(time.perf_counter() - start)
+
+    for _ in range(BENCHMARK_ITERATIONS):
+        config_map = ConfigMap.create_instance(client, blame("bench"), {"key": "value"}, labels={"app": label})
+        request.addfinalizer(config_map.delete)
+        _timed("commit", config_map.commit)
+        _timed("refresh", config_map.refresh)
+        _timed("exists", config_map.exists)
+        _timed("apply", partial(config_map.apply, lambda obj: obj.model.data.update({"key": "new"})))
+        _timed("delete", config_map.delete)
+
+    for operation, values in samples.items():
+        report_latency(f"{transport}_{operation}", values)
@@ -1,7 +1,11 @@
 """Root conftest"""
 
+import contextlib
+import json
 import operator
+import os
 import signal
+import statistics
 from urllib.parse import urlparse
 
 import pytest
@@ -13,17 +17,23 @@ from keycloak import KeycloakAuthenticationError
 from testsuite.capabilities import has_kuadrant, kuadrant_version
 from testsuite.certificates import CFSSLClient
 from testsuite.config import settings
+from testsuite.garbage_collector import collect_garbage
 from testsuite.gateway import Exposer, CustomReference
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
-from testsuite.httpx import KuadrantClient
+from testsuite.grpc import ChannelPool
+from testsuite.httpx import KuadrantClient, TransportRegistry
+from testsuite.httpx.latency import LatencyRecorder
+from testsuite.httpx.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from testsuite.kubernetes.client import KubernetesClient
 from testsuite.mockserver import Mockserver
 from testsuite.oidc import OIDCProvider
 from testsuite.oidc.auth0 import Auth0Provider
 from testsuite.prometheus import Prometheus
+from testsuite.teardown import TeardownScheduler
 from testsuite.oidc.keycloak import Keycloak
 from testsuite.tracing.jaeger import JaegerClient
 from testsuite.tracing.tempo import RemoteTempoClient
-from testsuite.utils import randomize, _whoami
+from testsuite.utils import randomize, whoami
 
 
 def pytest_addoption(parser):
@@ -35,6 +45,68 @@ def pytest_addoption(parser):
     parser.addoption(
         "--verify-denials", default="true", help="Verifies that denied requests did not leak to the upstream backend"
     )
+    parser.addoption(
+        "--clean-leftovers",
+        action="store_true",
+        default=False,
+        help="Deletes objects leaked by previous runs of the same user before the session starts, "
+        "objects of runs which created anything in the last 4 hours are kept, as they may still be running",
+    )
+    parser.addoption(
+        "--latency-report",
+        default=None,
+        help="Writes latency histograms of all HTTP requests sent during the session to this JSON file",
+    )
+    parser.addoption(
+        "--latency-properties",
+        action="store_true",
+        default=False,
+        help="Attaches latency summary of HTTP requests sent by each test to its JUnit properties",
+    )
+
+
+latency_stash_key = pytest.StashKey[tuple[contextlib.ExitStack, LatencyRecorder]]()
+
+
+def pytest_sessionstart(session):
+    """Starts recording latencies of the session and deletes objects leaked by previous runs, if requested"""
+    if session.config.getoption("--latency-report"):
+        stack = contextlib.ExitStack()
+        session.config.stash[latency_stash_key] = (stack, stack.enter_context(LatencyRecorder.capture()))
+
+    # Only the controller cleans up, not every xdist worker
+    if not session.config.getoption("--clean-leftovers") or hasattr(session.config, "workerinput"):
+        return
+    report = collect_garbage()
+    session.config.pluginmanager.get_plugin("terminalreporter").write_line(str(report))
+
+
+def pytest_sessionfinish(session):
+    """Closes connection pools shared by HTTP and gRPC clients and writes latency histograms, if requested"""
+    TransportRegistry.close()
+    ChannelPool.close()
+    if latency_stash_key not in session.config.stash:
+        return
+    stack, recorder = session.config.stash[latency_stash_key]
+    stack.close()
+    path = session.config.getoption("--latency-report")
+    # Every xdist worker writes its own report
+    if worker := getattr(session.config, "workerinput", {}).get("workerid"):
+        path = f"{path}.{worker}"
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(recorder.to_json())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Attaches latencies of all HTTP requests sent by the test to its JUnit properties, if requested"""
+    if not item.config.getoption("--latency-properties"):
+        yield
+        return
+    with LatencyRecorder.capture() as recorder:
+        yield
+    if recorder:
+        item.user_properties.append(("latency", json.dumps(recorder.summary())))
 
 
 def pytest_runtest_setup(item):
@@ -54,6 +126,8 @@ def pytest_runtest_setup(item):
         return
 
     marks = [i.name for i in item.iter_markers()]
+    if "benchmark" in marks and not os.environ.get("BENCHMARK_ENABLE"):
+        pytest.skip("benchmarks were not explicitly enabled")
     skip_or_fail = pytest.fail if item.config.getoption("--enforce") else pytest.skip
     standalone = item.config.getoption("--standalone")
     if standalone:
@@ -156,6 +230,53 @@ def pytest_report_header(config):
     return header
 
 
+def pytest_terminal_summary(terminalreporter):
+    """Reports teardown durations and hit rate and staleness of the Kubernetes informer caches, if they were used"""
+    if TeardownScheduler.durations:
+        terminalreporter.section("Teardown durations")
+        for scope, durations in TeardownScheduler.durations.items():
+            terminalreporter.write_line(
+                f"{scope}: count={len(durations)} total={sum(durations):.2f}s max={max(durations):.2f}s"
+            )
+
+    if KubernetesClient.saved_calls:
+        terminalreporter.section("Memoized KubernetesClient lookups")
+        for name, saved in KubernetesClient.saved_calls.items():
+            terminalreporter.write_line(f"{name}: saved {saved} oc invocations")
+
+    caches = KubernetesClient.informer_caches()
+    if not caches:
+        return
+    terminalreporter.section("Kubernetes informer cache")
+    for cache in caches:
+        terminalreporter.write_line(f"{cache.api.api_url}: {cache.stats}")
+        cache.stop()
+
+
+@pytest.fixture(scope="session")
+def session_teardown():
+    """Deletes registered objects in parallel at the end of the session"""
+    scheduler = TeardownScheduler("session")
+    yield scheduler
+    scheduler.teardown()
+
+
+@pytest.fixture(scope="module")
+def module_teardown():
+    """Deletes registered objects in parallel at the end of the module"""
+    scheduler = TeardownScheduler("module")
+    yield scheduler
+    scheduler.teardown()
+
+
+@pytest.fixture
+def function_teardown():
+    """Deletes registered objects in parallel at the end of the test"""
+    scheduler = TeardownScheduler("function")
+    yield scheduler
+    scheduler.teardown()
+
+
 @pytest.fixture(scope="session")
 def skip_or_fail(request):
     """Skips or fails tests depending on --enforce option"""
@@ -331,13 +452,19 @@ def oidc_provider(keycloak) -> OIDCProvider:
     return keycloak
 
 
+@pytest.fixture(scope="session")
+def retry_policy() -> RetryPolicy:
+    """Retry policy of the HTTP clients, modules can override it, e.g. with RetryPolicy.guarded() circuit breakers"""
+    return DEFAULT_RETRY_POLICY
+
+
 @pytest.fixture(scope="session")
 def blame(request):
     """Returns function that will add random identifier to the name"""
     if "tester" in settings:
         user = settings["tester"]
     else:
-        user = _whoami()
+        user = whoami()
 
     def _blame(name: str, tail: int = 3) -> str:
         """Create 'scoped' name within given test
@@ -459,3 +586,17 @@ def check_user_managed_istio(request, cluster, skip_or_fail):
     marker = request.node.get_closest_marker("user_managed_istio")
     if marker and KuadrantGateway.get_gateway_class_name(cluster) == "openshift-default":
         skip_or_fail("Test requires user-managed Istio installation")
+
+
+@pytest.fixture
+def report_latency(record_property):
+    """Returns function that prints latency statistics of an operation and records them as JUnit properties"""
+
+    def _report(name: str, samples: list[float]):
+        mean = statistics.mean(samples) * 1000
+        p95 = statistics.quantiles(samples, n=20)[-1] * 1000 if len(samples) > 1 else mean
+        print(f"{name}: mean {mean:.1f} ms, p95 {p95:.1f} ms ({len(samples)} samples)")
+        record_property(f"{name}_mean_ms", f"{mean:.1f}")
+        record_property(f"{name}_p95_ms", f"{p95:.1f}")
+
+    return _report
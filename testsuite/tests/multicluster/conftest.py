@@ -14,6 +14,7 @@ from testsuite.gateway.gateway_api.hostname import DNSPolicyExposer
 from testsuite.gateway.gateway_api.route import HTTPRoute
 from testsuite.kuadrant.policy.dns import DNSPolicy
 from testsuite.kuadrant.policy.tls import TLSPolicy
+from testsuite.kubernetes.async_client import AsyncKubernetesClient, gather_sync
 
 
 @pytest.fixture(scope="package")
@@ -181,10 +182,10 @@ def commit(
     tls_policy,
     tls_policy2,
 ):  # pylint: disable=unused-argument
-    """Commits gateways and all policies before tests"""
+    """Commits gateways and all policies on all clusters at once before tests"""
     components = [gateway, gateway2, dns_policy, dns_policy2, tls_policy, tls_policy2]
+    clients = [AsyncKubernetesClient.from_context(component.context) for component in components]
     for component in components:
         request.addfinalizer(component.delete)
-        component.commit()
-    for component in components:
-        component.wait_for_ready()
+    gather_sync(*(client.apply(component) for client, component in zip(clients, components)))
+    gather_sync(*(client.wait_for_ready(component) for client, component in zip(clients, components)))
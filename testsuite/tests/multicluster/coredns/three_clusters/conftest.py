@@ -4,6 +4,7 @@ import pytest
 
 from testsuite.kubernetes.secret import Secret
 from testsuite.kuadrant.policy.dns import DNSRecord, DNSRecordEndpoint
+from testsuite.kubernetes.async_client import AsyncKubernetesClient, gather_sync
 
 IP3 = "1.2.3.4"
 
@@ -77,8 +78,13 @@ def commit(
     request, coredns_secrets, kubeconfig_secrets, dnsrecord1, dnsrecord2, dnsrecord3
 ):  # pylint: disable=unused-argument
     """Commits all components required for the test and adds finalizers to delete them on cleanup"""
-    for component in [*kubeconfig_secrets, dnsrecord1, dnsrecord2, dnsrecord3]:
+    for component in kubeconfig_secrets:
         request.addfinalizer(component.delete)
         component.commit()
-    for component in [dnsrecord1, dnsrecord2, dnsrecord3]:
-        component.wait_for_ready()
+    # DNSRecords are on three different clusters, so they are committed and awaited concurrently
+    records = [dnsrecord1, dnsrecord2, dnsrecord3]
+    clients = [AsyncKubernetesClient.from_context(record.context) for record in records]
+    for record in records:
+        request.addfinalizer(record.delete)
+    gather_sync(*(client.apply(record) for client, record in zip(clients, records)))
+    gather_sync(*(client.wait_for_ready(record) for client, record in zip(clients, records)))
@@ -26,7 +26,7 @@ def authorization(authorization, realm_role, blame):
 
 
 @pytest.fixture(scope="module")
-def gateway(request, authorino, cluster, blame, module_label, testconfig, keycloak):
+def gateway(module_teardown, authorino, cluster, blame, module_label, testconfig, keycloak):
     """Deploys Envoy with additional JWT plain identity test setup"""
     envoy = JwtEnvoy(
         cluster,
@@ -37,7 +37,7 @@ def gateway(request, authorino, cluster, blame, module_label, testconfig, keyclo
         keycloak.server_url,
         labels={"app": module_label},
     )
-    request.addfinalizer(envoy.delete)
+    module_teardown.register(envoy)
     envoy.commit()
     return envoy
 
@@ -40,7 +40,7 @@ def client_ca_config_map(request, cluster, blame, client_ca):
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label, client_ca_config_map):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label, client_ca_config_map):
     """Gateway with TLS listener and frontend TLS client certificate validation"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(cluster, gateway_name, labels={"app": module_label})
@@ -48,7 +48,7 @@ def gateway(request, cluster, blame, wildcard_domain, module_label, client_ca_co
     gw.set_frontend_tls_validation(
         [{"name": client_ca_config_map.name(), "kind": "ConfigMap", "group": ""}],
     )
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -45,13 +45,13 @@ def gateway_infra_configmap(request, cluster, blame, client_ca_config_map):
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label, gateway_infra_configmap):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label, gateway_infra_configmap):
     """Gateway with TLS listener and infrastructure params for CA cert volume mount"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(cluster, gateway_name, labels={"app": module_label})
     gw.add_listener(TLSGatewayListener(hostname=wildcard_domain, gateway_name=gateway_name))
     gw.set_infrastructure_params(gateway_infra_configmap.name())
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
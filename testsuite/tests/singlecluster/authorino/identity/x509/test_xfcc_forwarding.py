@@ -16,7 +16,7 @@ pytestmark = [pytest.mark.authorino, pytest.mark.kuadrant_only, pytest.mark.user
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label):
     """Gateway with XFCC forwarding via gatewayTopology annotation (no TLS client validation)"""
     gw = KuadrantGateway.create_instance(
         cluster,
@@ -27,7 +27,7 @@ def gateway(request, cluster, blame, wildcard_domain, module_label):
         },
     )
     gw.add_listener(GatewayListener(hostname=wildcard_domain))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -3,12 +3,16 @@
 import pytest
 
 from testsuite.kubernetes.monitoring import MetricsEndpoint
+from testsuite.kubernetes.monitoring.scraper import MetricsScraper
 from testsuite.kubernetes.monitoring.service_monitor import ServiceMonitor
 
 
 @pytest.fixture(scope="package")
-def service_monitor(cluster, request, blame, authorino):
-    """Create ServiceMonitor object to follow Authorino /metrics and /server-metrics endpoints"""
+def service_monitor(cluster, request, blame, authorino, prometheus):
+    """
+    Create ServiceMonitor object to follow Authorino /metrics and /server-metrics endpoints.
+    Waits for all its endpoints to become active targets.
+    """
     label = {"app": authorino.name() + "metrics"}
     authorino.metrics_service.label(label)
     endpoints = [MetricsEndpoint("/metrics", "http"), MetricsEndpoint("/server-metrics", "http")]
@@ -17,10 +21,11 @@ def service_monitor(cluster, request, blame, authorino):
     )
     request.addfinalizer(monitor.delete)
     monitor.commit()
+    assert prometheus.is_reconciled(monitor), "Service Monitor didn't get reconciled in time"
     return monitor
 
 
-@pytest.fixture(scope="package", autouse=True)
-def wait_for_active_targets(prometheus, service_monitor):
-    """Waits for all endpoints in Service Monitor to become active targets"""
-    assert prometheus.is_reconciled(service_monitor), "Service Monitor didn't get reconciled in time"
+@pytest.fixture(scope="module")
+def server_metrics_scraper(authorino):
+    """Reads Authorino /server-metrics endpoint directly, without Prometheus"""
+    return MetricsScraper.for_service(authorino.metrics_service, "http", "/server-metrics")
@@ -34,14 +34,15 @@ def authorization(authorization, mockserver_expectation):
 
 
 @pytest.fixture(scope="module")
-def deep_metrics(authorino, service_monitor, prometheus, client, auth):
-    """Send a simple get request so that a few metrics can appear and return all scraped evaluator(deep) metrics"""
+def deep_metrics(server_metrics_scraper, client, auth):
+    """Send a simple get request and return increase of the evaluator(deep) metrics read directly from Authorino"""
+    before = server_metrics_scraper.scrape()
+
     response = client.get("/get", auth=auth)
     assert response.status_code == 200
 
-    prometheus.wait_for_scrape(service_monitor, "/server-metrics")
-
-    return prometheus.get_metrics("auth_server_evaluator_total", labels={"service": authorino.metrics_service.name()})
+    increase = server_metrics_scraper.diff(before)
+    return increase.filter(lambda x: x["metric"]["__name__"] == "auth_server_evaluator_total")
 
 
 @pytest.mark.parametrize(
@@ -7,7 +7,7 @@ from testsuite.kuadrant.authorino import AuthorinoCR, Authorino
 
 
 @pytest.fixture(scope="module")
-def gateway(request, authorino, cluster, blame, label, testconfig) -> Envoy:
+def gateway(module_teardown, authorino, cluster, blame, label, testconfig) -> Envoy:
     """Deploys Envoy that wires up the Backend behind the reverse-proxy and Authorino instance"""
     gw = Envoy(
         cluster,
@@ -16,7 +16,7 @@ def gateway(request, authorino, cluster, blame, label, testconfig) -> Envoy:
         testconfig["service_protection"]["envoy"]["image"],
         labels={"app": label},
     )
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -147,7 +147,7 @@ def authorino_labels(selector) -> Dict[str, str]:
 # pylint: disable-msg=too-many-locals
 @pytest.fixture(scope="module")
 def gateway(
-    request,
+    module_teardown,
     authorino,
     cluster,
     create_secret,
@@ -174,7 +174,7 @@ def gateway(
         envoy_secret,
         labels={"app": module_label},
     )
-    request.addfinalizer(envoy.delete)
+    module_teardown.register(envoy)
     envoy.commit()
     return envoy
 
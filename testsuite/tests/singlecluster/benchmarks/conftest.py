@@ -0,0 +1,15 @@
+"""Benchmarks which need a Gateway"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def authorization():
+    """No AuthPolicy, only the gateway itself is benchmarked"""
+    return None
+
+
+@pytest.fixture(scope="module")
+def rate_limit():
+    """No RateLimitPolicy, only the gateway itself is benchmarked"""
+    return None
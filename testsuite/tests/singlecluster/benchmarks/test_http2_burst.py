@@ -0,0 +1,34 @@
+"""Compares latency of a burst of requests sent over pooled HTTP/1.1 connections and multiplexed over HTTP/2"""
+
+import time
+
+import pytest
+
+from testsuite.utils.constants import BENCHMARK_BURST_SIZE, BENCHMARK_ITERATIONS
+
+pytestmark = [pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["http1", "http2"])
+def test_http2_burst(route, hostname, http2, report_latency, record_property):  # pylint: disable=unused-argument
+    """Measures duration of the whole burst, latency of the single requests and number of opened connections"""
+    protocol = "http2" if http2 else "http1"
+    client = hostname.client(http2=http2, pooled=False)
+    client.get("/get").raise_for_status()
+
+    bursts = []
+    latencies = []
+    connections = 0
+    for _ in range(BENCHMARK_ITERATIONS):
+        start = time.perf_counter()
+        responses = client.burst("GET", "/get", BENCHMARK_BURST_SIZE)
+        bursts.append(time.perf_counter() - start)
+        responses.assert_all(status_code=200)
+        latencies.extend(result.timings.total for result in responses)
+        connections += sum(1 for result in responses if result.timings.connect > 0)
+    client.close()
+
+    report_latency(f"{protocol}_burst", bursts)
+    report_latency(f"{protocol}_request", latencies)
+    print(f"{protocol}_connections: {connections} new connections for {len(latencies)} requests")
+    record_property(f"{protocol}_connections", connections)
@@ -13,14 +13,16 @@ from testsuite.gateway import GatewayRoute, Gateway, Hostname, GatewayListener
 from testsuite.gateway.envoy import Envoy
 from testsuite.gateway.envoy.route import EnvoyVirtualRoute
 from testsuite.gateway.gateway_api.gateway import KuadrantGateway
+from testsuite.gateway.gateway_api.pool import GatewayPool
 from testsuite.gateway.gateway_api.route import HTTPRoute
-from testsuite.httpx import KuadrantClient
+from testsuite.httpx import DenialTracking
 from testsuite.kuadrant import KuadrantCR
 from testsuite.kuadrant.policy.authorization.auth_policy import AuthPolicy
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy
+from testsuite.kubernetes import commit_all
 from testsuite.kubernetes.api_key import APIKey
 from testsuite.kubernetes.client import KubernetesClient
-from testsuite.mockserver import Mockserver
+from testsuite.mockserver import LeakVerifier
 
 
 @pytest.fixture(scope="session")
@@ -67,13 +69,12 @@ def rate_limit(kuadrant, cluster, blame, request, module_label, route, gateway):
 
 
 @pytest.fixture(scope="module", autouse=True)
-def commit(request, authorization, rate_limit):
+def commit(module_teardown, authorization, rate_limit):
     """Commits all important stuff before tests"""
-    for component in [authorization, rate_limit]:
-        if component is not None:
-            request.addfinalizer(component.delete)
-            component.commit()
-            component.wait_for_ready()
+    components = [component for component in [authorization, rate_limit] if component is not None]
+    for component in components:
+        module_teardown.register(component)
+    commit_all(components)
 
 
 @pytest.fixture(scope="session")
@@ -113,12 +114,12 @@ def backend_exposer(request, testconfig, cluster):
 
 
 @pytest.fixture(scope="session")
-def backend(request, cluster, blame, label, mockserver_config, backend_exposer):
+def backend(session_teardown, cluster, blame, label, mockserver_config, backend_exposer):
     """Deploys MockServer backend"""
     mockserver = MockserverBackend(
         cluster, blame("mockserver"), label, service_type=backend_exposer.backend_service_type, config=mockserver_config
     )
-    request.addfinalizer(mockserver.delete)
+    session_teardown.register(mockserver)
     mockserver.commit()
     mockserver.wait_for_ready()
     mockserver.expose(backend_exposer, blame("backend"))
@@ -126,7 +127,7 @@ def backend(request, cluster, blame, label, mockserver_config, backend_exposer):
 
 
 @pytest.fixture(scope="session")
-def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
+def gateway(request, session_teardown, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> Gateway:
     """Deploys Gateway that wires up the Backend behind the reverse-proxy and Authorino instance"""
     if kuadrant:
         gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": label})
@@ -140,12 +141,30 @@ def gateway(request, kuadrant, cluster, blame, label, testconfig, wildcard_domai
             testconfig["service_protection"]["envoy"]["image"],
             labels={"app": label},
         )
-    request.addfinalizer(gw.delete)
+    session_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
 
 
+@pytest.fixture(scope="session")
+def gateway_pool(session_teardown, kuadrant, cluster, blame, label, testconfig, wildcard_domain) -> GatewayPool:
+    """Pool of Gateways for modules which need their own Gateway"""
+    size = testconfig["control_plane"]["gateway_pool_size"] if kuadrant else 0
+    pool = GatewayPool(cluster, blame, {"app": label}, wildcard_domain, size)
+    session_teardown.register(pool)
+    pool.commit()
+    return pool
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prefill_gateway_pool(request, testconfig):
+    """Starts provisioning pooled Gateways at the session start, only if the pool is enabled"""
+    if request.config.getoption("--standalone") or testconfig["control_plane"]["gateway_pool_size"] == 0:
+        return
+    request.getfixturevalue("gateway_pool")
+
+
 @pytest.fixture(scope="module")
 def domain_name(blame) -> str:
     """Domain name"""
@@ -160,7 +179,7 @@ def hostname(gateway, exposer, domain_name) -> Hostname:
 
 
 @pytest.fixture(scope="module")
-def route(request, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
+def route(module_teardown, kuadrant, gateway, blame, hostname, backend, module_label) -> GatewayRoute:
     """Route object"""
     if kuadrant:
         route = HTTPRoute.create_instance(gateway.cluster, blame("route"), gateway, {"app": module_label})
@@ -168,21 +187,24 @@ def route(request, kuadrant, gateway, blame, hostname, backend, module_label) ->
         route = EnvoyVirtualRoute.create_instance(gateway.cluster, blame("route"), gateway)
     route.add_hostname(hostname.hostname)
     route.add_backend(backend)
-    request.addfinalizer(route.delete)
+    module_teardown.register(route)
     route.commit()
     return route
 
 
 @pytest.fixture(scope="module")
-def client(route, hostname):  # pylint: disable=unused-argument
+def client(route, hostname, retry_policy):  # pylint: disable=unused-argument
     """Returns httpx client to be used for requests"""
-    client = hostname.client()
+    client = hostname.client(retry_policy=retry_policy)
     yield client
     client.close()
 
 
+leak_verifier = LeakVerifier(DenialTracking.TRACKING_HEADER)
+
+
 @pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):  # pylint: disable=unused-argument
+def pytest_runtest_makereport(item, call):
     """Verifies that denied requests did not leak to the upstream backend"""
     outcome = yield
     report = outcome.get_result()
@@ -190,12 +212,15 @@ def pytest_runtest_makereport(item, call):  # pylint: disable=unused-argument
     if call.when != "call":
         return
 
-    client = item.funcargs.get("client")
-    if not isinstance(client, KuadrantClient):
+    # Any client used by the test, sync or asyncio one
+    clients = [value for value in item.funcargs.values() if isinstance(value, DenialTracking)]
+    if not clients:
         return
 
-    denied_ids = set(client.denied_request_ids)
-    client.denied_request_ids.clear()
+    denied_ids = set()
+    for client in clients:
+        denied_ids.update(client.denied_request_ids)
+        client.denied_request_ids.clear()
 
     if item.config.getoption("--verify-denials").strip().lower() != "true":
         return
@@ -212,20 +237,11 @@ def pytest_runtest_makereport(item, call):  # pylint: disable=unused-argument
     ):
         return
 
-    backend_client = backend.admin_hostname.client()
-    ms = Mockserver(backend_client)
-    tracking_header = KuadrantClient.TRACKING_HEADER
-
-    leaked = []
     try:
-        for denied_id in denied_ids:
-            if ms.retrieve_requests_by_header(tracking_header, denied_id):
-                leaked.append(denied_id)
+        leaked = leak_verifier.verify(backend.admin_hostname, denied_ids)
     except (httpx.RequestError, httpx.HTTPStatusError):
         logging.warning("Failed to check for upstream leaks via MockServer", exc_info=True)
         return
-    finally:
-        backend_client.close()
 
     if leaked:
         report.outcome = "failed"
@@ -236,6 +252,11 @@ def pytest_runtest_makereport(item, call):  # pylint: disable=unused-argument
         )
 
 
+def pytest_sessionfinish(session):  # pylint: disable=unused-argument
+    """Closes the clients of the leak verifier"""
+    leak_verifier.close()
+
+
 @pytest.fixture(scope="module")
 def create_api_key(blame, request, cluster):
     """Creates API key Secret"""
@@ -37,11 +37,11 @@ def hostname(request, exposer, backend, blame, cluster) -> Hostname:
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, module_label):
+def gateway(module_teardown, cluster, blame, module_label):
     """Egress Gateway with HTTP listener"""
     gw = KuadrantGateway.create_instance(cluster, blame("egress-gw"), {"app": module_label})
     gw.add_listener(GatewayListener(hostname="*.egress.local", name="egress"))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
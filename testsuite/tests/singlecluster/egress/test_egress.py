@@ -6,15 +6,12 @@ and HTTPRoute with URLRewrite filter to route egress traffic to an externally de
 Validates that AuthPolicy and RateLimitPolicy are enforced on egress traffic.
 """
 
-from time import sleep
-
 import pytest
 
 from testsuite.gateway import CustomReference, URLRewriteFilter
 from testsuite.gateway.gateway_api.route import HTTPRoute
 from testsuite.httpx.auth import HttpxOidcClientAuth
-from testsuite.kuadrant.policy.rate_limit import Limit
-from testsuite.utils.constants import RLP_WINDOW_RESET_WAIT_BUFFERED
+from testsuite.kuadrant.policy.rate_limit import Limit, RateLimitWindow
 from .conftest import EGRESS_HOSTNAME
 
 pytestmark = [
@@ -62,17 +59,24 @@ def auth(oidc_provider):
     return HttpxOidcClientAuth(oidc_provider.get_token, "authorization")
 
 
-def test_egress_authorization(client, auth):
+@pytest.fixture(scope="module")
+def window():
+    """Tracks the rate limit window, which is shared by all the tests in the module"""
+    return RateLimitWindow(LIMIT)
+
+
+def test_egress_authorization(client, auth, window):
     """Test that AuthPolicy is enforced on egress gateway traffic"""
     assert client.get("/get").status_code == 401
 
     response = client.get("/get", auth=auth)
+    window.observe(response)
     assert response.status_code == 200
 
 
-def test_egress_ratelimit(client, auth):
+def test_egress_ratelimit(client, auth, window):
     """Test that RateLimitPolicy is enforced on egress gateway traffic"""
-    sleep(RLP_WINDOW_RESET_WAIT_BUFFERED)  # make sure request limit quota is reset before starting the test
+    window.wait()  # make sure request limit quota is reset before starting the test
 
     responses = client.get_many("/get", LIMIT.limit, auth=auth)
     responses.assert_all(status_code=200)
@@ -14,12 +14,12 @@ from testsuite.kuadrant.extensions.oidc_policy import OIDCPolicy
 
 
 @pytest.fixture(scope="module")
-def gateway(request, domain_name, base_domain, cluster, blame, label) -> Gateway:
+def gateway(module_teardown, domain_name, base_domain, cluster, blame, label) -> Gateway:
     """Create and configure the test Gateway."""
     fqdn = f"{domain_name}-kuadrant.{base_domain}"
     gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": label})
     gw.add_listener(GatewayListener(hostname=fqdn))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -12,7 +12,7 @@ from testsuite.kuadrant.policy.tls import TLSPolicy
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label):
     """Returns ready gateway"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(
@@ -21,7 +21,7 @@ def gateway(request, cluster, blame, wildcard_domain, module_label):
         {"app": module_label},
     )
     gw.add_listener(TLSGatewayListener(hostname=wildcard_domain, gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
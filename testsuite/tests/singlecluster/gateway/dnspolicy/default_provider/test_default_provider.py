@@ -13,7 +13,7 @@ pytestmark = [pytest.mark.dnspolicy, pytest.mark.disruptive]
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label):
     """Returns gateway without tls"""
     gw = KuadrantGateway.create_instance(
         cluster,
@@ -21,7 +21,7 @@ def gateway(request, cluster, blame, wildcard_domain, module_label):
         {"app": module_label},
     )
     gw.add_listener(GatewayListener(hostname=wildcard_domain))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -19,7 +19,7 @@ def hostname(gateway, exposer, subdomain) -> Hostname:
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, base_domain, module_label, subdomain):
+def gateway(module_teardown, cluster, blame, base_domain, module_label, subdomain):
     """Returns ready gateway"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(
@@ -28,7 +28,7 @@ def gateway(request, cluster, blame, base_domain, module_label, subdomain):
         {"app": module_label},
     )
     gw.add_listener(TLSGatewayListener(hostname=f"{subdomain}.{base_domain}", gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -29,21 +29,21 @@ def health_check(headers_secret, module_label):
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, base_domain, module_label, subdomain):
+def gateway(module_teardown, cluster, blame, base_domain, module_label, subdomain):
     """Create gateway without TLS enabled"""
     gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": module_label})
     gw.add_listener(GatewayListener(hostname=f"{subdomain}.{base_domain}"))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
 
 
 @pytest.fixture(scope="module")
-def backend(request, cluster, blame, label, backend_exposer):
+def backend(module_teardown, cluster, blame, label, backend_exposer):
     """Use mockserver as backend for health check requests to verify additional headers"""
     mockserver = MockserverBackend(cluster, blame("mocksrv"), label, service_type=backend_exposer.backend_service_type)
-    request.addfinalizer(mockserver.delete)
+    module_teardown.register(mockserver)
     mockserver.commit()
     mockserver.wait_for_ready()
     mockserver.expose(backend_exposer, blame("mocksrv-admin"))
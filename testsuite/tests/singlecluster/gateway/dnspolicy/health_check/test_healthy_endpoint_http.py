@@ -21,11 +21,11 @@ def health_check():
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, base_domain, module_label, subdomain):
+def gateway(module_teardown, cluster, blame, base_domain, module_label, subdomain):
     """Create gateway without TLS enabled"""
     gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": module_label})
     gw.add_listener(GatewayListener(hostname=f"{subdomain}.{base_domain}"))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -4,19 +4,17 @@ from time import sleep
 
 import pytest
 
-from testsuite.gateway.gateway_api.gateway import KuadrantGateway, GatewayListener
+from testsuite.gateway import GatewayListener
+from testsuite.gateway.gateway_api.pool import GatewayLease
 
 pytestmark = [pytest.mark.dnspolicy]
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
-    """Create gateway without TLS enabled"""
-    gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": module_label})
-    gw.add_listener(GatewayListener(hostname=wildcard_domain))
-    request.addfinalizer(gw.delete)
-    gw.commit()
-    gw.wait_for_ready()
+def gateway(module_teardown, gateway_pool, wildcard_domain):
+    """Lease gateway without TLS enabled"""
+    gw = gateway_pool.lease(GatewayListener(hostname=wildcard_domain))
+    module_teardown.register(GatewayLease(gateway_pool, gw))
     return gw
 
 
@@ -7,8 +7,8 @@ import time
 import pytest
 
 from testsuite.gateway import GatewayRoute, Hostname, Exposer, GatewayListener
-from testsuite.gateway.gateway_api.gateway import KuadrantGateway
 from testsuite.gateway.gateway_api.hostname import DNSPolicyExposer
+from testsuite.gateway.gateway_api.pool import GatewayLease
 from testsuite.gateway.gateway_api.route import HTTPRoute
 from testsuite.kuadrant.policy.dns import DNSPolicy, has_record_condition
 from testsuite.utils import is_nxdomain
@@ -37,24 +37,18 @@ def wildcard_domain2(base_domain2):
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
-    """Create and configure Gateway 1"""
-    gw = KuadrantGateway.create_instance(cluster, blame("gw"), {"app": module_label})
-    gw.add_listener(GatewayListener(hostname=wildcard_domain))
-    request.addfinalizer(gw.delete)
-    gw.commit()
-    gw.wait_for_ready()
+def gateway(module_teardown, gateway_pool, wildcard_domain):
+    """Lease and configure Gateway 1"""
+    gw = gateway_pool.lease(GatewayListener(hostname=wildcard_domain))
+    module_teardown.register(GatewayLease(gateway_pool, gw))
     return gw
 
 
 @pytest.fixture(scope="module")
-def gateway2(request, cluster, blame, wildcard_domain2, module_label):
-    """Create and configure Gateway 2"""
-    gw = KuadrantGateway.create_instance(cluster, blame("gw2"), {"app": module_label})
-    gw.add_listener(GatewayListener(hostname=wildcard_domain2))
-    request.addfinalizer(gw.delete)
-    gw.commit()
-    gw.wait_for_ready()
+def gateway2(module_teardown, gateway_pool, wildcard_domain2):
+    """Lease and configure Gateway 2"""
+    gw = gateway_pool.lease(GatewayListener(hostname=wildcard_domain2))
+    module_teardown.register(GatewayLease(gateway_pool, gw))
     return gw
 
 
@@ -16,7 +16,7 @@ pytestmark = [pytest.mark.dnspolicy, pytest.mark.tlspolicy]
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, wildcard_domain, module_label):
     """Create Gateway 1 with TLSGatewayListener"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(
@@ -25,14 +25,14 @@ def gateway(request, cluster, blame, wildcard_domain, module_label):
         {"app": module_label},
     )
     gw.add_listener(TLSGatewayListener(hostname=wildcard_domain, gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
 
 
 @pytest.fixture(scope="module")
-def gateway2(request, cluster, blame, wildcard_domain2, module_label):
+def gateway2(module_teardown, cluster, blame, wildcard_domain2, module_label):
     """Create Gateway 2 with TLSGatewayListener"""
     gateway_name = blame("gw2")
     gw = KuadrantGateway.create_instance(
@@ -41,7 +41,7 @@ def gateway2(request, cluster, blame, wildcard_domain2, module_label):
         {"app": module_label},
     )
     gw.add_listener(TLSGatewayListener(hostname=wildcard_domain2, gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -8,12 +8,12 @@ from testsuite.gateway.gateway_api.grpc_route import GRPCRoute
 
 
 @pytest.fixture(scope="module")
-def backend(request, cluster, blame, module_label, testconfig, cluster_issuer):
+def backend(module_teardown, cluster, blame, module_label, testconfig, cluster_issuer):
     """Deploys Grpcbin backend"""
     backend = Grpcbin(
         cluster, blame("grpcbin"), module_label, testconfig["grpcbin"]["image"], cluster_issuer=cluster_issuer
     )
-    request.addfinalizer(backend.delete)
+    module_teardown.register(backend)
     backend.commit()
     return backend
 
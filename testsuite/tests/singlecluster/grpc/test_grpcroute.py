@@ -1,13 +1,10 @@
 """Tests that AuthPolicy and RateLimitPolicy are enforced on a GRPCRoute"""
 
-import time
-
 import pytest
 from grpc import StatusCode
 
 from testsuite.httpx.auth import HttpxOidcClientAuth
-from testsuite.kuadrant.policy.rate_limit import Limit
-from testsuite.utils.constants import RLP_WINDOW_RESET_WAIT_BUFFERED
+from testsuite.kuadrant.policy.rate_limit import Limit, RateLimitWindow
 
 pytestmark = [pytest.mark.authorino, pytest.mark.limitador, pytest.mark.kuadrant_only]
 
@@ -46,9 +43,11 @@ def test_grpcroute(client, auth):
     response = client.call("/HeadersUnary")
     assert response.status_code == StatusCode.UNAUTHENTICATED
 
+    window = RateLimitWindow(LIMIT)
     responses = client.call_many("/HeadersUnary", LIMIT.limit - 1, auth=auth)
+    window.observe_all(responses)
     responses.assert_all(status_code=StatusCode.OK)
     assert client.call("/HeadersUnary", auth=auth).status_code == StatusCode.UNAVAILABLE
 
-    time.sleep(RLP_WINDOW_RESET_WAIT_BUFFERED)
+    window.wait()
     assert client.call("/HeadersUnary", auth=auth).status_code == StatusCode.OK
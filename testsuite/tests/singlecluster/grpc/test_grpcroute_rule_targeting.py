@@ -41,7 +41,7 @@ def rate_limit(cluster, blame, module_label, route):
 
 def test_limit_match_grpcroute_rule(client):
     """Tests that RLP correctly applies to the specific GRPCRoute Rule"""
-    responses = client.call_many("/HeadersUnary", LIMIT.limit)
+    responses = client.call_many("/HeadersUnary", LIMIT.limit, concurrency=LIMIT.limit)
     responses.assert_all(status_code=StatusCode.OK)
     assert client.call("/HeadersUnary").status_code == StatusCode.UNAVAILABLE
 
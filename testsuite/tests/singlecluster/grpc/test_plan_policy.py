@@ -97,7 +97,7 @@ def test_plan_policy(client, user_with_plan, allowed_requests):
     """
     user_auth = user_with_plan
 
-    responses = client.call_many("/HeadersUnary", count=allowed_requests, auth=user_auth)
+    responses = client.call_many("/HeadersUnary", count=allowed_requests, auth=user_auth, concurrency=allowed_requests)
     responses.assert_all(status_code=StatusCode.OK)
     assert client.call("/HeadersUnary", auth=user_auth).status_code == StatusCode.UNAVAILABLE
 
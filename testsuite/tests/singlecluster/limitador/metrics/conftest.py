@@ -4,19 +4,24 @@ import pytest
 
 from testsuite.kubernetes.monitoring import MetricsEndpoint
 from testsuite.kubernetes.monitoring.pod_monitor import PodMonitor
+from testsuite.kubernetes.monitoring.scraper import MetricsScraper
 
 
 @pytest.fixture(scope="module")
-def pod_monitor(system_project, request, blame, limitador):
-    """Creates Pod Monitor object to watch over '/metrics' endpoint of limitador pod"""
+def pod_monitor(system_project, request, blame, limitador, prometheus):
+    """
+    Creates Pod Monitor object to watch over '/metrics' endpoint of limitador pod.
+    Waits for all its endpoints to become active targets.
+    """
     endpoints = [MetricsEndpoint("/metrics", "http")]
     monitor = PodMonitor.create_instance(system_project, blame("pd"), endpoints, match_labels={"app": limitador.name()})
     request.addfinalizer(monitor.delete)
     monitor.commit()
+    assert prometheus.is_reconciled(monitor)
     return monitor
 
 
-@pytest.fixture(scope="module", autouse=True)
-def wait_for_active_targets(prometheus, pod_monitor):
-    """Waits for all endpoints in Pod Monitor to become active targets"""
-    assert prometheus.is_reconciled(pod_monitor)
+@pytest.fixture(scope="module")
+def limitador_scraper(system_project, limitador):
+    """Reads '/metrics' endpoint of limitador pod directly, without Prometheus"""
+    return MetricsScraper(system_project, {"app": limitador.name()}, "http")
@@ -14,28 +14,27 @@ def rate_limit(rate_limit):
     return rate_limit
 
 
-@pytest.fixture(scope="module", autouse=True)
-def scrape_metrics_created_by_requests(prometheus, pod_monitor, client):
+@pytest.fixture(scope="module")
+def calls_increase(limitador_scraper, client):
     """
     Creates 5 requests, from which 3 are authorized and 2 are rate limited.
-    Waits until Prometheus scrapes '/metrics' endpoint.
+    Returns increase of the metrics read directly from '/metrics' endpoint of limitador pod.
     """
+    before = limitador_scraper.scrape()
     client.get_many("/get", 5)
-    prometheus.wait_for_scrape(pod_monitor, "/metrics")
+    return limitador_scraper.diff(before)
 
 
 @pytest.mark.parametrize("metric, expected_value", [("authorized_calls", 3), ("limited_calls", 2)])
-def test_calls_metric(prometheus, limitador, route, metric, expected_value, pod_monitor):
+def test_calls_metric(calls_increase, limitador, route, metric, expected_value):
     """Tests that `authorized_calls` and `limited_calls` are emitted and correctly incremented"""
-    metrics = prometheus.get_metrics(
-        labels={
-            "pod": limitador.pod.name(),
-            "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
-        }
+    pod = limitador.pod.name()
+    namespace = f"{route.namespace()}/{route.name()}"
+    authorized = calls_increase.filter(
+        lambda x: x["metric"]["__name__"] == metric
+        and x["metric"]["pod"] == pod
+        and x["metric"].get("limitador_namespace") == namespace
     )
-
-    authorized = metrics.filter(lambda x: x["metric"]["__name__"] == metric)
     assert len(authorized.metrics) == 1
     assert authorized.values[0] == expected_value
 
@@ -18,11 +18,11 @@ MODEL_NAME = "meta-llama/Llama-3.1-8B-Instruct"
 
 
 @pytest.fixture(scope="module")
-def backend(request, cluster, blame, label, testconfig):
+def backend(module_teardown, cluster, blame, label, testconfig):
     """Deploys LlmSim backend"""
     image = testconfig["llm_sim"]["image"]
     llmsim = LlmSim(cluster, blame("llm-sim"), "meta-llama/Llama-3.1-8B-Instruct", label, image)
-    request.addfinalizer(llmsim.delete)
+    module_teardown.register(llmsim)
     llmsim.commit()
     return llmsim
 
@@ -151,3 +151,15 @@ def commit(request, authorization, token_rate_limit, telemetry_policy):
         request.addfinalizer(component.delete)
         component.commit()
         component.wait_for_ready()
+
+
+@pytest.fixture(scope="module")
+def metrics_before(limitador_scraper):
+    """Metrics of the limitador pod before any request of the module was sent"""
+    return limitador_scraper.scrape()
+
+
+@pytest.fixture(scope="module")
+def limitador_metrics(limitador_scraper, metrics_before, token_usage):  # pylint: disable=unused-argument
+    """Increase of the limitador metrics caused by the requests sent by the token_usage fixture"""
+    return limitador_scraper.diff(metrics_before)
@@ -22,7 +22,7 @@ basic_request = {
 
 
 @pytest.fixture(scope="module")
-def token_usage(prometheus, pod_monitor, client, user_data):
+def token_usage(metrics_before, client, user_data):  # pylint: disable=unused-argument
     """Send requests to generate metrics, trigger rate limiting and return token usage"""
     usage_data = {}
 
@@ -37,24 +37,20 @@ def token_usage(prometheus, pod_monitor, client, user_data):
 
         usage_data[f"{user_type}_total_tokens"] = tokens
 
-    # Wait for metrics to propagate
-    prometheus.wait_for_scrape(pod_monitor, "/metrics")
-
     return usage_data
 
 
 @pytest.mark.parametrize("user_type", USERS)
 def test_authorized_hits_metric_exists_and_increments(
-    prometheus, limitador, route, pod_monitor, user_data, token_usage, user_type
+    limitador_metrics, limitador, route, user_data, token_usage, user_type
 ):
     """Verify `authorized_hits` metric is emitted, reported and accumulates tokens consumed for users/groups/models"""
     user_info = user_data[user_type]
 
-    metrics = prometheus.get_metrics(
-        labels={
+    metrics = limitador_metrics.with_labels(
+        {
             "pod": limitador.pod.name(),
             "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
             "user": user_info["user_id"],
             "group": user_info["group"],
             "model": MODEL_NAME,
@@ -71,7 +67,7 @@ def test_authorized_hits_metric_exists_and_increments(
     assert actual_hits > 0, f"authorized_hits must be > 0, got {actual_hits}"
 
     # Verify the token metric value remains within the range of total tokens consumed
-    # Token values will vary slightly due to timing of Prometheus scrapes, hence why exact matching is not asserted
+    # Hits are reported by the gateway asynchronously, hence why exact matching is not asserted
     assert (
         actual_hits <= expected_tokens
     ), f"authorized_hits ({actual_hits}) should not exceed tokens consumed ({expected_tokens}) for {user_type} user"
@@ -79,16 +75,15 @@ def test_authorized_hits_metric_exists_and_increments(
 
 @pytest.mark.parametrize("user_type", USERS)
 def test_metrics_reported_per_user_and_group(
-    prometheus, limitador, route, pod_monitor, user_data, token_usage, user_type
+    limitador_metrics, limitador, route, user_data, token_usage, user_type
 ):  # pylint: disable=unused-argument
     """Ensure 'authorized_calls', and 'limited_calls' are reported for user/group"""
     user_info = user_data[user_type]
 
-    metrics = prometheus.get_metrics(
-        labels={
+    metrics = limitador_metrics.with_labels(
+        {
             "pod": limitador.pod.name(),
             "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
         }
     )
 
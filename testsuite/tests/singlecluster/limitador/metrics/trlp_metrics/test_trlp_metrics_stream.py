@@ -41,7 +41,7 @@ def extract_usage_tokens(response):
 
 
 @pytest.fixture(scope="module")
-def token_usage(prometheus, pod_monitor, client, user_data):
+def token_usage(metrics_before, client, user_data):  # pylint: disable=unused-argument
     """Send streaming requests to generate metrics, trigger rate limiting and return token usage"""
     usage_data = {}
 
@@ -56,24 +56,20 @@ def token_usage(prometheus, pod_monitor, client, user_data):
 
         usage_data[f"{user_type}_total_tokens"] = tokens
 
-    # Wait for metrics to propagate
-    prometheus.wait_for_scrape(pod_monitor, "/metrics")
-
     return usage_data
 
 
 @pytest.mark.parametrize("user_type", USERS)
 def test_authorized_hits_metric_exists_and_increments_streaming(
-    prometheus, limitador, route, pod_monitor, user_data, token_usage, user_type
+    limitador_metrics, limitador, route, user_data, token_usage, user_type
 ):
     """Verify `authorized_hits` is emitted and accumulates tokens consumed for users/groups/models with streaming"""
     user_info = user_data[user_type]
 
-    metrics = prometheus.get_metrics(
-        labels={
+    metrics = limitador_metrics.with_labels(
+        {
             "pod": limitador.pod.name(),
             "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
             "user": user_info["user_id"],
             "group": user_info["group"],
             "model": MODEL_NAME,
@@ -94,16 +90,15 @@ def test_authorized_hits_metric_exists_and_increments_streaming(
 
 @pytest.mark.parametrize("user_type", USERS)
 def test_metrics_reported_per_user_and_group_streaming(
-    prometheus, limitador, route, pod_monitor, user_data, token_usage, user_type
+    limitador_metrics, limitador, route, user_data, token_usage, user_type
 ):  # pylint: disable=unused-argument
     """Ensure 'authorized_calls', and 'limited_calls' are reported for user/group with streaming"""
     user_info = user_data[user_type]
 
-    metrics = prometheus.get_metrics(
-        labels={
+    metrics = limitador_metrics.with_labels(
+        {
             "pod": limitador.pod.name(),
             "limitador_namespace": f"{route.namespace()}/{route.name()}",
-            "job": f"{pod_monitor.namespace()}/{pod_monitor.name()}",
         }
     )
 
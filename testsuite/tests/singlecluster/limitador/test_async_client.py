@@ -0,0 +1,42 @@
+"""
+Tests that a limit is enforced on requests sent concurrently by the asyncio client
+"""
+
+import asyncio
+
+import pytest
+
+from testsuite.httpx import AsyncKuadrantClient
+from testsuite.kuadrant.policy.rate_limit import Limit
+
+pytestmark = [pytest.mark.limitador]
+
+LIMIT = Limit(5, "10s")
+
+
+@pytest.fixture(scope="module")
+def rate_limit(rate_limit):
+    """Add limit to the policy"""
+    rate_limit.add_limit("basic", [LIMIT])
+    return rate_limit
+
+
+@pytest.fixture
+def async_client(client):
+    """Asyncio client sending requests to the same hostname as the client, connections are bound to the test"""
+    async_client = AsyncKuadrantClient(base_url=str(client.base_url), headers=client.headers, verify=client.verify)
+    yield async_client
+    asyncio.run(async_client.aclose())
+
+
+@pytest.mark.flaky(reruns=3, reruns_delay=10)
+def test_concurrent_limit(async_client):
+    """Tests that exactly the limit of concurrent requests succeeds and the rest is denied"""
+
+    async def _send():
+        return await async_client.get_many("/get", LIMIT.limit + 3)
+
+    responses = asyncio.run(_send())
+    assert responses.count_status(200) == LIMIT.limit
+    assert responses.count_status(429) == 3
+    assert len(async_client.denied_request_ids) == 3
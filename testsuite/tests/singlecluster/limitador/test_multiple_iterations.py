@@ -2,20 +2,20 @@
 Tests that a single limit is enforced as expected over multiple iterations
 """
 
-from time import sleep
-
 import pytest
 
-from testsuite.kuadrant.policy.rate_limit import Limit
-from testsuite.utils.constants import RLP_ITERATION_WINDOW_RESET_WAIT
+from testsuite.kuadrant.policy.rate_limit import Limit, RateLimitWindow
 
 pytestmark = [pytest.mark.limitador]
 
 
+LIMIT = Limit(5, "10s")
+
+
 @pytest.fixture(scope="module")
 def rate_limit(rate_limit):
     """Add limit to the policy"""
-    rate_limit.add_limit("multiple", [Limit(5, "10s")])
+    rate_limit.add_limit("multiple", [LIMIT])
     return rate_limit
 
 
@@ -23,8 +23,12 @@ def rate_limit(rate_limit):
 @pytest.mark.flaky(reruns=3, reruns_delay=15)
 def test_multiple_iterations(client):
     """Tests that simple limit is applied successfully and works for multiple iterations"""
+    window = RateLimitWindow(LIMIT)
     for _ in range(10):
         responses = client.get_many("/get", 5)
+        window.observe_all(responses)
         responses.assert_all(status_code=200)
-        assert client.get("/get").status_code == 429
-        sleep(RLP_ITERATION_WINDOW_RESET_WAIT)
+        response = client.get("/get")
+        window.observe(response)
+        assert response.status_code == 429
+        window.wait()
@@ -5,11 +5,9 @@ TRLP User Guide:
 https://docs.kuadrant.io/dev/kuadrant-operator/doc/user-guides/tokenratelimitpolicy/authenticated-token-ratelimiting-tutorial/
 """
 
-from time import sleep
-
 import pytest
 
-from testsuite.utils.constants import TRLP_FREE_USER_RESET_WAIT, TRLP_PAID_USER_RESET_WAIT
+from testsuite.kuadrant.policy.rate_limit import RateLimitWindow
 from .conftest import FREE_USER_LIMIT, PAID_USER_LIMIT
 
 pytestmark = [pytest.mark.limitador, pytest.mark.authorino, pytest.mark.kuadrant_only]
@@ -38,10 +36,12 @@ def test_missing_api_key(client):
 @pytest.mark.flaky(reruns=3, reruns_delay=35)
 def test_trlp_limit_and_reset_free_user(client, free_user_auth):
     """Ensures free users are rate limited and limits reset correctly"""
+    window = RateLimitWindow(FREE_USER_LIMIT)
     total_tokens = 0
 
     # Check first request succeeds
     first_response = client.post("/v1/chat/completions", auth=free_user_auth, json={**basic_request})
+    window.observe(first_response)
     assert first_response.status_code == 200, f"Expected status code 200, but got {first_response.status_code}"
     first_json = first_response.json()
     usage = first_json.get("usage")
@@ -53,6 +53,7 @@ def test_trlp_limit_and_reset_free_user(client, free_user_auth):
     # Keep sending requests while within token quota
     while total_tokens < FREE_USER_LIMIT.limit:
         response = client.post("/v1/chat/completions", auth=free_user_auth, json={**basic_request})
+        window.observe(response)
         assert response.status_code == 200
         json_data = response.json()
         usage = json_data.get("usage")
@@ -63,22 +64,26 @@ def test_trlp_limit_and_reset_free_user(client, free_user_auth):
 
     # Next request should be 429
     response = client.post("/v1/chat/completions", auth=free_user_auth, json={**basic_request})
+    window.observe(response)
     assert (
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{FREE_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
     # Assert quota resets after wait period
-    sleep(TRLP_FREE_USER_RESET_WAIT)
+    window.wait()
     response = client.post("/v1/chat/completions", auth=free_user_auth, json={**basic_request})
+    window.observe(response)
     assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
 
 
 @pytest.mark.flaky(reruns=3, reruns_delay=65)
 def test_trlp_limit_and_reset_paid_user(client, paid_user_auth):
     """Ensures paid users are rate limited and limits reset correctly"""
+    window = RateLimitWindow(PAID_USER_LIMIT)
     total_tokens = 0
 
     first_response = client.post("/v1/chat/completions", auth=paid_user_auth, json={**basic_request})
+    window.observe(first_response)
     assert first_response.status_code == 200, f"Expected status code 200, but got {first_response.status_code}"
     first_json = first_response.json()
     usage = first_json.get("usage")
@@ -89,6 +94,7 @@ def test_trlp_limit_and_reset_paid_user(client, paid_user_auth):
 
     while total_tokens < PAID_USER_LIMIT.limit:
         response = client.post("/v1/chat/completions", auth=paid_user_auth, json={**basic_request})
+        window.observe(response)
         assert response.status_code == 200
         json_data = response.json()
         usage = json_data.get("usage")
@@ -98,10 +104,12 @@ def test_trlp_limit_and_reset_paid_user(client, paid_user_auth):
         total_tokens += tokens_used
 
     response = client.post("/v1/chat/completions", auth=paid_user_auth, json={**basic_request})
+    window.observe(response)
     assert (
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{PAID_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
-    sleep(TRLP_PAID_USER_RESET_WAIT)
+    window.wait()
     response = client.post("/v1/chat/completions", auth=paid_user_auth, json={**basic_request})
+    window.observe(response)
     assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
@@ -3,11 +3,10 @@ Test TokenRateLimitPolicy functionality with streaming enabled
 """
 
 import json
-from time import sleep
 
 import pytest
 
-from testsuite.utils.constants import TRLP_FREE_USER_RESET_WAIT
+from testsuite.kuadrant.policy.rate_limit import RateLimitWindow
 from .conftest import FREE_USER_LIMIT
 
 pytestmark = [pytest.mark.limitador, pytest.mark.authorino, pytest.mark.kuadrant_only]
@@ -38,10 +37,12 @@ def parse_streaming_usage(response):
 @pytest.mark.flaky(reruns=3, reruns_delay=35)
 def test_trlp_streaming_limit_and_reset(client, free_user_auth):
     """Ensures users are rate limited and limits reset correctly with streaming enabled"""
+    window = RateLimitWindow(FREE_USER_LIMIT)
     total_tokens = 0
 
     # Check first request succeeds
     first_response = client.post("/v1/chat/completions", auth=free_user_auth, json={**streaming_request})
+    window.observe(first_response)
     assert first_response.status_code == 200, f"Expected 200, got {first_response.status_code}"
     usage = parse_streaming_usage(first_response)
     tokens_used = usage["total_tokens"]
@@ -51,6 +52,7 @@ def test_trlp_streaming_limit_and_reset(client, free_user_auth):
     # Keep sending requests while within token quota
     while total_tokens < FREE_USER_LIMIT.limit:
         response = client.post("/v1/chat/completions", auth=free_user_auth, json={**streaming_request})
+        window.observe(response)
         assert response.status_code == 200
         usage = parse_streaming_usage(response)
         tokens_used = usage["total_tokens"]
@@ -59,11 +61,13 @@ def test_trlp_streaming_limit_and_reset(client, free_user_auth):
 
     # Next request should be 429
     response = client.post("/v1/chat/completions", auth=free_user_auth, json={**streaming_request})
+    window.observe(response)
     assert (
         response.status_code == 429
     ), f"Expected 429 after {total_tokens}/{FREE_USER_LIMIT.limit} tokens, but got {response.status_code}"
 
     # Assert quota resets after wait period
-    sleep(TRLP_FREE_USER_RESET_WAIT)
+    window.wait()
     response = client.post("/v1/chat/completions", auth=free_user_auth, json={**streaming_request})
+    window.observe(response)
     assert response.status_code == 200, f"Expected 200 after reset, but got {response.status_code}"
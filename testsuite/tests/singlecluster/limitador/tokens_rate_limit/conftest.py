@@ -6,11 +6,11 @@ from testsuite.backend.llm_sim import LlmSim
 
 
 @pytest.fixture(scope="module")
-def backend(request, cluster, blame, label, testconfig):
+def backend(module_teardown, cluster, blame, label, testconfig):
     """Deploys LlmSim backend"""
     image = testconfig["llm_sim"]["image"]
     llmsim = LlmSim(cluster, blame("llm-sim"), "meta-llama/Llama-3.1-8B-Instruct", label, image)
-    request.addfinalizer(llmsim.delete)
+    module_teardown.register(llmsim)
     llmsim.commit()
     return llmsim
 
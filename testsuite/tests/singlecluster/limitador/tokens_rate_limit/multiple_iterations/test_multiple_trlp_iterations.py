@@ -2,10 +2,9 @@
 Tests that a TokenRateLimitPolicy limit is enforced and resets as expected over multiple iterations
 """
 
-from time import sleep
 import pytest
 
-from testsuite.utils.constants import TRLP_ITERATION_RESET_WAIT
+from testsuite.kuadrant.policy.rate_limit import RateLimitWindow
 from .conftest import LIMIT
 
 pytestmark = [pytest.mark.limitador]
@@ -22,11 +21,13 @@ basic_request = {
 @pytest.mark.flaky(reruns=3, reruns_delay=25)
 def test_multiple_trlp_limit_iterations(client):
     """Ensures TRLP limit resets correctly over multiple iterations"""
+    window = RateLimitWindow(LIMIT)
     for i in range(10):
         total_tokens = 0
 
         while total_tokens < LIMIT.limit:
             response = client.post("/v1/chat/completions", json={**basic_request})
+            window.observe(response)
             if response.status_code == 429:
                 break
             assert (
@@ -38,12 +39,14 @@ def test_multiple_trlp_limit_iterations(client):
             total_tokens += tokens_used
 
         response = client.post("/v1/chat/completions", json={**basic_request})
+        window.observe(response)
         assert (
             response.status_code == 429
         ), f"Iteration {i+1}/10: Expected 429 after {total_tokens}/{LIMIT.limit} tokens, but got {response.status_code}"
 
-        sleep(TRLP_ITERATION_RESET_WAIT)
+        window.wait()
         response = client.post("/v1/chat/completions", json={**basic_request})
+        window.observe(response)
         assert (
             response.status_code == 200
         ), f"Iteration {i+1}/10: Expected 200 after reset, but got {response.status_code}"
@@ -4,11 +4,10 @@ multiple iterations with streaming enabled
 """
 
 import json
-from time import sleep
 
 import pytest
 
-from testsuite.utils.constants import TRLP_ITERATION_RESET_WAIT
+from testsuite.kuadrant.policy.rate_limit import RateLimitWindow
 from .conftest import LIMIT
 
 pytestmark = [pytest.mark.limitador]
@@ -49,11 +48,13 @@ def parse_streaming_usage(response):
 @pytest.mark.flaky(reruns=3, reruns_delay=25)
 def test_multiple_trlp_streaming_iterations(client):
     """Ensures TRLP limit resets correctly over multiple iterations with streaming enabled"""
+    window = RateLimitWindow(LIMIT)
     for i in range(5):
         total_tokens = 0
 
         while total_tokens < LIMIT.limit:
             response = client.post("/v1/chat/completions", json={**streaming_request})
+            window.observe(response)
             if response.status_code == 429:
                 break
             assert (
@@ -66,12 +67,14 @@ def test_multiple_trlp_streaming_iterations(client):
             total_tokens += tokens_used
 
         response = client.post("/v1/chat/completions", json={**streaming_request})
+        window.observe(response)
         assert (
             response.status_code == 429
         ), f"Iteration {i+1}/5: Expected 429 after {total_tokens}/{LIMIT.limit} tokens, but got {response.status_code}"
 
-        sleep(TRLP_ITERATION_RESET_WAIT)
+        window.wait()
         response = client.post("/v1/chat/completions", json={**streaming_request})
+        window.observe(response)
         assert (
             response.status_code == 200
         ), f"Iteration {i+1}/5: Expected 200 after reset, but got {response.status_code}"
@@ -1,5 +1,7 @@
 """Tests for Kuadrant policy metrics lifecycle (increment/decrement on policy create/delete)."""
 
+from datetime import datetime, timezone
+
 import pytest
 
 from testsuite.kuadrant.policy.rate_limit import RateLimitPolicy, Limit
@@ -40,6 +42,7 @@ def test_metric_policy_lifecycle(request, prometheus, cluster, blame, route, mod
     policy = RateLimitPolicy.create_instance(cluster, blame("rlp-lc"), route, labels={"testRun": module_label})
     request.addfinalizer(policy.delete)
     policy.add_limit("basic", [Limit(5, "10s")])
+    created = datetime.now(timezone.utc)
     policy.commit()
     policy.wait_for_ready()
 
@@ -48,11 +51,13 @@ def test_metric_policy_lifecycle(request, prometheus, cluster, blame, route, mod
             metric,
             1,
             labels=_metric_labels(metric, "RateLimitPolicy", namespace),
+            after=created,
         ), (
             f"Expected '{metric}' to be 1 on policy creation,"
             f" got {_get_metric_value(prometheus, metric, 'RateLimitPolicy', namespace)}"
         )
 
+    deleted = datetime.now(timezone.utc)
     policy.delete()
 
     for metric in POLICY_METRICS:
@@ -60,6 +65,7 @@ def test_metric_policy_lifecycle(request, prometheus, cluster, blame, route, mod
             metric,
             0,
             labels=_metric_labels(metric, "RateLimitPolicy", namespace),
+            after=deleted,
         ), (
             f"Expected '{metric}' to be 0 on policy deletion,"
             f" got {_get_metric_value(prometheus, metric, 'RateLimitPolicy', namespace)}"
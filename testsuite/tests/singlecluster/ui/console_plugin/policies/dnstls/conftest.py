@@ -10,12 +10,12 @@ from testsuite.kuadrant.policy.tls import TLSPolicy
 
 
 @pytest.fixture(scope="module")
-def gateway(request, cluster, blame, dns_wildcard_domain, module_label):
+def gateway(module_teardown, cluster, blame, dns_wildcard_domain, module_label):
     """Override gateway to use TLS listener (required for DNS/TLS policies)"""
     gateway_name = blame("gw")
     gw = KuadrantGateway.create_instance(cluster, gateway_name, {"app": module_label})
     gw.add_listener(TLSGatewayListener(hostname=dns_wildcard_domain, gateway_name=gateway_name))
-    request.addfinalizer(gw.delete)
+    module_teardown.register(gw)
     gw.commit()
     gw.wait_for_ready()
     return gw
@@ -45,7 +45,7 @@ def randomize(name, tail=5):
     return f"{name}-{generate_tail(tail)}"
 
 
-def _whoami():
+def whoami():
     """Returns username"""
     try:
         return getpass.getuser()
@@ -11,6 +11,27 @@ K8S_WAIT_UNTIL_TIMEOUT = 60
 # Timeout for KubernetesObject.delete() operations.
 K8S_DELETE_TIMEOUT = 30
 
+# Polling interval while confirming bulk deletion of objects.
+K8S_DELETE_POLL_INTERVAL = 1
+
+# Timeout for a single request sent by the native Kubernetes API transport.
+K8S_API_REQUEST_TIMEOUT = 30
+
+# Polling interval of the native Kubernetes API transport while waiting for an object deletion.
+K8S_API_POLL_INTERVAL = 0.5
+
+# Duration of a single informer cache watch request, after which the watch is re-established.
+K8S_INFORMER_RESYNC_PERIOD = 300  # 5 minutes
+
+# Wait before an informer cache relists the objects after its watch failed.
+K8S_INFORMER_RETRY_INTERVAL = 5
+
+# How long are the project, API URL and token of a KubernetesClient memoized.
+K8S_IDENTITY_CACHE_TTL = 300  # 5 minutes
+
+# Minimal age of leftover objects deleted by the garbage collector, younger ones may belong to a concurrent run.
+GARBAGE_COLLECTOR_MIN_AGE = 14400  # 4 hours
+
 # Timeout for Deployment readiness and rollout.
 DEPLOYMENT_READY_TIMEOUT = 90
 
@@ -54,25 +75,11 @@ RLP_POST_ENFORCEMENT_WAIT = 5
 # Wait for RLP window reset.
 RLP_WINDOW_RESET_WAIT = 5
 
-# Wait for RLP window reset with safety buffer.
-RLP_WINDOW_RESET_WAIT_BUFFERED = 6
-
 # Wait for RLP counter reset.
 RLP_COUNTER_RESET_WAIT = 15
 
-# Wait for RLP iteration window to reset.
-RLP_ITERATION_WINDOW_RESET_WAIT = 10
-
-# --- Token Rate Limiting (seconds) ---
-
-# Wait for TRLP free user quota reset.
-TRLP_FREE_USER_RESET_WAIT = 30
-
-# Wait for TRLP paid user quota reset.
-TRLP_PAID_USER_RESET_WAIT = 60
-
-# Wait for TRLP iteration reset.
-TRLP_ITERATION_RESET_WAIT = 20
+# Additional wait after the tracked RLP window boundary, covers clock skew and latency to Limitador.
+RLP_WINDOW_JITTER_GUARD = 0.5
 
 # --- Prometheus & Observability ---
 
@@ -86,6 +93,13 @@ PROMETHEUS_SCRAPE_RETRIES = 4
 # Prometheus wait_for_metric polling (~50s total).
 PROMETHEUS_METRIC_RETRIES = 5
 
+# Prometheus wait_for_sample polling, checks all samples since the given time so it can poll often.
+PROMETHEUS_SAMPLE_POLL_INTERVAL = 1
+PROMETHEUS_SAMPLE_TIMEOUT = 60
+
+# Resolution of the Prometheus range queries (seconds).
+PROMETHEUS_RANGE_STEP = 1
+
 # Fast Prometheus polling (~60s total).
 PROMETHEUS_FAST_INTERVAL = 5
 PROMETHEUS_VERIFY_NO_TARGETS_RETRIES = 12
@@ -96,6 +110,17 @@ TRACING_MAX_RETRIES = 7
 # HTTPX request retry (fibonacci backoff, 8 attempts).
 HTTP_BACKOFF_MAX_RETRIES = 8
 
+# HTTPX retry budget, retries are allowed while they are under min retries + ratio * sent requests.
+HTTP_RETRY_BUDGET_RATIO = 0.2
+HTTP_RETRY_BUDGET_MIN_RETRIES = 50
+
+# HTTPX circuit breaker, opens after consecutive failed requests to a host and fails fast until the reset timeout.
+HTTP_CIRCUIT_BREAKER_THRESHOLD = 5
+HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+# Maximal number of requests in flight at once during open-loop load generation.
+LOAD_MAX_IN_FLIGHT = 256
+
 # Observability ServiceMonitor/PodMonitor readiness polling (~60s total).
 OBSERVABILITY_MONITOR_POLL_INTERVAL = 5
 OBSERVABILITY_MONITOR_MAX_RETRIES = 12
@@ -149,6 +174,10 @@ AUTHORINO_OIDC_PORT = 8083
 # Default timeout for individual gRPC unary calls (seconds).
 GRPC_CALL_TIMEOUT = 10
 
+# Keepalive pings of the pooled gRPC channels, so idle channels shared across test modules are not dropped.
+GRPC_KEEPALIVE_TIME_MS = 30000
+GRPC_KEEPALIVE_TIMEOUT_MS = 10000
+
 # --- Envoy Workarounds (seconds) ---
 
 # Wait after Envoy rollout (wait_for_ready alone is insufficient).
@@ -181,3 +210,11 @@ WASM_PLUGIN_SYNC_WAIT = 15
 
 # Max retry attempts for JWT test startup.
 JWT_STARTUP_MAX_RETRIES = 20
+
+# --- Benchmarks ---
+
+# Number of measured iterations of every benchmarked operation.
+BENCHMARK_ITERATIONS = 20
+
+# Number of requests sent at once by the HTTP burst benchmark.
+BENCHMARK_BURST_SIZE = 200